@@ -6,27 +6,61 @@ Roadmap Synthesis Tool - Streamlit Web Interface
 import streamlit as st
 from pathlib import Path
 import os
+import re
+import html
+import io
+import json
+import copy
+import time
+import hashlib
+import shutil
+import threading
+import traceback
+import zipfile
+from xml.etree import ElementTree
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
 from typing import Optional, List, Dict
+import anthropic
+import httpx
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from enum import Enum
 from dataclasses import dataclass
 
+# Optional document text extractors used by the original-document viewer
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
 # Import functions from roadmap.py
 from roadmap import (
-    parse_document, chunk_text, chunk_with_fallback, index_chunks, retrieve_chunks,
+    parse_document, chunk_text, chunk_with_fallback, index_chunks, index_chunk_batches, retrieve_chunks,
     generate_roadmap, format_for_persona, init_db,
     VALID_LENSES, OUTPUT_DIR, DATA_DIR, MATERIALS_DIR,
-    validate_api_keys, ContextGraph, generate_embeddings,
-    load_questions, save_questions, load_answers, save_answers,
-    load_decisions, save_decisions,
+    validate_api_keys, ContextGraph, generate_embeddings, load_chunks_with_embeddings, embed_query,
+    cosine_similarity_batch,
+    load_questions, save_questions, load_answers,
+    load_decisions, save_decisions, save_question_stores,
     load_architecture_documents, scan_architecture_documents, generate_architecture_alignment,
     parse_roadmap_for_analysis, extract_engineering_questions_from_alignment,
     add_architecture_questions_to_system, save_alignment_analysis,
     load_alignment_analysis, format_alignment_report,
     load_competitor_developments, add_competitor_development, get_competitor_development,
     load_analyst_assessments, generate_analyst_assessment, format_analyst_assessment_markdown,
-    UnifiedContextGraph, sync_all_to_graph, retrieve_with_authority, AUTHORITY_LEVELS
+    COMPETITOR_DEVELOPMENTS_FILE, ANALYST_ASSESSMENTS_FILE,
+    UnifiedContextGraph, GRAPH_PATH, sync_all_to_graph, retrieve_with_authority, AUTHORITY_LEVELS
 )
 
 # Page configuration
@@ -46,27 +80,148 @@ if 'index_stats' not in st.session_state:
 
 # ========== UTILITY FUNCTIONS ==========
 
+# Chunk table columns needed to filter, sort and page the chunk browser
+# (excludes the embedding vector; content is only read for the rows shown)
+CHUNK_BROWSER_COLUMNS = ["id", "source_file", "lens", "token_count", "created_at", "chunk_index"]
+
+# Chunk browser sort options -> (sort columns, ascending)
+CHUNK_SORT_ORDERS = {
+    "Created (newest)": ('created_at', False),
+    "Created (oldest)": ('created_at', True),
+    "Token Count (high)": ('token_count', False),
+    "Token Count (low)": ('token_count', True),
+    "Chunk Index": (['source_file', 'chunk_index'], True),
+}
+
+# Lens folders already created this session (skips repeat mkdir calls)
+_KNOWN_LENS_DIRS: set[str] = set()
+
+
+def _file_signature(path: Path) -> tuple:
+    """
+    (mtime_ns, size) of a file, or () if it does not exist. Used as the cache
+    key of anything read from that file, so the entry is replaced when it changes.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return ()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _unified_graph_signature() -> tuple:
+    """(name, mtime_ns, size) of every file the unified graph is loaded from."""
+    try:
+        entries = [entry for entry in os.scandir(GRAPH_PATH) if entry.is_file()]
+    except FileNotFoundError:
+        return ()
+    return tuple(sorted((entry.name, *_file_signature(Path(entry.path))) for entry in entries))
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_unified_graph_cached(signature: tuple) -> UnifiedContextGraph:
+    """Load and normalize the unified graph once per on-disk signature."""
+    graph = UnifiedContextGraph.load()
+    for node_type, nodes in graph.node_indices.items():
+        for node_id, node in nodes.items():
+            if not isinstance(node, dict):
+                nodes[node_id] = dict(vars(node))
+    return graph
+
+
+def load_unified_graph() -> UnifiedContextGraph:
+    """
+    Load the unified graph with every indexed node normalized to a plain dict.
+
+    The instance is shared across reruns until the graph files change, so
+    callers must treat it as read-only.
+    """
+    return _load_unified_graph_cached(_unified_graph_signature())
+
+
+def _chunk_graph_signature() -> tuple:
+    """(mtime_ns, size) of the chunk context graph file, or () if it does not exist."""
+    return _file_signature(DATA_DIR / "context_graph.json")
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _load_chunk_graph_cached(signature: tuple) -> ContextGraph:
+    """Load the chunk context graph once per on-disk signature."""
+    return ContextGraph().load()
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _chunk_graph_stats_cached(signature: tuple) -> Dict:
+    """Statistics of the chunk context graph for an on-disk signature."""
+    return _load_chunk_graph_cached(signature).get_stats()
+
+
+def load_chunk_graph() -> ContextGraph:
+    """
+    Load the chunk context graph, shared across reruns until the file
+    changes. Callers must treat it as read-only.
+    """
+    return _load_chunk_graph_cached(_chunk_graph_signature())
+
+
+def get_chunk_graph_stats() -> Dict:
+    """Statistics of the chunk context graph, cached until the file changes."""
+    return _chunk_graph_stats_cached(_chunk_graph_signature())
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _chunk_graph_node_options_cached(signature: tuple, limit: int) -> Dict[str, str]:
+    """Display label -> node id for the first limit nodes, built once per on-disk signature."""
+    nodes = _load_chunk_graph_cached(signature).graph.nodes(data=True)
+    return {
+        f"{data.get('source_name', 'Unknown')} [{data.get('lens', 'unknown')}] - {data.get('content_preview', '')[:50]}...": chunk_id
+        for chunk_id, data in islice(nodes, limit)
+    }
+
+
+def get_chunk_graph_node_options(limit: int = 100) -> Dict[str, str]:
+    """Explore Connections picker options for the chunk graph; shared, treat as read-only."""
+    return _chunk_graph_node_options_cached(_chunk_graph_signature(), limit)
+
+
 def get_index_stats() -> Optional[Dict]:
     """Get statistics about indexed materials"""
     try:
         db = init_db()
         table = db.open_table("roadmap_chunks")
 
-        # Get all chunks
-        chunks = table.to_pandas()
+        # Stream only the aggregated columns in Arrow batches and reduce
+        # each batch with Arrow kernels instead of materializing the table
+        batches = table.search().select(["token_count", "lens", "created_at", "source_file"]).limit(None).to_batches()
 
-        if chunks.empty:
-            return None
+        total_chunks = 0
+        total_tokens = 0
+        lens_totals = Counter()
+        recent_candidates = []
+
+        for batch in batches:
+            if batch.num_rows == 0:
+                continue
+            total_chunks += batch.num_rows
+            total_tokens += pc.sum(batch["token_count"]).as_py() or 0
+
+            for entry in pc.value_counts(batch["lens"]).to_pylist():
+                lens_totals[entry["values"]] += entry["counts"]
 
-        # Calculate statistics
-        total_chunks = len(chunks)
-        total_tokens = chunks['token_count'].sum()
+            # Keep each batch's ten newest rows as candidates for the recent list
+            newest = pc.sort_indices(batch, sort_keys=[("created_at", "descending")])[:10]
+            recent_candidates.append(pa.Table.from_batches([batch.take(newest)]))
+
+        if total_chunks == 0:
+            return None
 
         # Breakdown by lens
-        lens_counts = chunks['lens'].value_counts().to_dict()
+        lens_counts = dict(lens_totals.most_common())
 
         # Recent sources
-        recent_sources = chunks.nlargest(10, 'created_at')[['source_file', 'created_at', 'lens']].to_dict('records')
+        candidates = pa.concat_tables(recent_candidates)
+        newest = pc.sort_indices(candidates, sort_keys=[("created_at", "descending")])[:10]
+        recent_sources = candidates.take(newest).select(['source_file', 'created_at', 'lens']).to_pylist()
 
         return {
             'total_chunks': total_chunks,
@@ -114,20 +269,7 @@ def rebuild_context_graph():
         table = db.open_table("roadmap_chunks")
 
         # Get all chunks and embeddings from store
-        all_data = table.to_pandas()
-        all_chunks = []
-        all_embeddings = []
-
-        for _, row in all_data.iterrows():
-            all_chunks.append({
-                "id": row["id"],
-                "content": row["content"],
-                "lens": row["lens"],
-                "source_file": row["source_file"],
-                "chunk_index": row["chunk_index"],
-                "token_count": row["token_count"],
-            })
-            all_embeddings.append(row["vector"])
+        all_chunks, all_embeddings = load_chunks_with_embeddings(table)
 
         # Build graph
         graph = ContextGraph()
@@ -145,20 +287,45 @@ def get_all_materials() -> List[Dict]:
     materials = []
     for lens in VALID_LENSES:
         lens_dir = MATERIALS_DIR / lens
-        if lens_dir.exists():
-            for file_path in lens_dir.rglob("*"):
-                if file_path.is_file() and not file_path.name.startswith('.'):
-                    materials.append({
-                        'file': file_path.name,
-                        'path': str(file_path),
-                        'lens': lens,
-                        'size': file_path.stat().st_size,
-                        'modified': datetime.fromtimestamp(file_path.stat().st_mtime),
-                        'size_mb': f"{file_path.stat().st_size / 1024 / 1024:.2f} MB"
-                    })
+        if not lens_dir.exists():
+            continue
+        # scandir entries carry the file type and cache their stat result
+        pending_dirs = [lens_dir]
+        while pending_dirs:
+            with os.scandir(pending_dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending_dirs.append(entry.path)
+                    elif entry.is_file() and not entry.name.startswith('.'):
+                        file_stat = entry.stat()
+                        materials.append({
+                            'file': entry.name,
+                            'path': entry.path,
+                            'lens': lens,
+                            'size': file_stat.st_size,
+                            'modified': datetime.fromtimestamp(file_stat.st_mtime),
+                            'size_mb': f"{file_stat.st_size / 1024 / 1024:.2f} MB"
+                        })
     return materials
 
 
+def _ensure_lens_dir(lens: str) -> Path:
+    """Return the materials folder for a lens, creating it on first use"""
+    lens_dir = MATERIALS_DIR / lens
+    if lens not in _KNOWN_LENS_DIRS:
+        lens_dir.mkdir(parents=True, exist_ok=True)
+        _KNOWN_LENS_DIRS.add(lens)
+    return lens_dir
+
+
+def _move_file(source: Path, dest: Path):
+    """Atomically move a file, falling back to a copy for cross-device moves"""
+    try:
+        os.replace(source, dest)
+    except OSError:
+        shutil.move(source, dest)
+
+
 def move_file_to_lens(file_path: str, new_lens: str) -> bool:
     """Move a file to a different lens folder"""
     try:
@@ -166,19 +333,37 @@ def move_file_to_lens(file_path: str, new_lens: str) -> bool:
         if not source.exists():
             return False
 
-        # Create destination directory
-        dest_dir = MATERIALS_DIR / new_lens
-        dest_dir.mkdir(parents=True, exist_ok=True)
-
-        # Move file
-        dest = dest_dir / source.name
-        source.rename(dest)
+        dest_dir = _ensure_lens_dir(new_lens)
+        _move_file(source, dest_dir / source.name)
         return True
     except Exception as e:
+        # Folder may have been removed since it was cached - recreate next time
+        _KNOWN_LENS_DIRS.discard(new_lens)
         st.error(f"Error moving file: {e}")
         return False
 
 
+def move_files_to_lens(file_paths: List[str], new_lens: str) -> int:
+    """Move several files to a lens folder. Returns the number moved."""
+    try:
+        dest_dir = _ensure_lens_dir(new_lens)
+    except Exception as e:
+        st.error(f"Error creating lens folder: {e}")
+        return 0
+
+    moved_count = 0
+    for file_path in file_paths:
+        source = Path(file_path)
+        if not source.exists():
+            continue
+        try:
+            _move_file(source, dest_dir / source.name)
+            moved_count += 1
+        except Exception as e:
+            st.error(f"Error moving {source.name}: {e}")
+    return moved_count
+
+
 def delete_material_file(file_path: str) -> bool:
     """Delete a material file"""
     try:
@@ -189,25 +374,142 @@ def delete_material_file(file_path: str) -> bool:
         return False
 
 
-def get_all_chunks() -> Optional[pd.DataFrame]:
-    """Get all chunks from the index"""
+def _sql_string(value: str) -> str:
+    """Quote a value as a LanceDB (SQL) string literal"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def chunk_filter_clause(lenses: Optional[List[str]] = None, source_file: Optional[str] = None) -> Optional[str]:
+    """Build a LanceDB where clause for the chunk browser filters (None matches everything)"""
+    clauses = []
+    if lenses:
+        clauses.append(f"lens IN ({', '.join(map(_sql_string, lenses))})")
+    if source_file:
+        clauses.append(f"source_file = {_sql_string(source_file)}")
+    return " AND ".join(clauses) or None
+
+
+def _chunk_table_signature(table) -> tuple:
+    """
+    (version, commit timestamp) of the chunk table. The version number alone
+    restarts at 1 when the table is dropped and recreated.
+    """
+    version = table.version
+    timestamp = next((v["timestamp"] for v in reversed(table.list_versions()) if v["version"] == version), None)
+    return (version, timestamp)
+
+
+def get_all_chunks(where: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """
+    Get chunk metadata (no content) from the index, optionally filtered by a
+    LanceDB where clause. Cached until the table changes.
+    """
     try:
         db = init_db()
         table = db.open_table("roadmap_chunks")
-        chunks_df = table.to_pandas()
+        return _load_chunks_cached(table, _chunk_table_signature(table), where)
+    except Exception:
+        return None
 
-        if chunks_df.empty:
-            return None
 
-        # Add human-readable created_at
-        chunks_df['created_at'] = pd.to_datetime(chunks_df['created_at'])
-        chunks_df['created_at_str'] = chunks_df['created_at'].dt.strftime('%Y-%m-%d %H:%M')
+@st.cache_data(max_entries=8, show_spinner=False)
+def _load_chunks_cached(_table, table_signature: tuple, where: Optional[str]) -> Optional[pd.DataFrame]:
+    """Read the browser columns of the chunks matching a filter at a given table signature"""
+    # Filter inside LanceDB and project only the small columns
+    query = _table.search()
+    if where:
+        query = query.where(where)
+    chunks_df = query.select(CHUNK_BROWSER_COLUMNS).limit(None).to_pandas()
 
-        return chunks_df
+    if chunks_df.empty:
+        return None
+
+    # Keep created_at as datetime64; it is only formatted for the rows shown
+    chunks_df['created_at'] = pd.to_datetime(chunks_df['created_at'])
+
+    return chunks_df
+
+
+def get_chunk_contents(where: Optional[str] = None) -> Dict[str, str]:
+    """Chunk id -> content for the chunks matching a LanceDB where clause"""
+    try:
+        db = init_db()
+        table = db.open_table("roadmap_chunks")
+        query = table.search()
+        if where:
+            query = query.where(where)
+        contents = query.select(["id", "content"]).limit(None).to_arrow()
+    except Exception:
+        return {}
+    return dict(zip(contents["id"].to_pylist(), contents["content"].to_pylist()))
+
+
+def chunk_summary(chunks_df: pd.DataFrame) -> Dict:
+    """Summary figures and filter options for the chunk browser, in one pass per column"""
+    unique_sources = pd.Series(chunks_df['source_file'].unique())
+    source_names = unique_sources.str.rsplit('/', n=1).str[-1]
+
+    # File name -> path; the first path wins when names repeat across folders
+    source_paths_by_name = {}
+    for name, path in zip(source_names, unique_sources):
+        source_paths_by_name.setdefault(name, path)
+
+    return {
+        "total_tokens": int(chunks_df['token_count'].sum()),
+        "avg_tokens": int(chunks_df['token_count'].mean()),
+        "unique_lenses": list(chunks_df['lens'].unique()),
+        "unique_source_count": len(unique_sources),
+        "source_paths_by_name": source_paths_by_name,
+    }
+
+
+def sort_chunks(chunks_df: pd.DataFrame, sort_by: str) -> pd.DataFrame:
+    """Sort chunks by one of the CHUNK_SORT_ORDERS options (stable, so ties keep table order)"""
+    sort_columns, ascending = CHUNK_SORT_ORDERS[sort_by]
+    return chunks_df.sort_values(sort_columns, ascending=ascending, kind='stable')
+
+
+def sorted_chunk_page(chunks_df: pd.DataFrame, sort_by: str, start: int, stop: int) -> pd.DataFrame:
+    """
+    Rows start:stop of sort_chunks(chunks_df, sort_by), selecting only the
+    first stop rows with a partial sort when ordering by a single column.
+    """
+    sort_columns, ascending = CHUNK_SORT_ORDERS[sort_by]
+    if isinstance(sort_columns, str) and not chunks_df[sort_columns].hasnans:
+        top_rows = chunks_df.nsmallest if ascending else chunks_df.nlargest
+        return top_rows(stop, sort_columns).iloc[start:stop]
+    return sort_chunks(chunks_df, sort_by).iloc[start:stop]
+
+
+def get_chunk_table_signature() -> Optional[tuple]:
+    """Current (version, commit timestamp) of the chunk table, or None if it cannot be opened"""
+    try:
+        return _chunk_table_signature(init_db().open_table("roadmap_chunks"))
     except Exception:
         return None
 
 
+def chunk_export_frame(chunks_df: pd.DataFrame, where: Optional[str] = None) -> pd.DataFrame:
+    """Select export columns, reading content and formatting created_at only for the exported rows"""
+    export_df = chunks_df[['id', 'lens', 'source_file', 'chunk_index', 'token_count']].copy()
+    export_df.insert(1, 'content', export_df['id'].map(get_chunk_contents(where)))
+    export_df['created_at_str'] = chunks_df['created_at'].dt.strftime('%Y-%m-%d %H:%M')
+    return export_df
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def export_chunks(_chunks_df: pd.DataFrame, table_signature: Optional[tuple], where: Optional[str],
+                  sort_by: str, fmt: str) -> str:
+    """
+    Serialize the filtered, sorted chunks as CSV or JSON. Cached per table
+    signature, filter and sort order, which together determine the rows.
+    """
+    export_df = chunk_export_frame(sort_chunks(_chunks_df, sort_by), where)
+    if fmt == "csv":
+        return export_df.to_csv(index=False)
+    return export_df.to_json(orient='records', indent=2)
+
+
 # ========== DASHBOARD COMPONENTS ==========
 
 def render_quick_actions():
@@ -303,7 +605,7 @@ def render_attention_needed():
 
     # Check for gaps without decisions
     try:
-        graph = UnifiedContextGraph.load()
+        graph = load_unified_graph()
         if graph:
             unaddressed_gaps = [
                 g for g in graph.node_indices.get("gap", {}).values()
@@ -379,11 +681,8 @@ def page_dashboard():
 
     # Lens breakdown
     st.subheader("Breakdown by Lens")
-    lens_df = pd.DataFrame([
-        {"Lens": lens, "Chunks": count}
-        for lens, count in stats['lens_breakdown'].items()
-    ])
-    st.bar_chart(lens_df.set_index("Lens"))
+    lens_chart = pd.Series(stats['lens_breakdown'], name="Chunks").rename_axis("Lens")
+    st.bar_chart(lens_chart)
 
     # Recent sources
     st.subheader("Recent Ingested Sources")
@@ -396,8 +695,7 @@ def page_dashboard():
     # Context graph stats
     st.subheader("Context Graph")
     try:
-        graph = ContextGraph().load()
-        graph_stats = graph.get_stats()
+        graph_stats = get_chunk_graph_stats()
 
         col1, col2, col3 = st.columns(3)
         col1.metric("Graph Nodes", graph_stats["nodes"])
@@ -416,7 +714,7 @@ def page_dashboard():
     st.caption("Integrates decisions, assessments, questions, and roadmap with authority hierarchy")
 
     try:
-        unified_graph = UnifiedContextGraph.load()
+        unified_graph = load_unified_graph()
 
         if unified_graph.graph.number_of_nodes() == 0:
             st.info("Graph is empty. Click 'Sync Graph' to build the unified knowledge graph.")
@@ -432,27 +730,23 @@ def page_dashboard():
             col1.metric("Total Nodes", unified_graph.graph.number_of_nodes())
             col2.metric("Total Edges", unified_graph.graph.number_of_edges())
 
-            active_decisions = len([
-                d for d in unified_graph.node_indices["decision"].values()
-                if d.get("status") == "active"
-            ])
-            col3.metric("Active Decisions", active_decisions)
-
-            pending_questions = len([
-                q for q in unified_graph.node_indices["question"].values()
-                if q.get("status") == "pending"
-            ])
-            col4.metric("Open Questions", pending_questions)
+            decision_status_counts = Counter(
+                d.get("status") for d in unified_graph.node_indices["decision"].values()
+            )
+            question_status_counts = Counter(
+                q.get("status") for q in unified_graph.node_indices["question"].values()
+            )
+            col3.metric("Active Decisions", decision_status_counts["active"])
+            col4.metric("Open Questions", question_status_counts["pending"])
 
             # Authority breakdown
             with st.expander("Knowledge by Authority Level"):
                 authority_data = {}
                 for node_type, level in AUTHORITY_LEVELS.items():
-                    count = 0
                     if node_type == "answered_question":
-                        count = len([q for q in unified_graph.node_indices["question"].values() if q.get("status") == "answered"])
+                        count = question_status_counts["answered"]
                     elif node_type == "pending_question":
-                        count = len([q for q in unified_graph.node_indices["question"].values() if q.get("status") == "pending"])
+                        count = question_status_counts["pending"]
                     else:
                         count = len(unified_graph.node_indices.get(node_type.replace("_question", "question"), {}))
 
@@ -487,30 +781,46 @@ def page_dashboard():
 
 # ========== QUESTIONS PAGE COMPONENTS ==========
 
-def get_decision_overrides(decision_id: str) -> list:
-    """Get chunks that a decision overrides from the graph."""
-
-    try:
-        graph = UnifiedContextGraph.load()
-        if not graph or not graph.graph:
-            return []
+# Source reference type icons
+SOURCE_TYPE_ICONS = {
+    "chunk": "📄",
+    "assessment": "🔬",
+    "roadmap_item": "🗺️",
+    "gap": "⚠️",
+    "decision": "✅"
+}
+
+# Source reference search method badges
+SEARCH_METHOD_BADGES = {
+    "semantic": "🎯",
+    "keyword": "🔤",
+    "graph": "🕸️"
+}
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _decision_overrides_cached(signature: tuple) -> Dict[str, list]:
+    """Decision id -> overridden chunks, from one pass over the unified graph's edges."""
+    graph = _load_unified_graph_cached(signature)
+    overrides = {}
+    if not graph or not graph.graph:
+        return overrides
 
-        overrides = []
+    chunks = graph.node_indices.get("chunk", {})
+    for decision_id, target, edge_type in graph.graph.edges(data="edge_type"):
+        if edge_type == "OVERRIDES":
+            chunk = chunks.get(target)
+            if chunk:
+                overrides.setdefault(decision_id, []).append(chunk)
+    return overrides
 
-        # Find OVERRIDES edges from this decision
-        if decision_id in graph.graph:
-            for neighbor in graph.graph.successors(decision_id):
-                edge_data = graph.graph.edges.get((decision_id, neighbor), {})
-                if edge_data.get("edge_type") == "OVERRIDES":
-                    # Get chunk data
-                    chunk = graph.node_indices.get("chunk", {}).get(neighbor)
-                    if chunk:
-                        chunk_dict = chunk if isinstance(chunk, dict) else (chunk.__dict__ if hasattr(chunk, '__dict__') else {})
-                        overrides.append(chunk_dict)
 
-        return overrides
-    except Exception as e:
-        return []
+def get_decision_overrides_bulk(decision_ids: List[str]) -> Dict[str, list]:
+    """Get the chunks each decision overrides from the graph, in one lookup for all decisions."""
+    try:
+        overrides = _decision_overrides_cached(_unified_graph_signature())
+    except Exception:
+        return {decision_id: [] for decision_id in decision_ids}
+    return {decision_id: overrides.get(decision_id, []) for decision_id in decision_ids}
 
 
 def save_decision_update(decision: dict):
@@ -523,32 +833,32 @@ def save_decision_update(decision: dict):
     save_decisions(decisions)
 
 
-def extract_key_terms_simple(text: str) -> list:
-    """Simple keyword extraction without external dependencies."""
-    import re
-    from collections import Counter
+# Common stop words filtered out of extracted key terms
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "can", "this", "that", "these", "those",
+    "i", "you", "he", "she", "it", "we", "they", "what", "which", "who",
+    "when", "where", "why", "how", "all", "each", "every", "both", "few",
+    "more", "most", "other", "some", "such", "no", "not", "only", "own",
+    "same", "so", "than", "too", "very", "just", "also", "now", "here",
+    "there", "then", "once", "and", "or", "but", "if", "because", "as",
+    "until", "while", "of", "at", "by", "for", "with", "about", "against",
+    "between", "into", "through", "during", "before", "after", "above",
+    "below", "to", "from", "up", "down", "in", "out", "on", "off", "over",
+    "under", "again", "further", "our", "your", "their", "its"
+})
+
+_KEY_TERM_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
 
-    # Common stop words to filter out
-    stop_words = {
-        "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
-        "have", "has", "had", "do", "does", "did", "will", "would", "could",
-        "should", "may", "might", "can", "this", "that", "these", "those",
-        "i", "you", "he", "she", "it", "we", "they", "what", "which", "who",
-        "when", "where", "why", "how", "all", "each", "every", "both", "few",
-        "more", "most", "other", "some", "such", "no", "not", "only", "own",
-        "same", "so", "than", "too", "very", "just", "also", "now", "here",
-        "there", "then", "once", "and", "or", "but", "if", "because", "as",
-        "until", "while", "of", "at", "by", "for", "with", "about", "against",
-        "between", "into", "through", "during", "before", "after", "above",
-        "below", "to", "from", "up", "down", "in", "out", "on", "off", "over",
-        "under", "again", "further", "our", "your", "their", "its"
-    }
 
+def extract_key_terms_simple(text: str) -> list:
+    """Simple keyword extraction without external dependencies."""
     # Tokenize (simple split, remove punctuation)
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
+    words = _KEY_TERM_RE.findall(text.lower())
 
     # Filter stop words and short words
-    keywords = [w for w in words if w not in stop_words and len(w) > 2]
+    keywords = [w for w in words if w not in _STOP_WORDS and len(w) > 2]
 
     # Count frequency and return top terms
     counts = Counter(keywords)
@@ -557,11 +867,19 @@ def extract_key_terms_simple(text: str) -> list:
     return [word for word, count in counts.most_common(8)]
 
 
+@lru_cache(maxsize=2048)
+def _cached_embedding(text: str) -> list:
+    """Embed a single text, memoized so reruns and repeated queries skip the API call."""
+    embeddings = generate_embeddings([text])
+    if not embeddings:
+        raise ValueError("No embedding returned")
+    return embeddings[0]
+
+
 def get_embedding(text: str) -> list:
     """Get embedding for a single text using Voyage AI."""
     try:
-        embeddings = generate_embeddings([text])
-        return embeddings[0] if embeddings else []
+        return _cached_embedding(text)
     except:
         return []
 
@@ -598,40 +916,89 @@ def search_chunks_keyword(keywords: list, limit: int = 10) -> list:
     """Keyword-based search on chunks."""
     try:
         table = get_lancedb_table()
-        if table is None:
+        if table is None or not keywords:
             return []
 
-        # Get all chunks and filter
-        df = table.to_pandas()
+        chunks = table.search().select(["id", "source_file", "lens", "content"]).limit(None).to_arrow()
+        if chunks.num_rows == 0:
+            return []
 
-        results = []
-        for _, row in df.iterrows():
-            content = str(row.get("content", "")).lower()
-            matches = sum(1 for kw in keywords if kw.lower() in content)
-
-            if matches > 0:
-                results.append({
-                    "id": row.get("id", ""),
-                    "source_name": row.get("source_file", "Unknown").split("/")[-1] if "/" in str(row.get("source_file", "")) else row.get("source_file", "Unknown"),
-                    "lens": row.get("lens", ""),
-                    "content": row.get("content", ""),
-                    "similarity": matches / len(keywords) if keywords else 0,
-                    "matched_count": matches
-                })
+        # Count keyword hits per chunk with Arrow kernels instead of a Python loop per row
+        content = pc.fill_null(chunks["content"], "")
+        match_counts = pc.match_substring(content, keywords[0], ignore_case=True).cast(pa.int32())
+        for kw in keywords[1:]:
+            match_counts = pc.add(match_counts, pc.match_substring(content, kw, ignore_case=True).cast(pa.int32()))
 
-        # Sort by match count
-        results.sort(key=lambda x: x["matched_count"], reverse=True)
+        # Stable sort keeps table order among chunks with equal counts
+        order = pc.sort_indices(match_counts, sort_keys=[("", "descending")])[:limit]
+        top = chunks.take(order).to_pylist()
+        top_counts = match_counts.take(order).to_pylist()
 
-        return results[:limit]
+        results = []
+        for row, matches in zip(top, top_counts):
+            if matches == 0:
+                break
+            source_file = row.get("source_file") or ""
+            results.append({
+                "id": row.get("id", ""),
+                "source_name": os.path.basename(source_file) or "Unknown",
+                "source_file": source_file,
+                "lens": row.get("lens", ""),
+                "content": row.get("content", ""),
+                "similarity": matches / len(keywords),
+                "matched_count": matches
+            })
+
+        return results
     except Exception as e:
         return []
 
 
+# LanceDB L2 distance below which a semantic hit is treated as high confidence
+# (squared L2 of 0.2 on unit vectors is a cosine similarity of 0.9)
+SOURCE_CONFIDENT_DISTANCE = 0.2
+
+
+def question_content_hash(question: dict) -> str:
+    """Stable hash of the question fields that drive source search"""
+    text = f"{question.get('question', '')}\n{question.get('context', '')}"
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _find_sources_args(question: dict, max_sources: int) -> tuple:
+    """Arguments of _find_sources_cached for a question against the current index and graph"""
+    return (
+        question.get("id", ""),
+        question_content_hash(question),
+        question.get("question", ""),
+        question.get("context", ""),
+        max_sources,
+        get_chunk_table_signature(),
+        _unified_graph_signature(),
+    )
+
+
 def find_sources_for_question(question: dict, max_sources: int = 5) -> list:
-    """Dynamically find source references for a question by searching graph and chunks."""
+    """
+    Find source references for a question, reusing results while its text,
+    the chunk index and the unified graph are unchanged.
+    """
+    return _find_sources_cached(*_find_sources_args(question, max_sources))
 
-    question_text = question.get("question", "")
-    context = question.get("context", "")
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _find_sources_cached(question_id: str, question_hash: str, _question_text: str,
+                         _context: str, max_sources: int, index_signature: Optional[tuple],
+                         graph_signature: tuple) -> list:
+    """Dynamically find source references for a question by searching graph and chunks.
+
+    Cached on (question_id, question_hash, max_sources) and the chunk table and
+    unified graph signatures, so re-indexing or a graph sync searches again; the
+    raw text is excluded from hashing since question_hash already covers it.
+    """
+
+    question_text = _question_text
+    context = _context
     query = f"{question_text} {context}".strip()
 
     if not query:
@@ -650,8 +1017,8 @@ def find_sources_for_question(question: dict, max_sources: int = 5) -> list:
                 continue
             seen_ids.add(chunk_id)
 
-            source_file = chunk.get("source_file", "Unknown")
-            source_name = source_file.split("/")[-1] if "/" in source_file else source_file
+            source_file = chunk.get("source_file") or "Unknown"
+            source_name = os.path.basename(source_file)
 
             sources.append({
                 "type": "chunk",
@@ -666,6 +1033,12 @@ def find_sources_for_question(question: dict, max_sources: int = 5) -> list:
     except Exception as e:
         pass
 
+    # Enough near-exact semantic hits make the keyword scan and graph walk redundant
+    confident = [s for s in sources if s["similarity"] < SOURCE_CONFIDENT_DISTANCE]
+    if len(confident) >= max_sources:
+        confident.sort(key=lambda x: x.get("similarity", 0), reverse=True)
+        return confident[:max_sources]
+
     # === METHOD 2: Keyword extraction and search ===
     try:
         keywords = extract_key_terms_simple(question_text)
@@ -695,7 +1068,7 @@ def find_sources_for_question(question: dict, max_sources: int = 5) -> list:
 
     # === METHOD 3: Graph traversal ===
     try:
-        graph = UnifiedContextGraph.load()
+        graph = load_unified_graph()
 
         if graph:
             keywords = extract_key_terms_simple(question_text)
@@ -705,20 +1078,12 @@ def find_sources_for_question(question: dict, max_sources: int = 5) -> list:
                 if assess_id in seen_ids:
                     continue
 
-                summary = ""
-                if isinstance(assessment, dict):
-                    summary = assessment.get("summary", "")
-                else:
-                    summary = getattr(assessment, 'summary', "")
+                summary = assessment.get("summary", "")
 
                 if any(kw.lower() in summary.lower() for kw in keywords):
                     seen_ids.add(assess_id)
 
-                    assess_type = ""
-                    if isinstance(assessment, dict):
-                        assess_type = assessment.get("assessment_type", "Unknown")
-                    else:
-                        assess_type = getattr(assessment, 'assessment_type', "Unknown")
+                    assess_type = assessment.get("assessment_type", "Unknown")
 
                     sources.append({
                         "type": "assessment",
@@ -735,11 +1100,7 @@ def find_sources_for_question(question: dict, max_sources: int = 5) -> list:
                 if gap_id in seen_ids:
                     continue
 
-                description = ""
-                if isinstance(gap, dict):
-                    description = gap.get("description", "")
-                else:
-                    description = getattr(gap, 'description', "")
+                description = gap.get("description", "")
 
                 if any(kw.lower() in description.lower() for kw in keywords):
                     seen_ids.add(gap_id)
@@ -760,7 +1121,7 @@ def find_sources_for_question(question: dict, max_sources: int = 5) -> list:
     return sources[:max_sources]
 
 
-def render_question_source_references(question: dict):
+def render_question_source_references(question: dict, max_sources: int = 5):
     """Render source references for a question. Dynamically finds sources if not cached."""
 
     # Check for cached sources
@@ -771,7 +1132,7 @@ def render_question_source_references(question: dict):
     else:
         # Find sources dynamically
         with st.spinner("Finding source references..."):
-            sources = find_sources_for_question(question, max_sources=5)
+            sources = find_sources_for_question(question, max_sources=max_sources)
             st.session_state[cache_key] = sources
 
     if not sources:
@@ -781,11 +1142,17 @@ def render_question_source_references(question: dict):
         if st.button("🔄 Search Again", key=f"refresh_sources_{question['id']}"):
             if cache_key in st.session_state:
                 del st.session_state[cache_key]
+            clear_question_sources(question, max_sources)
             st.rerun()
         return
 
     st.markdown(f"**📚 Source References** ({len(sources)} found)")
 
+    # Build every source card into one markdown block so the page only
+    # creates a single element per question instead of ~7 widgets per source
+    cards = []
+    viewable = []
+
     for i, source in enumerate(sources):
         source_type = source.get("type", "chunk")
         source_id = source.get("id", "unknown")
@@ -796,73 +1163,75 @@ def render_question_source_references(question: dict):
         search_method = source.get("search_method", "unknown")
         matched_terms = source.get("matched_terms", [])
 
-        # Type icon
-        type_icons = {
-            "chunk": "📄",
-            "assessment": "🔬",
-            "roadmap_item": "🗺️",
-            "gap": "⚠️",
-            "decision": "✅"
-        }
-        icon = type_icons.get(source_type, "📎")
-
-        # Method badge
-        method_badges = {
-            "semantic": "🎯",
-            "keyword": "🔤",
-            "graph": "🕸️"
-        }
-        method_badge = method_badges.get(search_method, "")
-
-        with st.container(border=True):
-            # Header row
-            col1, col2 = st.columns([4, 1])
-
-            with col1:
-                st.markdown(f"{icon} **{source_name}**")
-
-                meta_parts = []
-                if lens and lens not in ["assessment", "gap", "roadmap"]:
-                    meta_parts.append(f"Lens: {lens}")
-                meta_parts.append(f"ID: {source_id[:20]}...")
-                meta_parts.append(f"{method_badge} {search_method}")
-
-                st.caption(" | ".join(meta_parts))
+        icon = SOURCE_TYPE_ICONS.get(source_type, "📎")
+        method_badge = SEARCH_METHOD_BADGES.get(search_method, "")
+
+        meta_parts = []
+        if lens and lens not in ["assessment", "gap", "roadmap"]:
+            meta_parts.append(f"Lens: {lens}")
+        meta_parts.append(f"ID: {source_id[:20]}...")
+        meta_parts.append(f"{method_badge} {search_method}")
+
+        # Relevance score
+        score_pct = min(similarity * 100, 100)
+        if score_pct >= 70:
+            score_color = "#21c354"
+        elif score_pct >= 40:
+            score_color = "#faca2b"
+        else:
+            score_color = "#808495"
+
+        card = [
+            '<div style="border: 1px solid rgba(128, 128, 128, 0.3); border-radius: 0.5rem; '
+            'padding: 0.75rem 1rem; margin-bottom: 0.5rem;">',
+            f'<div style="float: right; font-weight: 600; color: {score_color};">{score_pct:.0f}%</div>',
+            f"<div>{icon} <strong>{html.escape(source_name)}</strong></div>",
+            f'<div style="font-size: 0.85em; opacity: 0.7;">{html.escape(" | ".join(meta_parts))}</div>',
+        ]
 
-            with col2:
-                # Relevance score
-                score_pct = min(similarity * 100, 100)
-                if score_pct >= 70:
-                    st.success(f"{score_pct:.0f}%")
-                elif score_pct >= 40:
-                    st.warning(f"{score_pct:.0f}%")
-                else:
-                    st.caption(f"{score_pct:.0f}%")
+        # Content excerpt
+        if content:
+            display_content = content[:250]
+            if len(content) > 250:
+                display_content += "..."
+            card.append(f'<div style="margin-top: 0.5rem;"><em>"{html.escape(display_content)}"</em></div>')
+
+        # Matched keywords (for keyword search)
+        if matched_terms:
+            card.append(
+                f'<div style="font-size: 0.85em; opacity: 0.7;">Matched: {html.escape(", ".join(matched_terms))}</div>'
+            )
 
-            # Content excerpt
-            if content:
-                display_content = content[:250]
-                if len(content) > 250:
-                    display_content += "..."
+        card.append("</div>")
+        cards.append("".join(card))
 
-                st.markdown(f"*\"{display_content}\"*")
+        if (source_type == "chunk" and source.get("source_path")) or source_type in ["assessment", "roadmap_item"]:
+            viewable.append((i, source))
 
-            # Matched keywords (for keyword search)
-            if matched_terms:
-                st.caption(f"Matched: {', '.join(matched_terms)}")
+    st.markdown("".join(cards), unsafe_allow_html=True)
 
-            # === VIEW ORIGINAL DOCUMENT ===
-            if source_type == "chunk" and source.get("source_path"):
-                with st.expander("📄 View Original Document"):
-                    render_original_document_viewer(source, content, unique_key=f"{question['id']}_{i}")
+    # === VIEW ORIGINAL DOCUMENT ===
+    # One expander per question; only the selected source is loaded
+    if viewable:
+        with st.expander("📄 View Original Document"):
+            view_labels = {
+                f"{i + 1}. {SOURCE_TYPE_ICONS.get(source.get('type', 'chunk'), '📎')} {source.get('source_name', 'Unknown Source')}": (i, source)
+                for i, source in viewable
+            }
+            selected_label = st.selectbox(
+                "Source",
+                list(view_labels.keys()),
+                key=f"view_source_{question['id']}"
+            )
+            i, source = view_labels[selected_label]
+            source_type = source.get("type", "chunk")
 
+            if source_type == "chunk":
+                render_original_document_viewer(source, source.get("content", ""), unique_key=f"{question['id']}_{i}")
             elif source_type == "assessment":
-                with st.expander("🔬 View Full Assessment"):
-                    render_assessment_detail(source_id)
-
+                render_assessment_detail(source.get("id", "unknown"))
             elif source_type == "roadmap_item":
-                with st.expander("🗺️ View Roadmap Item"):
-                    render_roadmap_item_detail(source_id)
+                render_roadmap_item_detail(source.get("id", "unknown"))
 
     # Refresh button
     col1, col2 = st.columns([3, 1])
@@ -870,25 +1239,63 @@ def render_question_source_references(question: dict):
         if st.button("🔄 Refresh", key=f"refresh_sources_{question['id']}"):
             if cache_key in st.session_state:
                 del st.session_state[cache_key]
+            clear_question_sources(question, max_sources)
             st.rerun()
 
 
+def clear_question_sources(question: dict, max_sources: int = 5):
+    """Drop the persisted source search for a single question."""
+    _find_sources_cached.clear(*_find_sources_args(question, max_sources))
+
+
 def invalidate_source_cache():
     """Clear all cached source references."""
     keys_to_delete = [k for k in st.session_state.keys() if k.startswith("sources_")]
     for key in keys_to_delete:
         del st.session_state[key]
+    _find_sources_cached.clear()
+    _generation_context_counts_cached.clear()
+
+
+# Text kept after a located chunk when a PDF is extracted only up to that chunk
+# (matches the context window the document viewer shows after the chunk)
+PDF_TRAILING_CONTEXT_CHARS = 10000
+
+# Page content streams stored larger than this are decoded and scanned for text
+# operators before running the operator-by-operator text extraction
+PDF_HEAVY_PAGE_BYTES = 2_000_000
 
+# Plain-text document types read directly from disk
+TEXT_DOCUMENT_SUFFIXES = [".txt", ".md", ".json", ".csv", ".yaml", ".yml"]
 
-def get_original_document(source_path: str) -> dict | None:
+# Text files larger than this are only read around the located chunk,
+# keeping TEXT_WINDOW_CHARS of context on either side
+TEXT_FULL_READ_BYTES = 60_000
+TEXT_WINDOW_CHARS = 30_000
+TEXT_READ_BLOCK_CHARS = 64 * 1024
+
+# Extracted PDF/Word/PowerPoint text is also kept on disk so it survives app
+# restarts; least recently used files beyond the limit are evicted
+EXTRACTED_TEXT_CACHE_DIR = Path.home() / ".cache" / "roadmap-synth" / "docs"
+EXTRACTED_TEXT_CACHE_MAX_FILES = 256
+EXTRACTED_DOCUMENT_TYPES = {
+    ".pdf": "pdf_extracted",
+    ".docx": "docx_extracted",
+    ".pptx": "pptx_extracted",
+}
+
+
+def get_original_document(source_path: str, chunk_hint: str = "") -> dict | None:
     """
     Load original document from source path.
 
+    If chunk_hint is given, PDFs are only extracted until that chunk has been
+    found plus trailing context, and large text files are only kept in a
+    window around it; the result then carries "partial": True, and
+    "line_offset" gives the number of lines before the returned content.
+
     Returns dict with content, metadata, or None if not found.
     """
-    from pathlib import Path
-    import os
-
     if not source_path:
         return None
 
@@ -907,114 +1314,379 @@ def get_original_document(source_path: str) -> dict | None:
         return None
 
     try:
-        # Get file metadata
+        # mtime and size in the cache key invalidate the entry when the file changes
         stat = path.stat()
-        modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-        size = stat.st_size
-
-        # Read content based on file type
         suffix = path.suffix.lower()
+        windowed_text = suffix in TEXT_DOCUMENT_SUFFIXES and stat.st_size > TEXT_FULL_READ_BYTES
+        if chunk_hint and (suffix == ".pdf" or windowed_text):
+            stop_after = " ".join(chunk_hint[:100].lower().split())[:50]
+            return _load_document_cached(str(path), stat.st_mtime, stat.st_size, stop_after)
+        return _load_document_cached(str(path), stat.st_mtime, stat.st_size)
+    except Exception as e:
+        print(f"Error reading document: {e}")
+        return None
+
+
+def _is_textless_page(size: int, read_contents) -> bool:
+    """
+    True for a graphics-heavy page content stream that cannot produce text:
+    no text object (BT) and no XObject (Do) that could hold one. Only streams
+    larger than PDF_HEAVY_PAGE_BYTES are decoded (via read_contents).
+    """
+    if size <= PDF_HEAVY_PAGE_BYTES:
+        return False
+    content_stream = read_contents()
+    return b"BT" not in content_stream and b"Do" not in content_stream
+
+
+def _iter_pdf_page_texts(path: Path):
+    """Yield the text of each PDF page, using PyMuPDF when installed and pypdf otherwise."""
+    if fitz is not None:
+        with fitz.open(str(path)) as doc:
+            for page in doc:
+                stored_size = sum(len(doc.xref_stream_raw(xref)) for xref in page.get_contents())
+                if _is_textless_page(stored_size, page.read_contents):
+                    yield ""
+                    continue
+                yield page.get_text("text")
+        return
 
-        if suffix in [".txt", ".md", ".json", ".csv", ".yaml", ".yml"]:
-            # Plain text files
+    if pypdf is None:
+        raise ImportError("No PDF text extractor installed")
+    for page in pypdf.PdfReader(str(path)).pages:
+        # pypdf exposes no stored stream length, so gate on the decoded size;
+        # decoded streams are cached, and extract_text() reuses this decode
+        contents = page.get_contents()
+        content_stream = contents.get_data() if contents is not None else b""
+        if _is_textless_page(len(content_stream), lambda: content_stream):
+            yield ""
+            continue
+        yield page.extract_text()
+
+
+def _extract_pdf_until(path: Path, stop_after: str) -> tuple[str, bool]:
+    """
+    Extract PDF pages until stop_after (whitespace-normalized, lowercase) has
+    been seen and PDF_TRAILING_CONTEXT_CHARS more text is buffered.
+
+    Returns (content, partial) where partial is True if pages were left unread.
+    """
+    pages = []
+    length = 0
+    found_at = None
+    tail = ""
+
+    page_iter = _iter_pdf_page_texts(path)
+    for page_text in page_iter:
+        pages.append(page_text)
+        length += len(page_text) + 2
+
+        if found_at is None:
+            # Search the new page plus the end of the previous one for matches spanning pages
+            window = tail + " " + " ".join(page_text.lower().split())
+            if stop_after in window:
+                found_at = length
+            tail = window[-len(stop_after):]
+        elif length - found_at >= PDF_TRAILING_CONTEXT_CHARS:
+            page_iter.close()
+            return "\n\n".join(pages), True
+
+    return "\n\n".join(pages), False
+
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DRAWING_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_PRESENTATION_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_RELATIONSHIP_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PACKAGE_RELS_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _extract_docx_text(path: Path) -> str:
+    """Body paragraph text of a .docx, read straight from word/document.xml."""
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+
+    paragraphs = []
+    for para in root.find(f"{_WORD_NS}body").findall(f"{_WORD_NS}p"):
+        # Only the paragraph's own runs (as python-docx does); iterating every
+        # descendant would also pick up text-box content nested in drawings
+        runs = []
+        for child in para:
+            if child.tag == f"{_WORD_NS}r":
+                runs.append(child)
+            elif child.tag == f"{_WORD_NS}hyperlink":
+                runs.extend(child.findall(f"{_WORD_NS}r"))
+        parts = []
+        for node in (child for run in runs for child in run):
+            if node.tag == f"{_WORD_NS}t":
+                parts.append(node.text or "")
+            elif node.tag in (f"{_WORD_NS}tab", f"{_WORD_NS}ptab"):
+                parts.append("\t")
+            elif node.tag == f"{_WORD_NS}noBreakHyphen":
+                parts.append("-")
+            elif node.tag == f"{_WORD_NS}cr" or (
+                node.tag == f"{_WORD_NS}br" and node.get(f"{_WORD_NS}type", "textWrapping") == "textWrapping"
+            ):
+                parts.append("\n")
+        paragraphs.append("".join(parts))
+    return "\n\n".join(paragraphs)
+
+
+def _extract_pptx_text(path: Path) -> str:
+    """Text of every text-bearing shape of a .pptx, in slide order, read from the slide XML."""
+    with zipfile.ZipFile(path) as archive:
+        presentation = ElementTree.fromstring(archive.read("ppt/presentation.xml"))
+        rels = ElementTree.fromstring(archive.read("ppt/_rels/presentation.xml.rels"))
+        targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{_PACKAGE_RELS_NS}Relationship")}
+
+        texts = []
+        for slide_id in presentation.iter(f"{_PRESENTATION_NS}sldId"):
+            target = targets.get(slide_id.get(f"{_RELATIONSHIP_NS}id"), "")
+            slide = ElementTree.fromstring(archive.read(f"ppt/{target.lstrip('/').removeprefix('ppt/')}"))
+            shape_tree = slide.find(f"{_PRESENTATION_NS}cSld/{_PRESENTATION_NS}spTree")
+            for shape in shape_tree.findall(f"{_PRESENTATION_NS}sp"):
+                body = shape.find(f"{_PRESENTATION_NS}txBody")
+                if body is None:
+                    continue
+                texts.append("\n".join(
+                    "".join(node.text or "" for node in para.iter(f"{_DRAWING_NS}t"))
+                    for para in body.iter(f"{_DRAWING_NS}p")
+                ))
+    return "\n\n".join(texts)
+
+
+def _read_text_window(path: Path, stop_after: str) -> tuple[str, bool, int]:
+    """
+    Stream a text file in blocks and keep only TEXT_WINDOW_CHARS on either
+    side of the first match of stop_after. If it never matches, keep the
+    first 2 * TEXT_WINDOW_CHARS characters.
+
+    Returns (content, partial, line_offset).
+    """
+    head = None
+    buffer = ""
+    buffer_start = 0
+    line_offset = 0
+    found_at = None
+
+    def drop_leading(count: int):
+        nonlocal buffer, buffer_start, line_offset, head
+        if head is None:
+            head = buffer[:2 * TEXT_WINDOW_CHARS]
+        line_offset += buffer.count("\n", 0, count)
+        buffer = buffer[count:]
+        buffer_start += count
+
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        for block in iter(lambda: f.read(TEXT_READ_BLOCK_CHARS), ""):
+            buffer += block
+
+            if found_at is None:
+                pos = _find_whitespace_insensitive(buffer, stop_after)
+                if pos == -1:
+                    # Keep a tail so a match spanning two blocks is still found
+                    if len(buffer) > TEXT_WINDOW_CHARS:
+                        drop_leading(len(buffer) - TEXT_WINDOW_CHARS)
+                    continue
+                found_at = buffer_start + pos
+                if pos > TEXT_WINDOW_CHARS:
+                    drop_leading(pos - TEXT_WINDOW_CHARS)
+
+            window_end = found_at - buffer_start + TEXT_WINDOW_CHARS
+            if len(buffer) >= window_end:
+                return buffer[:window_end], True, line_offset
+
+    if found_at is None:
+        return (buffer, False, 0) if head is None else (head, True, 0)
+    return buffer, buffer_start > 0, line_offset
+
+
+def _extracted_text_cache_file(path_str: str, mtime: float, size: int) -> Path:
+    """Disk cache file for a document's extracted text, keyed by path, mtime and size."""
+    key = hashlib.sha1(f"{path_str}|{mtime}|{size}".encode()).hexdigest()
+    return EXTRACTED_TEXT_CACHE_DIR / f"{key}.txt"
+
+
+def _read_extracted_text(cache_file: Path) -> str | None:
+    """Cached extracted text, or None on a miss."""
+    try:
+        content = cache_file.read_text(encoding="utf-8")
+        os.utime(cache_file)  # mark as recently used for eviction
+    except OSError:
+        return None
+    return content
+
+
+def _write_extracted_text(cache_file: Path, content: str):
+    """Atomically store extracted text and evict the least recently used files."""
+    try:
+        EXTRACTED_TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(content, encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+
+        cached = sorted(EXTRACTED_TEXT_CACHE_DIR.glob("*.txt"), key=lambda p: p.stat().st_mtime)
+        for stale in cached[:-EXTRACTED_TEXT_CACHE_MAX_FILES]:
+            stale.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Could not cache extracted text: {e}")
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _load_document_cached(path_str: str, mtime: float, size: int, stop_after: str = "") -> dict:
+    """Read and extract a document's text, cached per (path, mtime, size, stop_after)."""
+    path = Path(path_str)
+    modified = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
+    partial = False
+    line_offset = 0
+
+    # Read content based on file type
+    suffix = path.suffix.lower()
+
+    # Full extractions from a previous run skip the parser (and any partial load)
+    cached_text = None
+    if suffix in EXTRACTED_DOCUMENT_TYPES:
+        cache_file = _extracted_text_cache_file(path_str, mtime, size)
+        cached_text = _read_extracted_text(cache_file)
+
+    if cached_text is not None:
+        content = cached_text
+        content_type = EXTRACTED_DOCUMENT_TYPES[suffix]
+
+    elif suffix in TEXT_DOCUMENT_SUFFIXES:
+        # Plain text files (large ones only around the chunk when one is given)
+        if stop_after:
+            content, partial, line_offset = _read_text_window(path, stop_after)
+        else:
+            content = path.read_text(encoding="utf-8", errors="replace")
+        content_type = "text"
+
+    elif suffix in [".pdf"]:
+        # PDF - extract text if possible
+        try:
+            if stop_after:
+                content, partial = _extract_pdf_until(path, stop_after)
+            else:
+                content = "\n\n".join(_iter_pdf_page_texts(path))
+            content_type = "pdf_extracted"
+        except:
+            content = f"[PDF file - {size} bytes - text extraction not available]"
+            content_type = "binary"
+
+    elif suffix in [".docx"]:
+        # Word doc - extract text if possible
+        try:
+            content = _extract_docx_text(path)
+            content_type = "docx_extracted"
+        except:
+            content = f"[Word document - {size} bytes - text extraction not available]"
+            content_type = "binary"
+
+    elif suffix in [".pptx"]:
+        # PowerPoint - extract text if possible
+        try:
+            content = _extract_pptx_text(path)
+            content_type = "pptx_extracted"
+        except:
+            content = f"[PowerPoint - {size} bytes - text extraction not available]"
+            content_type = "binary"
+
+    else:
+        # Unknown type - try to read as text
+        try:
             content = path.read_text(encoding="utf-8", errors="replace")
             content_type = "text"
+        except:
+            content = f"[Binary file - {size} bytes]"
+            content_type = "binary"
 
-        elif suffix in [".pdf"]:
-            # PDF - extract text if possible
-            try:
-                import pypdf
-                reader = pypdf.PdfReader(str(path))
-                content = "\n\n".join(page.extract_text() for page in reader.pages)
-                content_type = "pdf_extracted"
-            except:
-                content = f"[PDF file - {size} bytes - text extraction not available]"
-                content_type = "binary"
-
-        elif suffix in [".docx"]:
-            # Word doc - extract text if possible
-            try:
-                import docx
-                doc = docx.Document(str(path))
-                content = "\n\n".join(para.text for para in doc.paragraphs)
-                content_type = "docx_extracted"
-            except:
-                content = f"[Word document - {size} bytes - text extraction not available]"
-                content_type = "binary"
-
-        elif suffix in [".pptx"]:
-            # PowerPoint - extract text if possible
-            try:
-                from pptx import Presentation
-                prs = Presentation(str(path))
-                texts = []
-                for slide in prs.slides:
-                    for shape in slide.shapes:
-                        if hasattr(shape, "text"):
-                            texts.append(shape.text)
-                content = "\n\n".join(texts)
-                content_type = "pptx_extracted"
-            except:
-                content = f"[PowerPoint - {size} bytes - text extraction not available]"
-                content_type = "binary"
+    if suffix in EXTRACTED_DOCUMENT_TYPES and cached_text is None and content_type != "binary" and not partial:
+        _write_extracted_text(cache_file, content)
 
-        else:
-            # Unknown type - try to read as text
-            try:
-                content = path.read_text(encoding="utf-8", errors="replace")
-                content_type = "text"
-            except:
-                content = f"[Binary file - {size} bytes]"
-                content_type = "binary"
+    return {
+        "path": str(path),
+        "name": path.name,
+        "size": size,
+        "modified": modified,
+        "content": content,
+        "content_type": content_type,
+        "suffix": suffix,
+        "partial": partial,
+        "line_offset": line_offset
+    }
 
-        return {
-            "path": str(path),
-            "name": path.name,
-            "size": size,
-            "modified": modified,
-            "content": content,
-            "content_type": content_type,
-            "suffix": suffix
-        }
 
-    except Exception as e:
-        print(f"Error reading document: {e}")
-        return None
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=32)
+def _newline_offsets(document_content: str) -> np.ndarray:
+    """Sorted character offsets of every newline in a document."""
+    # UTF-32 gives one code unit per character, so indices are character offsets
+    codepoints = np.frombuffer(document_content.encode("utf-32-le"), dtype=np.uint32)
+    return np.flatnonzero(codepoints == ord("\n"))
+
+
+@lru_cache(maxsize=32)
+def _lowered_document(document_content: str) -> str | None:
+    """Lowercased document, or None when lowercasing would shift character offsets."""
+    lowered = document_content.lower()
+    return lowered if len(lowered) == len(document_content) else None
 
 
+def _find_whitespace_insensitive(document_content: str, needle: str) -> int:
+    """Case-insensitive search where each space in needle matches any whitespace run."""
+    words = [re.escape(word) for word in needle.split(' ') if word]
+    if not words:
+        return -1
+    match = re.search(r'\s+'.join(words), document_content, re.IGNORECASE)
+    return match.start() if match else -1
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
 def find_chunk_in_document(document_content: str, chunk_content: str) -> dict | None:
     """
     Find the approximate location of a chunk within the original document.
 
     Returns dict with line numbers and context, or None if not found.
     """
-    import re
-
     if not document_content or not chunk_content:
         return None
 
-    # Clean up for matching
-    doc_lower = document_content.lower()
+    # Most chunks are verbatim substrings of their source, so try plain
+    # substring searches before building any whitespace-insensitive pattern
+    probe = chunk_content[:100].strip()[:50]
+    pos = document_content.find(probe) if probe else -1
+    if pos == -1 and probe:
+        lowered = _lowered_document(document_content)
+        if lowered is not None:
+            pos = lowered.find(probe.lower())
+    if pos != -1:
+        return _chunk_location(document_content, chunk_content, pos)
 
     # Try to find the chunk content (first 100 chars for matching)
     search_text = chunk_content[:100].lower().strip()
 
-    # Remove extra whitespace for fuzzy matching
-    search_text_normalized = re.sub(r'\s+', ' ', search_text)
-    doc_normalized = re.sub(r'\s+', ' ', doc_lower)
+    # Remove extra whitespace for fuzzy matching; the document itself is not
+    # copied - runs of whitespace in the needle match any whitespace run in it
+    search_text_normalized = _WHITESPACE_RE.sub(' ', search_text)
 
-    pos = doc_normalized.find(search_text_normalized[:50])
+    pos = _find_whitespace_insensitive(document_content, search_text_normalized[:50])
 
     if pos == -1:
         # Try with even shorter match
-        pos = doc_normalized.find(search_text_normalized[:30])
+        pos = _find_whitespace_insensitive(document_content, search_text_normalized[:30])
 
     if pos == -1:
         return None
 
-    # Calculate approximate line number
-    text_before = document_content[:pos]
-    start_line = text_before.count('\n') + 1
+    return _chunk_location(document_content, chunk_content, pos)
+
+
+def _chunk_location(document_content: str, chunk_content: str, pos: int) -> dict:
+    """Line span of a chunk found at character offset pos."""
+    # Calculate approximate line number (newlines before pos, by binary search)
+    start_line = int(np.searchsorted(_newline_offsets(document_content), pos)) + 1
 
     # Estimate end line
     chunk_lines = chunk_content.count('\n')
@@ -1037,8 +1709,8 @@ def render_original_document_viewer(source: dict, chunk_content: str, unique_key
         st.caption("Original document path not available")
         return
 
-    # Load document
-    doc = get_original_document(source_path)
+    # Load document (PDFs stop extracting shortly after the chunk is found)
+    doc = get_original_document(source_path, chunk_hint=chunk_content)
 
     if not doc:
         st.warning(f"Could not load original document: {source_path}")
@@ -1056,7 +1728,8 @@ def render_original_document_viewer(source: dict, chunk_content: str, unique_key
     col3.caption(f"Type: {doc['content_type']}")
 
     if location:
-        st.caption(f"📍 Chunk location: Lines {location['start_line']}-{location['end_line']} (approx)")
+        line_offset = doc.get("line_offset", 0)
+        st.caption(f"📍 Chunk location: Lines {location['start_line'] + line_offset}-{location['end_line'] + line_offset} (approx)")
 
     # Content display
     content = doc["content"]
@@ -1084,13 +1757,18 @@ def render_original_document_viewer(source: dict, chunk_content: str, unique_key
         key=f"doc_content_{unique_key}" if unique_key else f"doc_content_{source.get('id', 'unknown')}"
     )
 
-    if truncated:
+    if truncated or doc.get("partial"):
         st.caption("Document truncated for display. Download for full content.")
 
-    # Download button
+    # Download button (a partially extracted PDF is fully extracted only on download)
+    if doc.get("partial"):
+        download_data = lambda: (get_original_document(source_path) or {}).get("content", "")
+    else:
+        download_data = doc["content"]
+
     st.download_button(
         "📥 Download Full Document",
-        doc["content"],
+        download_data,
         file_name=doc["name"],
         mime="text/plain",
         key=f"download_{unique_key}" if unique_key else f"download_{source.get('id', 'unknown')}"
@@ -1111,7 +1789,7 @@ def render_assessment_detail(assessment_id: str):
             st.caption(f"Assessment {assessment_id} not found")
             return
 
-        data = assessment.__dict__ if hasattr(assessment, '__dict__') else assessment
+        data = assessment
 
         st.markdown(f"**Type:** {data.get('assessment_type', 'Unknown')}")
         st.markdown(f"**Created:** {data.get('created_at', 'Unknown')[:10]}")
@@ -1145,7 +1823,7 @@ def render_roadmap_item_detail(item_id: str):
             st.caption(f"Roadmap item {item_id} not found")
             return
 
-        data = item.__dict__ if hasattr(item, '__dict__') else item
+        data = item
 
         st.markdown(f"### {data.get('name', 'Unknown')}")
         st.markdown(f"**Horizon:** {data.get('horizon', 'Unknown')}")
@@ -1261,10 +1939,11 @@ def render_question_validation(question: dict):
                 st.rerun()
 
 
-def render_validation_stats():
-    """Render validation statistics."""
+def render_validation_stats(questions: list[dict] | None = None):
+    """Render validation statistics. Pass questions to reuse an already loaded list."""
 
-    questions = load_questions()
+    if questions is None:
+        questions = load_questions()
 
     # Filter out None values and ensure dict structure
     questions = [q for q in questions if q is not None and isinstance(q, dict)]
@@ -1300,46 +1979,56 @@ def render_validation_stats():
 
 def cosine_similarity(vec1: list, vec2: list) -> float:
     """Calculate cosine similarity between two vectors."""
-    import math
-
-    if not vec1 or not vec2 or len(vec1) != len(vec2):
+    if len(vec1) == 0 or len(vec2) == 0 or len(vec1) != len(vec2):
         return 0.0
 
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    magnitude1 = math.sqrt(sum(a * a for a in vec1))
-    magnitude2 = math.sqrt(sum(b * b for b in vec2))
+    a = np.asarray(vec1, dtype=np.float32)
+    b = np.asarray(vec2, dtype=np.float32)
+    magnitude = float(np.linalg.norm(a) * np.linalg.norm(b))
 
-    if magnitude1 == 0 or magnitude2 == 0:
+    if magnitude == 0:
         return 0.0
 
-    return dot_product / (magnitude1 * magnitude2)
+    return float(a @ b) / magnitude
 
 
-def gather_generation_context() -> dict:
-    """Gather all context needed for question generation."""
+def gather_generation_context(questions: list[dict] | None = None) -> dict:
+    """Gather all context needed for question generation. Pass questions to reuse an already loaded list."""
+
+    # The sources are independent file/table reads, so overlap them
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        questions_future = executor.submit(load_questions) if questions is None else None
+        decisions_future = executor.submit(load_decisions)
+        graph_future = executor.submit(load_unified_graph)
+        arch_future = executor.submit(load_alignment_analysis)
+        competitive_future = executor.submit(load_analyst_assessments)
+        lens_future = executor.submit(get_chunks_by_lens_count)
+
+    if questions_future is not None:
+        questions = questions_future.result()
 
     context = {
         # Questions
-        "existing_questions": load_questions(),
-        "pending_questions": [q for q in load_questions() if q.get("status") == "pending"],
-        "answered_questions": [q for q in load_questions() if q.get("status") == "answered"],
+        "existing_questions": questions,
+        "pending_questions": [q for q in questions if q.get("status") == "pending"],
+        "answered_questions": [q for q in questions if q.get("status") == "answered"],
 
         # Decisions
-        "active_decisions": [d for d in load_decisions() if d.get("status") == "active"],
+        "active_decisions": [d for d in decisions_future.result() if d.get("status") == "active"],
 
         # Graph
-        "graph": UnifiedContextGraph.load(),
+        "graph": graph_future.result(),
 
         # Assessments
-        "arch_assessments": load_alignment_analysis() or [],
-        "competitive_assessments": load_analyst_assessments() or [],
+        "arch_assessments": arch_future.result() or [],
+        "competitive_assessments": competitive_future.result() or [],
 
         # Roadmap
         "roadmap": None,  # Will be loaded from graph
         "roadmap_items": [],
 
         # Source stats
-        "chunks_by_lens": get_chunks_by_lens_count(),
+        "chunks_by_lens": lens_future.result(),
     }
 
     # Extract roadmap items from graph
@@ -1347,8 +2036,7 @@ def gather_generation_context() -> dict:
     if graph:
         roadmap_items_nodes = graph.node_indices.get("roadmap_item", {})
         context["roadmap_items"] = []
-        for item_id, item_node in roadmap_items_nodes.items():
-            item_data = item_node.__dict__ if hasattr(item_node, '__dict__') else item_node
+        for item_id, item_data in roadmap_items_nodes.items():
             context["roadmap_items"].append({
                 "id": item_id,
                 "name": item_data.get("name", "Unknown"),
@@ -1360,6 +2048,20 @@ def gather_generation_context() -> dict:
     return context
 
 
+# Keyword groups whose presence on both sides of a topic overlap signals a possible conflict
+_CONTRADICTION_KEYWORDS = (
+    ("q1", "q2", "q3", "q4"),  # Timeline conflicts
+    ("will", "won't", "can", "cannot", "can't"),  # Capability conflicts
+    ("priority", "deprioritize"),  # Priority conflicts
+    ("before", "after"),  # Sequence conflicts
+)
+
+# One alternation per group (substring match, same as `kw in content`)
+_CONTRADICTION_GROUP_RES = tuple(
+    re.compile("|".join(map(re.escape, group))) for group in _CONTRADICTION_KEYWORDS
+)
+
+
 def find_contradictions(graph) -> list[dict]:
     """
     Find contradictory statements in the graph.
@@ -1375,56 +2077,53 @@ def find_contradictions(graph) -> list[dict]:
     chunks = list(graph.node_indices.get("chunk", {}).values())
 
     # Compare your-voice chunks against team chunks
-    your_voice_chunks = [c for c in chunks if getattr(c, 'lens', c.get('lens')) == 'your-voice']
-    team_chunks = [c for c in chunks if getattr(c, 'lens', c.get('lens')) in ['team-structured', 'team-conversational', 'engineering']]
-
-    # Look for topic overlap with different statements
-    contradiction_keywords = [
-        ("q1", "q2", "q3", "q4"),  # Timeline conflicts
-        ("will", "won't", "can", "cannot", "can't"),  # Capability conflicts
-        ("priority", "deprioritize"),  # Priority conflicts
-        ("before", "after"),  # Sequence conflicts
-    ]
-
-    for yv_chunk in your_voice_chunks[:20]:  # Limit for performance
-        yv_content = getattr(yv_chunk, 'content', yv_chunk.get('content', '')).lower()
-        yv_id = getattr(yv_chunk, 'id', yv_chunk.get('id', ''))
-        yv_source = getattr(yv_chunk, 'source_name', yv_chunk.get('source_name', ''))
-
-        for team_chunk in team_chunks[:50]:
-            team_content = getattr(team_chunk, 'content', team_chunk.get('content', '')).lower()
-            team_id = getattr(team_chunk, 'id', team_chunk.get('id', ''))
-            team_source = getattr(team_chunk, 'source_name', team_chunk.get('source_name', ''))
-            team_lens = getattr(team_chunk, 'lens', team_chunk.get('lens', ''))
-
-            # Check for topic overlap (shared important terms)
-            yv_terms = set(extract_key_terms_simple(yv_content))
-            team_terms = set(extract_key_terms_simple(team_content))
-
-            overlap = yv_terms & team_terms
-
-            if len(overlap) >= 3:  # Significant topic overlap
-                # Check for potential contradiction signals
-                for keyword_group in contradiction_keywords:
-                    yv_has = any(kw in yv_content for kw in keyword_group)
-                    team_has = any(kw in team_content for kw in keyword_group)
-
-                    if yv_has and team_has:
-                        # Potential contradiction found
-                        topic = ", ".join(list(overlap)[:3])
-
-                        contradictions.append({
-                            "topic": topic,
-                            "chunk_a_id": yv_id,
-                            "source_a": yv_source,
-                            "lens_a": "your-voice",
-                            "statement_a": getattr(yv_chunk, 'content', yv_chunk.get('content', ''))[:150],
-                            "chunk_b_id": team_id,
-                            "source_b": team_source,
-                            "lens_b": team_lens,
-                            "statement_b": getattr(team_chunk, 'content', team_chunk.get('content', ''))[:150],
-                        })
-                        break  # One contradiction per chunk pair
+    your_voice_chunks = [c for c in chunks if c.get('lens') == 'your-voice'][:20]  # Limit for performance
+    team_chunks = [c for c in chunks if c.get('lens') in ['team-structured', 'team-conversational', 'engineering']][:50]
+
+    def contradiction_signals(content: str) -> tuple:
+        return tuple(bool(group_re.search(content)) for group_re in _CONTRADICTION_GROUP_RES)
+
+    # Extract terms and signals once per team chunk, and index team chunks by term
+    team_terms = []
+    team_signals = []
+    term_to_team = defaultdict(list)
+    for j, team_chunk in enumerate(team_chunks):
+        team_content = team_chunk.get('content', '').lower()
+        terms = set(extract_key_terms_simple(team_content))
+        team_terms.append(terms)
+        team_signals.append(contradiction_signals(team_content))
+        for term in terms:
+            term_to_team[term].append(j)
+
+    for yv_chunk in your_voice_chunks:
+        yv_content = yv_chunk.get('content', '').lower()
+        yv_terms = set(extract_key_terms_simple(yv_content))
+        yv_signals = contradiction_signals(yv_content)
+
+        # Only team chunks sharing at least 3 terms can have significant topic overlap
+        shared_counts = Counter(j for term in yv_terms for j in term_to_team.get(term, ()))
+        candidates = sorted(j for j, count in shared_counts.items() if count >= 3)
+
+        for j in candidates:
+            team_chunk = team_chunks[j]
+
+            # Check for potential contradiction signals
+            if any(yv_has and team_has for yv_has, team_has in zip(yv_signals, team_signals[j])):
+                # Potential contradiction found (one per chunk pair)
+                overlap = yv_terms & team_terms[j]
+                topic = ", ".join(list(overlap)[:3])
+
+                contradictions.append({
+                    "topic": topic,
+                    "chunk_a_id": yv_chunk.get('id', ''),
+                    "source_a": yv_chunk.get('source_name', ''),
+                    "lens_a": "your-voice",
+                    "statement_a": yv_chunk.get('content', '')[:150],
+                    "chunk_b_id": team_chunk.get('id', ''),
+                    "source_b": team_chunk.get('source_name', ''),
+                    "lens_b": team_chunk.get('lens', ''),
+                    "statement_b": team_chunk.get('content', '')[:150],
+                })
 
     # Deduplicate similar contradictions
     seen_topics = set()
@@ -1438,6 +2137,10 @@ def find_contradictions(graph) -> list[dict]:
     return unique_contradictions[:5]  # Limit to top 5
 
 
+# Roadmap horizons in delivery order
+HORIZON_ORDER = {"now": 0, "next": 1, "later": 2, "future": 3}
+
+
 def derive_questions_from_graph(context: dict) -> list[dict]:
     """
     Automatically derive questions from graph analysis.
@@ -1489,18 +2192,27 @@ def derive_questions_from_graph(context: dict) -> list[dict]:
         })
 
     # === PATTERN 2: Missing Engineering Coverage ===
+    # Lowercase chunk content once and index which chunks contain each item
+    # word, so words shared between roadmap items are only scanned for once
+    chunks = list(graph.node_indices.get("chunk", {}).values())
+    chunk_content_lower = [chunk.get('content', '').lower() for chunk in chunks]
+    chunks_with_word = {}
+
     for item in roadmap_items[:10]:  # Limit for performance
         # Get supporting chunks for this item
         item_name_lower = item['name'].lower()
-        supporting_chunks = []
+        supporting_indices = set()
 
-        chunks = list(graph.node_indices.get("chunk", {}).values())
-        for chunk in chunks:
-            chunk_content = getattr(chunk, 'content', chunk.get('content', '')).lower()
-            if any(word in chunk_content for word in item_name_lower.split()[:3]):
-                supporting_chunks.append(chunk)
+        for word in item_name_lower.split()[:3]:
+            if word not in chunks_with_word:
+                chunks_with_word[word] = {
+                    i for i, content in enumerate(chunk_content_lower) if word in content
+                }
+            supporting_indices |= chunks_with_word[word]
 
-        has_engineering = any(getattr(c, 'lens', c.get('lens')) == 'engineering' for c in supporting_chunks)
+        supporting_chunks = [chunks[i] for i in sorted(supporting_indices)]
+
+        has_engineering = any(c.get('lens') == 'engineering' for c in supporting_chunks)
 
         if not has_engineering and item.get("horizon") in ["now", "next"]:
             derived_questions.append({
@@ -1520,26 +2232,30 @@ def derive_questions_from_graph(context: dict) -> list[dict]:
                     "evidence": [{
                         "roadmap_item": item["name"],
                         "horizon": item.get("horizon"),
-                        "lenses_present": list(set(getattr(c, 'lens', c.get('lens')) for c in supporting_chunks)) if supporting_chunks else [],
+                        "lenses_present": list(set(c.get('lens') for c in supporting_chunks)) if supporting_chunks else [],
                         "missing_lens": "engineering"
                     }]
                 }
             })
 
     # === PATTERN 3: Dependency Conflicts ===
-    horizon_order = {"now": 0, "next": 1, "later": 2, "future": 3}
+    # First item wins on duplicate names, as with the previous linear search
+    items_by_name = {}
+    for roadmap_item in roadmap_items:
+        items_by_name.setdefault(roadmap_item["name"], roadmap_item)
 
     for item in roadmap_items[:10]:
         dependencies = item.get("dependencies", [])
         item_horizon = item.get("horizon", "future")
+        item_horizon_rank = HORIZON_ORDER.get(item_horizon, 3)
 
         for dep_name in dependencies:
-            dep_item = next((i for i in roadmap_items if i["name"] == dep_name), None)
+            dep_item = items_by_name.get(dep_name)
             if dep_item:
                 dep_horizon = dep_item.get("horizon", "future")
 
                 # Check if dependency is in a later horizon
-                if horizon_order.get(dep_horizon, 3) > horizon_order.get(item_horizon, 3):
+                if HORIZON_ORDER.get(dep_horizon, 3) > item_horizon_rank:
                     derived_questions.append({
                         "question": f"'{item['name']}' is in {item_horizon} but depends on "
                                    f"'{dep_name}' which is in {dep_horizon}. How will this work?",
@@ -1565,8 +2281,7 @@ def derive_questions_from_graph(context: dict) -> list[dict]:
 
     # === PATTERN 4: Unaddressed Gaps ===
     gaps = list(graph.node_indices.get("gap", {}).values())[:10]  # Limit for performance
-    for gap in gaps:
-        gap_data = gap.__dict__ if hasattr(gap, '__dict__') else gap
+    for gap_data in gaps:
 
         # Check if gap has been addressed by a decision
         addressed_by = gap_data.get("addressed_by_decision")
@@ -1624,7 +2339,6 @@ def generate_llm_questions(context: dict) -> list[dict]:
     """
     Use Claude to generate questions based on full context.
     """
-    import anthropic
 
     # Build context summary for prompt
     roadmap_summary = "\n".join([
@@ -1723,10 +2437,6 @@ Generate 3-8 questions depending on complexity. Quality over quantity.
         return []
 
     try:
-        import httpx
-        import json
-        import re
-
         # Create client with SSL verification disabled for development
         http_client = httpx.Client(verify=False)
 
@@ -1795,6 +2505,10 @@ def deduplicate_questions(
                     "embedding": eq_embedding
                 }
 
+    # One matrix of existing embeddings so each new question is a single matvec
+    existing_entries = list(existing_embeddings.values())
+    existing_matrix = np.asarray([e["embedding"] for e in existing_entries], dtype=np.float32)
+
     for new_q in new_questions:
         new_embedding = get_embedding(new_q.get("question", ""))
         if not new_embedding:
@@ -1805,16 +2519,20 @@ def deduplicate_questions(
         best_match = None
         best_similarity = 0
 
-        for eq_id, eq_data in existing_embeddings.items():
-            similarity = cosine_similarity(new_embedding, eq_data["embedding"])
+        if existing_entries:
+            similarities = cosine_similarity_batch(
+                np.asarray([new_embedding], dtype=np.float32), existing_matrix
+            )[0]
 
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = eq_data["question"]
+            # Same result as scanning in order and stopping at the first duplicate
+            hits = np.flatnonzero(similarities >= similarity_threshold)
+            is_duplicate = hits.size > 0
+            scanned = similarities[:hits[0] + 1] if is_duplicate else similarities
+            best_index = int(np.argmax(scanned))
 
-            if similarity >= similarity_threshold:
-                is_duplicate = True
-                break
+            if scanned[best_index] > 0:
+                best_similarity = float(scanned[best_index])
+                best_match = existing_entries[best_index]["question"]
 
         if is_duplicate:
             duplicates.append({
@@ -1846,6 +2564,24 @@ def mark_obsolete_questions(
 
     newly_obsolete = []
 
+    # Embed active decisions once rather than once per question
+    active_decisions = []
+    decision_embeddings = []
+    for decision in decisions:
+        if decision.get("status") != "active":
+            continue
+
+        decision_text = f"{decision.get('decision', '')} {decision.get('rationale', '')}"
+        decision_embedding = get_embedding(decision_text)
+        if decision_embedding:
+            active_decisions.append(decision)
+            decision_embeddings.append(decision_embedding)
+
+    if not active_decisions:
+        return newly_obsolete
+
+    decision_matrix = np.asarray(decision_embeddings, dtype=np.float32)
+
     for question in existing_questions:
         if question.get("status") in ["obsolete", "answered"]:
             continue
@@ -1855,27 +2591,21 @@ def mark_obsolete_questions(
         if not question_embedding:
             continue
 
-        for decision in decisions:
-            if decision.get("status") != "active":
-                continue
-
-            decision_text = f"{decision.get('decision', '')} {decision.get('rationale', '')}"
-            decision_embedding = get_embedding(decision_text)
-            if not decision_embedding:
-                continue
+        similarities = cosine_similarity_batch(
+            np.asarray([question_embedding], dtype=np.float32), decision_matrix
+        )[0]
+        matches = np.flatnonzero(similarities > 0.75)
 
-            similarity = cosine_similarity(question_embedding, decision_embedding)
+        if matches.size:
+            # First matching decision likely resolves this question
+            decision = active_decisions[matches[0]]
+            question["status"] = "obsolete"
+            question["lifecycle"] = question.get("lifecycle", {})
+            question["lifecycle"]["obsoleted_at"] = datetime.now().isoformat()
+            question["lifecycle"]["obsoleted_by"] = decision.get("id")
+            question["lifecycle"]["obsolete_reason"] = f"Resolved by decision: {decision.get('decision', '')[:50]}..."
 
-            if similarity > 0.75:
-                # Decision likely resolves this question
-                question["status"] = "obsolete"
-                question["lifecycle"] = question.get("lifecycle", {})
-                question["lifecycle"]["obsoleted_at"] = datetime.now().isoformat()
-                question["lifecycle"]["obsoleted_by"] = decision.get("id")
-                question["lifecycle"]["obsolete_reason"] = f"Resolved by decision: {decision.get('decision', '')[:50]}..."
-
-                newly_obsolete.append(question)
-                break
+            newly_obsolete.append(question)
 
     return newly_obsolete
 
@@ -2011,7 +2741,6 @@ def extract_topics(query: str) -> List[str]:
 
 def extract_keywords(query: str) -> List[str]:
     """Extract important keywords from query."""
-    import re
 
     # Remove stop words
     stop_words = {
@@ -2119,7 +2848,7 @@ def expand_via_chunk_graph(seed_chunk_ids: List[str], max_hops: int = 1) -> List
     Uses BFS to traverse chunk relationships.
     """
     try:
-        graph = ContextGraph().load()
+        graph = load_chunk_graph()
         if not graph or not graph.graph:
             return []
 
@@ -2166,7 +2895,7 @@ def traverse_unified_graph(seed_chunk_ids: List[str], topics: List[str], max_hop
     Returns nodes organized by type (decision, question, assessment, roadmap_item, gap).
     """
     try:
-        graph = UnifiedContextGraph.load()
+        graph = load_unified_graph()
         if not graph or not graph.graph:
             return {}
 
@@ -2267,10 +2996,14 @@ def traverse_unified_graph(seed_chunk_ids: List[str], topics: List[str], max_hop
         return {}
 
 
-def retrieve_full_context(parsed_query: ParsedQuery, top_k: int = 20) -> RetrievalResult:
+def retrieve_full_context(parsed_query: ParsedQuery, top_k: int = 20,
+                           query_embedding: Optional[List[float]] = None) -> RetrievalResult:
     """
     Main retrieval function that orchestrates multi-source retrieval.
 
+    query_embedding, if given, is the semantic search vector; otherwise the
+    query keywords are embedded.
+
     Process:
     1. Semantic search in LanceDB using query keywords
     2. Expand via chunk context graph (BFS, max_hops=1)
@@ -2280,7 +3013,7 @@ def retrieve_full_context(parsed_query: ParsedQuery, top_k: int = 20) -> Retriev
 
     # Step 1: Semantic search in LanceDB
     search_query = " ".join(parsed_query.keywords)
-    chunks = retrieve_chunks(search_query, top_k=top_k)
+    chunks = retrieve_chunks(search_query, top_k=top_k, query_embedding=query_embedding)
 
     # Extract chunk IDs
     chunk_ids = [c.get("id", "") for c in chunks if c.get("id")]
@@ -2402,10 +3135,66 @@ def assemble_context_for_synthesis(retrieval: RetrievalResult) -> str:
     return "\n".join(context_parts)
 
 
-def synthesize_answer(parsed_query: ParsedQuery, context: str) -> Dict:
+# Task and output format for synthesize_answer, identical for every query.
+# Still sent with every call: at ~300 tokens it is below the prompt-caching
+# minimum, so no cache_control is set
+SYNTHESIS_SYSTEM_PROMPT = """You are a product roadmap assistant. Answer the user's question based on the provided context.
+
+## YOUR TASK
+
+Provide a comprehensive answer that:
+
+1. **Directly answers the question** based on the context
+2. **Cites specific sources** by authority level (e.g., "According to Decision X..." or "Based on the your-voice document...")
+3. **Highlights conflicts** if information contradicts across authority levels
+4. **Acknowledges gaps** if the context doesn't fully answer the question
+5. **Provides confidence level** (high/medium/low) based on source quality and completeness
+
+## OUTPUT FORMAT
+
+Answer:
+[Your comprehensive answer here, with source citations]
+
+Confidence: [high/medium/low]
+Reasoning: [Why this confidence level]
+
+Related Pending Questions:
+- [Question 1 from pending questions that relates to this topic]
+- [Question 2]
+
+Suggested Follow-ups:
+- [Follow-up question 1 the user might want to ask]
+- [Follow-up question 2]
+
+Keep the answer focused and actionable. Cite sources explicitly."""
+
+# Re-render the live answer at most every 50ms (~20Hz), and only once 8+ new characters arrived
+STREAM_RENDER_INTERVAL = 0.05
+STREAM_RENDER_MIN_CHARS = 8
+
+# Section markers synthesize_answer asks Claude to use in its response
+CONFIDENCE_MARKER = "Confidence:"
+RELATED_QUESTIONS_MARKER = "Related Pending Questions:"
+FOLLOW_UPS_MARKER = "Suggested Follow-ups:"
+
+
+def _bullet_items(section: str, limit: int = 3) -> list[str]:
+    """The first `limit` "-" or "* " bullet items of a response section."""
+    bullets = (
+        line[1:].strip()  # drop only the bullet marker, keeping any bold markup
+        for line in map(str.strip, section.splitlines())
+        if line.startswith(("-", "* "))
+    )
+    return list(islice(bullets, limit))
+
+
+def synthesize_answer(parsed_query: ParsedQuery, context: str, placeholder=None) -> Dict:
     """
     Use Claude to synthesize an answer from the assembled context.
 
+    If placeholder (an st.empty()) is given, the response is shown in it as
+    it streams in and cleared once complete.
+
     Returns:
     {
         "answer": str,
@@ -2415,9 +3204,6 @@ def synthesize_answer(parsed_query: ParsedQuery, context: str) -> Dict:
         "follow_ups": List[str]
     }
     """
-    import anthropic
-    import httpx
-
     # Check for API key
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
@@ -2429,10 +3215,8 @@ def synthesize_answer(parsed_query: ParsedQuery, context: str) -> Dict:
             "follow_ups": []
         }
 
-    # Build synthesis prompt
-    prompt = f"""You are a product roadmap assistant. Answer the user's question based on the provided context.
-
-## USER QUESTION
+    # Build synthesis prompt (the instructions are the shared system prompt)
+    prompt = f"""## USER QUESTION
 {parsed_query.original}
 
 ## QUERY ANALYSIS
@@ -2444,37 +3228,7 @@ def synthesize_answer(parsed_query: ParsedQuery, context: str) -> Dict:
 The context below is organized from highest authority (decisions) to lowest (pending questions).
 When sources conflict, prioritize higher authority sources.
 
-{context}
-
----
-
-## YOUR TASK
-
-Provide a comprehensive answer that:
-
-1. **Directly answers the question** based on the context
-2. **Cites specific sources** by authority level (e.g., "According to Decision X..." or "Based on the your-voice document...")
-3. **Highlights conflicts** if information contradicts across authority levels
-4. **Acknowledges gaps** if the context doesn't fully answer the question
-5. **Provides confidence level** (high/medium/low) based on source quality and completeness
-
-## OUTPUT FORMAT
-
-Answer:
-[Your comprehensive answer here, with source citations]
-
-Confidence: [high/medium/low]
-Reasoning: [Why this confidence level]
-
-Related Pending Questions:
-- [Question 1 from pending questions that relates to this topic]
-- [Question 2]
-
-Suggested Follow-ups:
-- [Follow-up question 1 the user might want to ask]
-- [Follow-up question 2]
-
-Keep the answer focused and actionable. Cite sources explicitly."""
+{context}"""
 
     try:
         # Create client with SSL bypass
@@ -2483,13 +3237,28 @@ Keep the answer focused and actionable. Cite sources explicitly."""
         try:
             client = anthropic.Anthropic(api_key=api_key, http_client=http_client)
 
-            message = client.messages.create(
+            parts = []
+            streamed_chars = rendered_chars = 0
+            last_render = 0.0
+            with client.messages.stream(
                 model="claude-sonnet-4-5-20250929",
                 max_tokens=3000,
+                system=SYNTHESIS_SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": prompt}]
-            )
-
-            response_text = message.content[0].text
+            ) as stream:
+                for text in stream.text_stream:
+                    parts.append(text)
+                    streamed_chars += len(text)
+                    # Coalesce tokens rather than re-rendering on every one
+                    if placeholder is not None and streamed_chars - rendered_chars >= STREAM_RENDER_MIN_CHARS:
+                        now = time.monotonic()
+                        if now - last_render >= STREAM_RENDER_INTERVAL:
+                            placeholder.markdown("".join(parts) + " ▌")
+                            rendered_chars, last_render = streamed_chars, now
+
+            response_text = "".join(parts)
+            if placeholder is not None:
+                placeholder.empty()
 
             # Parse response
             answer_text = response_text
@@ -2497,50 +3266,46 @@ Keep the answer focused and actionable. Cite sources explicitly."""
             related_questions = []
             follow_ups = []
 
-            # Extract confidence if present
-            if "Confidence:" in response_text:
-                lines = response_text.split("\n")
-                for i, line in enumerate(lines):
-                    if line.startswith("Confidence:"):
-                        conf_line = line.replace("Confidence:", "").strip().lower()
-                        if "high" in conf_line:
-                            confidence = "high"
-                        elif "low" in conf_line:
-                            confidence = "low"
-                        else:
-                            confidence = "medium"
-
-                        # Extract answer (everything before Confidence)
-                        answer_text = "\n".join(lines[:i]).strip()
-                        break
-
-            # Extract related questions
-            if "Related Pending Questions:" in response_text:
-                section = response_text.split("Related Pending Questions:")[1]
-                if "Suggested Follow-ups:" in section:
-                    section = section.split("Suggested Follow-ups:")[0]
-
-                related_questions = [
-                    line.strip("- ").strip()
-                    for line in section.split("\n")
-                    if line.strip().startswith("-")
-                ]
+            # Locate each section marker once and slice by offset
+            conf_at = response_text.find("\n" + CONFIDENCE_MARKER)
+            if response_text.startswith(CONFIDENCE_MARKER):
+                conf_at = 0
+            elif conf_at != -1:
+                conf_at += 1  # skip the newline
+            related_at = response_text.find(RELATED_QUESTIONS_MARKER)
+            follow_ups_at = response_text.find(FOLLOW_UPS_MARKER)
+
+            # Extract confidence if present (a line starting with the marker)
+            if conf_at != -1:
+                conf_end = response_text.find("\n", conf_at)
+                conf_line = response_text[conf_at + len(CONFIDENCE_MARKER):conf_end if conf_end != -1 else None]
+                conf_line = conf_line.replace(CONFIDENCE_MARKER, "").strip().lower()
+                if "high" in conf_line:
+                    confidence = "high"
+                elif "low" in conf_line:
+                    confidence = "low"
+                else:
+                    confidence = "medium"
+
+                # Extract answer (everything before Confidence)
+                answer_text = response_text[:conf_at].strip()
+
+            # Extract related questions (up to the follow-ups, if they come later)
+            if related_at != -1:
+                section_start = related_at + len(RELATED_QUESTIONS_MARKER)
+                section_end = response_text.find(FOLLOW_UPS_MARKER, section_start)
+                related_questions = _bullet_items(response_text[section_start:section_end if section_end != -1 else None])
 
             # Extract follow-ups
-            if "Suggested Follow-ups:" in response_text:
-                section = response_text.split("Suggested Follow-ups:")[1]
-                follow_ups = [
-                    line.strip("- ").strip()
-                    for line in section.split("\n")
-                    if line.strip().startswith("-")
-                ]
+            if follow_ups_at != -1:
+                follow_ups = _bullet_items(response_text[follow_ups_at + len(FOLLOW_UPS_MARKER):])
 
             return {
                 "answer": answer_text,
                 "confidence": confidence,
                 "sources_cited": [],  # Could parse from answer text if needed
-                "related_questions": related_questions[:3],
-                "follow_ups": follow_ups[:3]
+                "related_questions": related_questions,
+                "follow_ups": follow_ups
             }
         finally:
             http_client.close()
@@ -2555,10 +3320,13 @@ Keep the answer focused and actionable. Cite sources explicitly."""
         }
 
 
-def ask_roadmap(query: str) -> Dict:
+def ask_roadmap(query: str, placeholder=None, query_embedding: Optional[List[float]] = None) -> Dict:
     """
     Main entry point for Ask Your Roadmap feature.
 
+    placeholder, if given, shows the answer while it streams in.
+    query_embedding, if given, is passed on to retrieve_full_context().
+
     Process:
     1. Parse query
     2. Retrieve full context
@@ -2571,13 +3339,13 @@ def ask_roadmap(query: str) -> Dict:
     parsed_query = parse_query(query)
 
     # Step 2: Retrieve full context
-    retrieval = retrieve_full_context(parsed_query, top_k=20)
+    retrieval = retrieve_full_context(parsed_query, top_k=20, query_embedding=query_embedding)
 
     # Step 3: Assemble context
     context = assemble_context_for_synthesis(retrieval)
 
     # Step 4: Synthesize answer
-    result = synthesize_answer(parsed_query, context)
+    result = synthesize_answer(parsed_query, context, placeholder=placeholder)
 
     # Step 5: Add metadata
     result["query_analysis"] = {
@@ -2587,38 +3355,135 @@ def ask_roadmap(query: str) -> Dict:
         "time_context": parsed_query.time_context
     }
 
+    nodes = retrieval.unified_graph_nodes
     result["retrieval_stats"] = {
         "chunks": len(retrieval.chunks),
         "chunk_graph_nodes": len(retrieval.chunk_graph_nodes),
-        "decisions": len(retrieval.unified_graph_nodes.get("decision", [])),
-        "answered_questions": len(retrieval.unified_graph_nodes.get("answered_question", [])),
-        "assessments": len(retrieval.unified_graph_nodes.get("assessment", [])),
-        "roadmap_items": len(retrieval.unified_graph_nodes.get("roadmap_item", [])),
-        "gaps": len(retrieval.unified_graph_nodes.get("gap", [])),
-        "pending_questions": len(retrieval.unified_graph_nodes.get("pending_question", []))
+        "decisions": len(nodes.get("decision", ())),
+        "answered_questions": len(nodes.get("answered_question", ())),
+        "assessments": len(nodes.get("assessment", ())),
+        "roadmap_items": len(nodes.get("roadmap_item", ())),
+        "gaps": len(nodes.get("gap", ())),
+        "pending_questions": len(nodes.get("pending_question", ()))
     }
 
     return result
 
 
+# Answers to questions at least this similar (cosine) to an earlier one are reused
+ANSWER_CACHE_SIMILARITY = 0.92
+ANSWER_CACHE_TTL_SECONDS = 3600
+ANSWER_CACHE_MAX_ENTRIES = 256
+
+
+@st.cache_resource
+def _answer_cache() -> dict:
+    """Normalized question embeddings and their answers, shared across sessions"""
+    return {"lock": threading.Lock(), "vectors": None, "results": [], "times": [], "knowledge": None}
+
+
+def _knowledge_signature() -> tuple:
+    """Changes whenever anything an answer is built from changes"""
+    return (
+        get_chunk_table_signature(),
+        _chunk_graph_signature(),
+        _unified_graph_signature(),
+        _store_signature("questions.json"),
+        _store_signature("answers.json"),
+        _store_signature("decisions.json"),
+    )
+
+
+def ask_roadmap_cached(query: str, placeholder=None) -> Dict:
+    """
+    ask_roadmap() with a semantic cache: a question whose embedding is close
+    enough to one answered in the last hour, against the same indexed
+    knowledge, reuses that answer instead of retrieving and synthesizing again.
+    On a miss the same embedding is the retrieval search vector.
+    """
+    try:
+        embedding = embed_query(query)
+        vector = np.asarray(embedding, dtype=np.float32)
+        vector /= np.linalg.norm(vector)
+    except Exception:
+        # No embedding, no cache lookup
+        return ask_roadmap(query, placeholder=placeholder)
+
+    cache = _answer_cache()
+    knowledge = _knowledge_signature()
+    with cache["lock"]:
+        now = time.time()
+        # Drop everything on a knowledge change, and expired entries lazily
+        if cache["knowledge"] != knowledge:
+            cache.update(vectors=np.empty((0, vector.size), dtype=np.float32), results=[], times=[],
+                         knowledge=knowledge)
+        else:
+            keep = [i for i, t in enumerate(cache["times"]) if now - t < ANSWER_CACHE_TTL_SECONDS]
+            if len(keep) != len(cache["times"]):
+                cache.update(
+                    vectors=cache["vectors"][keep],
+                    results=[cache["results"][i] for i in keep],
+                    times=[cache["times"][i] for i in keep],
+                )
+
+        if cache["results"]:
+            similarities = cache["vectors"] @ vector
+            best = int(np.argmax(similarities))
+            if similarities[best] >= ANSWER_CACHE_SIMILARITY:
+                result = copy.deepcopy(cache["results"][best])
+                if placeholder is not None:
+                    placeholder.markdown(result["answer"])
+                return result
+
+    result = ask_roadmap(query, placeholder=placeholder, query_embedding=embedding)
+
+    # Failed syntheses (missing key, API errors) come back with confidence "none"; never reuse them
+    if result.get("confidence") == "none":
+        return result
+
+    with cache["lock"]:
+        if cache["knowledge"] == knowledge:
+            cache["vectors"] = np.vstack([cache["vectors"], vector])[-ANSWER_CACHE_MAX_ENTRIES:]
+            cache["results"] = (cache["results"] + [copy.deepcopy(result)])[-ANSWER_CACHE_MAX_ENTRIES:]
+            cache["times"] = (cache["times"] + [time.time()])[-ANSWER_CACHE_MAX_ENTRIES:]
+
+    return result
+
+
 # ========== SAVE Q&A TO OPEN QUESTIONS ==========
 
+_RE_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_RE_ITALIC = re.compile(r'\*([^*]+)\*')
+_RE_SOURCE = re.compile(r'\[Source:[^\]]+\]')
+_RE_LINK = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_RE_HEADER = re.compile(r'#{1,6}\s*')
+_RE_NL = re.compile(r'\n{2,}')
+_RE_WS = re.compile(r'\s{2,}')
+
+
 def summarize_answer_for_context(answer: str, max_length: int = 500) -> str:
     """
     Summarize the synthesized answer for use as question context.
     Strips markdown and limits length.
     """
-    import re
 
-    # Remove markdown formatting
+    # Remove markdown formatting (each pass only runs if its marker is present)
     text = answer
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
-    text = re.sub(r'\[Source:[^\]]+\]', '', text)   # Source citations
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)  # Links
-    text = re.sub(r'#{1,6}\s*', '', text)           # Headers
-    text = re.sub(r'\n{2,}', ' ', text)             # Multiple newlines
-    text = re.sub(r'\s{2,}', ' ', text)             # Multiple spaces
+    if '**' in text:
+        text = _RE_BOLD.sub(r'\1', text)      # Bold
+    if '*' in text:
+        text = _RE_ITALIC.sub(r'\1', text)    # Italic
+    if '[Source:' in text:
+        text = _RE_SOURCE.sub('', text)       # Source citations
+    if '](' in text:
+        text = _RE_LINK.sub(r'\1', text)      # Links
+    if '#' in text:
+        text = _RE_HEADER.sub('', text)       # Headers
+    if '\n\n' in text:
+        text = _RE_NL.sub(' ', text)          # Multiple newlines
+    # Whitespace other than a plain space is never printable
+    if '  ' in text or not text.isprintable():
+        text = _RE_WS.sub(' ', text)          # Multiple spaces
 
     text = text.strip()
 
@@ -2629,37 +3494,56 @@ def summarize_answer_for_context(answer: str, max_length: int = 500) -> str:
     return f"Based on analysis: {text}"
 
 
+# Display name of a source reference from its full_data, by source type
+_SOURCE_DISPLAY_NAMES = {
+    "decision": lambda full_data: full_data.get("decision", "Decision")[:50],
+    "gap": lambda full_data: full_data.get("description", "Gap")[:50],
+    "assessment": lambda full_data: f"{full_data.get('assessment_type', 'Unknown').title()} Assessment",
+    "chunk": lambda full_data: full_data.get("source_name", "Source document"),
+}
+
+
 def get_source_display_name(source: dict) -> str:
     """Get a display name for a source reference."""
 
-    full_data = source.get("full_data", {})
-    source_type = source.get("type", "chunk")
-
-    if source_type == "decision":
-        return full_data.get("decision", "Decision")[:50]
-    elif source_type == "gap":
-        return full_data.get("description", "Gap")[:50]
-    elif source_type == "assessment":
-        return f"{full_data.get('assessment_type', 'Unknown').title()} Assessment"
-    elif source_type == "chunk":
-        return full_data.get("source_name", "Source document")
-    else:
+    display_name = _SOURCE_DISPLAY_NAMES.get(source.get("type", "chunk"))
+    if display_name is None:
         return source.get("id", "Unknown source")
+    return display_name(source.get("full_data", {}))
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _qa_query_index(signature: tuple) -> Dict[str, dict]:
+    """
+    Lowercased query -> question for questions saved from Ask Your Roadmap,
+    built once per questions.json signature. Shared; treat as read-only.
+    """
+    index = {}
+    for q in load_questions():
+        # Check if it came from ask_roadmap
+        if q.get("generation", {}).get("source") == "ask_roadmap":
+            # First saved question wins for a repeated query
+            index.setdefault(q.get("qa_session", {}).get("query", "").lower(), q)
+    return index
 
 
 def find_existing_qa_question(query: str) -> Optional[dict]:
     """Check if this query was already saved as a question."""
 
-    questions = load_questions()
+    signature = _store_signature("questions.json")
+    if not signature:
+        return None
 
-    for q in questions:
-        # Check if it came from ask_roadmap
-        if q.get("generation", {}).get("source") == "ask_roadmap":
-            # Check if query matches
-            if q.get("qa_session", {}).get("query", "").lower() == query.lower():
-                return q
+    return _qa_query_index(signature).get(query.lower())
 
-    return None
+
+# (retrieval_stats key, source reference type, relevance) for saved Q&A questions
+QA_SOURCE_REFERENCE_TYPES = [
+    ("decisions", "decision", "Referenced in answer synthesis"),
+    ("assessments", "assessment", "Referenced in answer synthesis"),
+    ("gaps", "gap", "Referenced in answer synthesis"),
+    ("chunks", "chunk", "Source documents"),
+]
 
 
 def save_qa_to_open_questions(
@@ -2689,7 +3573,10 @@ def save_qa_to_open_questions(
         The created question dict
     """
 
-    question_id = f"q_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    # One timestamp for the id and every time field of this save
+    now = datetime.now()
+    now_iso = now.isoformat()
+    question_id = f"q_{now.strftime('%Y%m%d_%H%M%S')}"
 
     # Build context from answer
     context = ""
@@ -2699,38 +3586,16 @@ def save_qa_to_open_questions(
 
     # Build source references
     source_references = []
-    if link_sources:
-        # Get sources from retrieval stats
-        retrieval_stats = answer_result.get('retrieval_stats', {})
-
-        # Add summary of sources by type
-        if retrieval_stats.get('decisions', 0) > 0:
-            source_references.append({
-                "type": "decision",
-                "count": retrieval_stats['decisions'],
-                "relevance": "Referenced in answer synthesis"
-            })
-
-        if retrieval_stats.get('assessments', 0) > 0:
-            source_references.append({
-                "type": "assessment",
-                "count": retrieval_stats['assessments'],
-                "relevance": "Referenced in answer synthesis"
-            })
-
-        if retrieval_stats.get('gaps', 0) > 0:
-            source_references.append({
-                "type": "gap",
-                "count": retrieval_stats['gaps'],
-                "relevance": "Referenced in answer synthesis"
-            })
+    if link_sources:
+        # Get sources from retrieval stats
+        retrieval_stats = answer_result.get('retrieval_stats', {})
 
-        if retrieval_stats.get('chunks', 0) > 0:
-            source_references.append({
-                "type": "chunk",
-                "count": retrieval_stats['chunks'],
-                "relevance": "Source documents"
-            })
+        # Add summary of sources by type
+        source_references = [
+            {"type": source_type, "count": count, "relevance": relevance}
+            for stat_key, source_type, relevance in QA_SOURCE_REFERENCE_TYPES
+            if (count := retrieval_stats.get(stat_key, 0)) > 0
+        ]
 
     # Create the question
     question = {
@@ -2740,12 +3605,12 @@ def save_qa_to_open_questions(
         "category": category,
         "priority": priority,
         "status": "pending",
-        "created_at": datetime.now().isoformat(),
+        "created_at": now_iso,
 
         "generation": {
             "type": "user_query",
             "source": "ask_roadmap",
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now_iso,
         },
 
         "context": context,
@@ -2753,7 +3618,7 @@ def save_qa_to_open_questions(
         "synthesized_answer": {
             "answer": answer_result['answer'],
             "confidence": answer_result['confidence'],
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now_iso,
             "retrieval_stats": answer_result.get('retrieval_stats', {})
         },
 
@@ -2762,7 +3627,7 @@ def save_qa_to_open_questions(
         "qa_session": {
             "query": query,
             "topic_filter": topic_filter,
-            "session_timestamp": datetime.now().isoformat()
+            "session_timestamp": now_iso
         },
 
         "validation": None
@@ -2776,9 +3641,13 @@ def save_qa_to_open_questions(
     return question
 
 
+@st.fragment
 def render_save_to_questions_ui(query: str, answer_result: Dict, topic_filter: Optional[str] = None, unique_id: int = 0):
     """
     Render the UI for saving a Q&A to Open Questions.
+
+    Runs as its own fragment, so changing these options reruns only this
+    card rather than the whole chat history.
     """
 
     st.divider()
@@ -2911,7 +3780,7 @@ def render_qa_synthesized_answer(synthesized_answer: dict):
 def diagnose_graph_contents():
     """Print diagnostic information about the unified graph."""
 
-    graph = UnifiedContextGraph.load()
+    graph = load_unified_graph()
 
     if not graph:
         print("❌ ERROR: Unified graph not loaded")
@@ -2925,11 +3794,9 @@ def diagnose_graph_contents():
     print("\n1. NODE COUNTS BY TYPE:")
     print("-" * 40)
 
-    node_types = {}
-    for node_id in graph.graph.nodes():
-        node_data = graph.graph.nodes[node_id]
-        node_type = node_data.get("node_type", "unknown")
-        node_types[node_type] = node_types.get(node_type, 0) + 1
+    # Node type per node, reused by the connectivity count below
+    node_type_of = {n: d.get("node_type", "unknown") for n, d in graph.graph.nodes(data=True)}
+    node_types = dict(Counter(node_type_of.values()))
 
     for node_type, count in sorted(node_types.items()):
         status = "✅" if count > 0 else "❌"
@@ -2949,20 +3816,6 @@ def diagnose_graph_contents():
     print("\n3. EDGE TYPES:")
     print("-" * 40)
 
-    edge_types = {}
-    for u, v, data in graph.graph.edges(data=True):
-        edge_type = data.get("edge_type", "unknown")
-        edge_types[edge_type] = edge_types.get(edge_type, 0) + 1
-
-    for edge_type, count in sorted(edge_types.items()):
-        print(f"  {edge_type}: {count}")
-
-    # 4. Check connectivity from chunks to other types
-    print("\n4. CHUNK CONNECTIVITY:")
-    print("-" * 40)
-
-    chunk_ids = [n for n, d in graph.graph.nodes(data=True) if d.get("node_type") == "chunk"]
-
     connections_to_types = {
         "decision": 0,
         "roadmap_item": 0,
@@ -2971,16 +3824,25 @@ def diagnose_graph_contents():
         "question": 0
     }
 
-    for chunk_id in chunk_ids[:100]:  # Sample first 100
-        for neighbor in graph.graph.neighbors(chunk_id):
-            neighbor_type = graph.graph.nodes[neighbor].get("node_type", "unknown")
-            if neighbor_type in connections_to_types:
-                connections_to_types[neighbor_type] += 1
+    # One pass over all edges counts edge types and, for every edge touching
+    # a chunk, the type of the node at the other end
+    edge_types = Counter()
+    for u, v, data in graph.graph.edges(data=True):
+        edge_types[data.get("edge_type", "unknown")] += 1
+
+        u_type, v_type = node_type_of[u], node_type_of[v]
+        if u_type == "chunk" and v_type in connections_to_types:
+            connections_to_types[v_type] += 1
+        elif v_type == "chunk" and u_type in connections_to_types:
+            connections_to_types[u_type] += 1
+    edge_types = dict(edge_types)
+
+    for edge_type, count in sorted(edge_types.items()):
+        print(f"  {edge_type}: {count}")
 
-        for predecessor in graph.graph.predecessors(chunk_id):
-            pred_type = graph.graph.nodes[predecessor].get("node_type", "unknown")
-            if pred_type in connections_to_types:
-                connections_to_types[pred_type] += 1
+    # 4. Check connectivity from chunks to other types
+    print("\n4. CHUNK CONNECTIVITY:")
+    print("-" * 40)
 
     for target_type, count in connections_to_types.items():
         status = "✅" if count > 0 else "❌"
@@ -3076,21 +3938,23 @@ def get_chunks_by_lens_count() -> dict:
         # Try LanceDB table access
         db = init_db()
         table = db.open_table("roadmap_chunks")
-        df = table.to_pandas()
-        if not df.empty:
-            return df.groupby("lens").size().to_dict()
+        # Only the lens column is read; counting happens in Arrow
+        lenses = table.search().select(["lens"]).limit(None).to_arrow()["lens"]
+        if len(lenses):
+            return {
+                entry["values"]: entry["counts"]
+                for entry in pc.value_counts(lenses).to_pylist()
+                if entry["values"] is not None
+            }
     except:
         pass
 
     # Fallback: count from graph
     try:
-        graph = UnifiedContextGraph.load()
+        graph = load_unified_graph()
         if graph:
-            lens_counts = {}
-            for chunk in graph.node_indices.get("chunk", {}).values():
-                lens = chunk.get("lens") if isinstance(chunk, dict) else getattr(chunk, 'lens', "unknown")
-                lens_counts[lens] = lens_counts.get(lens, 0) + 1
-            return lens_counts
+            # Nodes are always dicts here (load_unified_graph normalizes them)
+            return dict(Counter(chunk.get("lens") for chunk in graph.node_indices.get("chunk", {}).values()))
     except:
         pass
 
@@ -3099,6 +3963,78 @@ def get_chunks_by_lens_count() -> dict:
 
 # ========== PAGE: INGEST MATERIALS ==========
 
+# Uploaded files parsed and chunked at once
+INGEST_WORKERS = 4
+
+# Bulk ingestion embeds and writes chunks from this many files at a time, or
+# sooner to bound the chunks held per table write (generate_embeddings splits
+# a group into roadmap.EMBED_BATCH_SIZE-text Voyage requests)
+INDEX_BATCH_FILES = 32
+INDEX_BATCH_CHUNKS = 1000
+INDEX_BATCH_TOKENS = 100_000
+
+
+def _parse_and_chunk(file_path: Path, lens: str, use_agentic: bool) -> List[Dict] | None:
+    """Parse and chunk one file; None if the document has no text."""
+    text = parse_document(file_path)
+    if not text.strip():
+        return None
+    return chunk_with_fallback(text, str(file_path), lens, use_agentic=use_agentic)
+
+
+def _save_and_chunk_upload(uploaded_file, file_path: Path, lens: str, use_agentic: bool) -> List[Dict] | None:
+    """Save an uploaded file and chunk it; None if the document has no text."""
+    file_path.write_bytes(uploaded_file.getvalue())
+    return _parse_and_chunk(file_path, lens, use_agentic)
+
+
+def _index_in_groups(chunked_files) -> tuple[int, list[str]]:
+    """
+    Index (chunks, source_file) pairs, embedding and writing them in groups of
+    up to INDEX_BATCH_FILES files (and INDEX_BATCH_CHUNKS / INDEX_BATCH_TOKENS).
+
+    Returns the number of files indexed and the source files that failed.
+    When a group fails, its files are retried one by one so only the failing
+    files are skipped.
+    """
+    indexed = 0
+    failed = []
+    group = []
+    group_chunks = group_tokens = 0
+
+    def flush():
+        nonlocal indexed, group_chunks, group_tokens
+        try:
+            index_chunk_batches(group)
+            indexed += len(group)
+        except Exception:
+            for chunks, source_file in group:
+                try:
+                    index_chunk_batches([(chunks, source_file)])
+                    indexed += 1
+                except Exception:
+                    failed.append(source_file)
+        group.clear()
+        group_chunks = group_tokens = 0
+
+    for chunks, source_file in chunked_files:
+        tokens = sum(c["token_count"] for c in chunks)
+        # Write the current group first if this file would overflow it
+        if group and (group_chunks + len(chunks) > INDEX_BATCH_CHUNKS
+                      or group_tokens + tokens > INDEX_BATCH_TOKENS):
+            flush()
+        group.append((chunks, source_file))
+        group_chunks += len(chunks)
+        group_tokens += tokens
+
+        if len(group) >= INDEX_BATCH_FILES:
+            flush()
+
+    if group:
+        flush()
+    return indexed, failed
+
+
 def page_ingest():
     st.title("📥 Ingest Materials")
 
@@ -3163,38 +4099,40 @@ def page_ingest():
         success_count = 0
         error_count = 0
 
-        for i, uploaded_file in enumerate(uploaded_files):
-            try:
-                status_text.text(f"Processing {uploaded_file.name}...")
-
-                # Save file to materials directory
-                lens_dir = MATERIALS_DIR / lens
-                lens_dir.mkdir(parents=True, exist_ok=True)
+        # Save files to materials directory
+        lens_dir = MATERIALS_DIR / lens
+        lens_dir.mkdir(parents=True, exist_ok=True)
+        status_text.text(f"Processing {len(uploaded_files)} files...")
+
+        # Parse and chunk files concurrently (agentic chunking waits on Claude);
+        # indexing and all UI updates stay on this thread
+        with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as executor:
+            futures = {}
+            for uploaded_file in uploaded_files:
                 file_path = lens_dir / uploaded_file.name
-                file_path.write_bytes(uploaded_file.read())
+                future = executor.submit(_save_and_chunk_upload, uploaded_file, file_path, lens, use_agentic)
+                futures[future] = (uploaded_file.name, file_path)
 
-                # Parse and index
-                text = parse_document(file_path)
-                if not text.strip():
-                    st.warning(f"⚠️ {uploaded_file.name}: Empty document, skipping")
-                    error_count += 1
-                    continue
+            for i, future in enumerate(as_completed(futures)):
+                name, file_path = futures[future]
+                try:
+                    chunks = future.result()
+                    if chunks is None:
+                        st.warning(f"⚠️ {name}: Empty document, skipping")
+                        error_count += 1
+                    elif not chunks:
+                        st.warning(f"⚠️ {name}: No chunks generated, skipping")
+                        error_count += 1
+                    else:
+                        index_chunks(chunks, str(file_path))
+                        st.success(f"✓ {name} ({len(chunks)} chunks)")
+                        success_count += 1
 
-                chunks = chunk_with_fallback(text, str(file_path), lens, use_agentic=use_agentic)
-                if not chunks:
-                    st.warning(f"⚠️ {uploaded_file.name}: No chunks generated, skipping")
+                except Exception as e:
+                    st.error(f"✗ {name}: {str(e)}")
                     error_count += 1
-                    continue
 
-                index_chunks(chunks, str(file_path))
-                st.success(f"✓ {uploaded_file.name} ({len(chunks)} chunks)")
-                success_count += 1
-
-            except Exception as e:
-                st.error(f"✗ {uploaded_file.name}: {str(e)}")
-                error_count += 1
-
-            progress_bar.progress((i + 1) / len(uploaded_files))
+                progress_bar.progress((i + 1) / len(uploaded_files))
 
         status_text.text(f"Complete! {success_count} succeeded, {error_count} failed")
         st.session_state.index_stats = None  # Clear cache
@@ -3235,22 +4173,30 @@ def page_ingest():
         st.info(f"Found {len(files)} files")
 
         progress_bar = st.progress(0)
-        success_count = 0
 
-        for i, file in enumerate(files):
-            try:
-                text = parse_document(file)
-                if text.strip():
-                    chunks = chunk_with_fallback(text, str(file), path_lens, use_agentic=use_agentic)
-                    if chunks:
-                        index_chunks(chunks, str(file))
-                        success_count += 1
-            except Exception:
-                pass
+        # Parse and chunk files concurrently, then embed and write them in groups
+        with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as executor:
+            futures = {
+                executor.submit(_parse_and_chunk, file, path_lens, use_agentic): file
+                for file in files
+            }
+
+            def chunked_files():
+                for i, future in enumerate(as_completed(futures)):
+                    try:
+                        chunks = future.result()
+                        if chunks:
+                            yield chunks, str(futures[future])
+                    except Exception:
+                        pass
+
+                    progress_bar.progress((i + 1) / len(files))
 
-            progress_bar.progress((i + 1) / len(files))
+            success_count, failed_files = _index_in_groups(chunked_files())
 
         st.success(f"Ingested {success_count}/{len(files)} files successfully!")
+        if failed_files:
+            st.warning(f"Failed to index {len(failed_files)} file(s): {', '.join(map(os.path.basename, failed_files))}")
         st.session_state.index_stats = None
 
         # Rebuild context graph
@@ -3350,23 +4296,25 @@ def page_manage():
                     # Re-ingest all materials
                     progress_bar = st.progress(0)
                     status_text = st.empty()
-                    success_count = 0
 
-                    for i, material in enumerate(materials):
-                        try:
-                            status_text.text(f"Processing {material['file']}...")
-                            text = parse_document(Path(material['path']))
-                            if text.strip():
-                                chunks = chunk_with_fallback(text, material['path'], material['lens'], use_agentic=True)
+                    def chunked_materials():
+                        for i, material in enumerate(materials):
+                            try:
+                                status_text.text(f"Processing {material['file']}...")
+                                chunks = _parse_and_chunk(Path(material['path']), material['lens'], use_agentic=True)
                                 if chunks:
-                                    index_chunks(chunks, material['path'])
-                                    success_count += 1
-                        except Exception:
-                            pass
+                                    yield chunks, material['path']
+                            except Exception:
+                                pass
+
+                            progress_bar.progress((i + 1) / len(materials))
 
-                        progress_bar.progress((i + 1) / len(materials))
+                    # Chunked files are embedded and written in groups
+                    success_count, failed_files = _index_in_groups(chunked_materials())
 
                     status_text.text(f"Complete! Re-indexed {success_count}/{len(materials)} files")
+                    if failed_files:
+                        st.warning(f"Failed to index {len(failed_files)} file(s): {', '.join(map(os.path.basename, failed_files))}")
                     st.session_state.index_stats = None
                     st.success("✅ Re-indexing complete!")
 
@@ -3384,77 +4332,45 @@ def page_manage():
         st.write("**Delete All in Lens**")
         st.caption("Remove all files from a specific lens folder.")
 
+        # Result of a delete from the run before the reload
+        delete_notice = st.session_state.pop("delete_lens_notice", None)
+        if delete_notice:
+            st.success(delete_notice)
+
         delete_lens = st.selectbox("Select lens to clear:", options=VALID_LENSES, key="delete_lens")
 
         if st.button("🗑️ Delete All", type="secondary"):
             if st.checkbox(f"⚠️ This will delete ALL files in {delete_lens}. This cannot be undone!"):
                 lens_materials = [m for m in materials if m['lens'] == delete_lens]
                 deleted_count = 0
+                progress_bar = st.progress(0)
 
-                for material in lens_materials:
-                    if delete_material_file(material['path']):
-                        deleted_count += 1
-
+                # Unlink concurrently; errors and progress are reported from this thread
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = {
+                        executor.submit(Path(material['path']).unlink): material['file']
+                        for material in lens_materials
+                    }
+                    for i, future in enumerate(as_completed(futures)):
+                        try:
+                            future.result()
+                            deleted_count += 1
+                        except Exception as e:
+                            st.error(f"Error deleting {futures[future]}: {e}")
+                        progress_bar.progress((i + 1) / len(futures))
+
+                if deleted_count:
+                    # Reload once so the materials list drops the deleted files
+                    st.session_state.delete_lens_notice = f"✅ Deleted {deleted_count} files from {delete_lens}"
+                    st.rerun()
                 st.success(f"✅ Deleted {deleted_count} files from {delete_lens}")
-                st.rerun()
 
 
 # ========== PAGE: VIEW CHUNKS ==========
 
-def page_chunks():
-    st.title("🔍 View Chunks")
-    st.markdown("Inspect how documents were chunked and indexed")
-
-    # Explanation section
-    with st.expander("ℹ️ How Chunking Works", expanded=False):
-        st.markdown("""
-        ### Chunking Process
-
-        When you ingest documents, they are broken down into smaller "chunks" for better semantic search and retrieval.
-
-        **Process:**
-        1. **Document Parsing**: Files are converted to plain text using the `unstructured` library
-        2. **Tokenization**: Text is converted to tokens using tiktoken (cl100k_base encoding, Claude-compatible)
-        3. **Chunking**: Text is split into chunks of ~512 tokens each
-        4. **Overlap**: Each chunk overlaps with the next by 50 tokens to preserve context across boundaries
-        5. **Embedding**: Each chunk is embedded using Voyage AI (voyage-3-large model, 1024 dimensions)
-        6. **Indexing**: Embeddings are stored in LanceDB with metadata (lens, source file, token count, etc.)
-
-        **Why Chunk?**
-        - Enables precise semantic search over specific sections
-        - Fits within context windows for both embedding and LLM models
-        - Preserves context through overlap
-        - Allows lens-based authority weighting
-
-        **Parameters:**
-        - **Chunk Size**: 512 tokens (~350-400 words)
-        - **Overlap**: 50 tokens (~35-40 words)
-        - **Encoding**: cl100k_base (same as Claude)
-        """)
-
-    st.divider()
-
-    # Get chunks
-    chunks_df = get_all_chunks()
-
-    if chunks_df is None:
-        st.warning("⚠️ No chunks indexed yet. Ingest documents to see chunks here.")
-        return
-
-    st.success(f"✓ Found {len(chunks_df)} chunks in the index")
-
-    # Summary statistics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total Chunks", f"{len(chunks_df):,}")
-    with col2:
-        st.metric("Total Tokens", f"{chunks_df['token_count'].sum():,}")
-    with col3:
-        st.metric("Unique Sources", chunks_df['source_file'].nunique())
-    with col4:
-        avg_tokens = int(chunks_df['token_count'].mean())
-        st.metric("Avg Tokens/Chunk", avg_tokens)
-
+@st.fragment
+def _render_chunk_browser(chunks_df: pd.DataFrame, summary: Dict):
+    """Chunk filters, table and export; reruns on its own when they change"""
     # Filters
     st.subheader("Filter Chunks")
     col1, col2, col3 = st.columns(3)
@@ -3462,47 +4378,36 @@ def page_chunks():
     with col1:
         selected_lenses = st.multiselect(
             "Filter by Lens",
-            options=["All"] + list(chunks_df['lens'].unique()),
+            options=["All"] + summary['unique_lenses'],
             default=["All"]
         )
 
     with col2:
-        # Get unique source files
-        unique_sources = chunks_df['source_file'].unique()
-        source_names = [Path(s).name for s in unique_sources]
+        # Unique source files, by file name
+        source_paths_by_name = summary['source_paths_by_name']
         selected_source = st.selectbox(
             "Filter by Source File",
-            options=["All"] + source_names
+            options=["All"] + list(source_paths_by_name)
         )
 
     with col3:
         sort_by = st.selectbox(
             "Sort by",
-            options=["Created (newest)", "Created (oldest)", "Token Count (high)", "Token Count (low)", "Chunk Index"]
+            options=list(CHUNK_SORT_ORDERS)
         )
 
-    # Apply filters
-    filtered_df = chunks_df.copy()
-
-    if "All" not in selected_lenses and selected_lenses:
-        filtered_df = filtered_df[filtered_df['lens'].isin(selected_lenses)]
-
-    if selected_source != "All":
-        # Find the full path that matches the selected name
-        matching_path = [p for p in unique_sources if Path(p).name == selected_source][0]
-        filtered_df = filtered_df[filtered_df['source_file'] == matching_path]
-
-    # Apply sorting
-    if sort_by == "Created (newest)":
-        filtered_df = filtered_df.sort_values('created_at', ascending=False)
-    elif sort_by == "Created (oldest)":
-        filtered_df = filtered_df.sort_values('created_at', ascending=True)
-    elif sort_by == "Token Count (high)":
-        filtered_df = filtered_df.sort_values('token_count', ascending=False)
-    elif sort_by == "Token Count (low)":
-        filtered_df = filtered_df.sort_values('token_count', ascending=True)
-    elif sort_by == "Chunk Index":
-        filtered_df = filtered_df.sort_values(['source_file', 'chunk_index'])
+    # Apply filters (pushed down to LanceDB)
+    filter_lenses = selected_lenses if "All" not in selected_lenses else None
+    # Find the full path that matches the selected name
+    matching_path = source_paths_by_name[selected_source] if selected_source != "All" else None
+    where = chunk_filter_clause(filter_lenses, matching_path)
+
+    if where:
+        filtered_df = get_all_chunks(where)
+        if filtered_df is None:
+            filtered_df = chunks_df.iloc[0:0]
+    else:
+        filtered_df = chunks_df
 
     st.info(f"Showing {len(filtered_df)} of {len(chunks_df)} chunks")
 
@@ -3513,50 +4418,54 @@ def page_chunks():
     chunks_per_page = 10
     total_pages = (len(filtered_df) + chunks_per_page - 1) // chunks_per_page
 
+    start_idx = 0
     if total_pages > 1:
         page_num = st.number_input("Page", min_value=1, max_value=total_pages, value=1)
         start_idx = (page_num - 1) * chunks_per_page
-        end_idx = start_idx + chunks_per_page
-        page_df = filtered_df.iloc[start_idx:end_idx]
-    else:
-        page_df = filtered_df
-
-    # Display each chunk
-    for idx, row in page_df.iterrows():
-        source_name = Path(row['source_file']).name
-
-        with st.expander(f"🔹 Chunk {row['chunk_index']} from {source_name} [{row['lens']}]"):
-            col1, col2 = st.columns([2, 1])
-
-            with col1:
-                st.markdown("**Chunk Content:**")
-                st.text_area(
-                    "Content",
-                    value=row['content'],
-                    height=200,
-                    key=f"chunk_{row['id']}",
-                    label_visibility="collapsed"
-                )
-
-            with col2:
-                st.markdown("**Metadata:**")
-                st.write(f"**Lens:** {row['lens']}")
-                st.write(f"**Token Count:** {row['token_count']}")
-                st.write(f"**Chunk Index:** {row['chunk_index']}")
-                st.write(f"**Created:** {row['created_at_str']}")
-                st.caption(f"**Source:** {row['source_file']}")
-                st.caption(f"**ID:** {row['id']}")
+    page_df = sorted_chunk_page(filtered_df, sort_by, start_idx, start_idx + chunks_per_page)
+
+    # Read content only for the rows on this page
+    page_ids = page_df['id'].tolist()
+    page_contents = get_chunk_contents(f"id IN ({', '.join(map(_sql_string, page_ids))})") if page_ids else {}
+
+    # One table for the page instead of an expander and widgets per chunk
+    display_df = pd.DataFrame({
+        'chunk_index': page_df['chunk_index'],
+        'source_name': page_df['source_file'].str.rsplit('/', n=1).str[-1],
+        'lens': page_df['lens'],
+        'token_count': page_df['token_count'],
+        'created_at': page_df['created_at'].dt.strftime('%Y-%m-%d %H:%M'),
+        'content': page_df['id'].map(page_contents),
+        'source_file': page_df['source_file'],
+        'id': page_df['id'],
+    })
+    st.dataframe(
+        display_df,
+        column_config={
+            'chunk_index': st.column_config.NumberColumn("Chunk", width="small"),
+            'source_name': st.column_config.TextColumn("Source", help="File name; the full path is in the Source Path column"),
+            'lens': st.column_config.TextColumn("Lens"),
+            'token_count': st.column_config.NumberColumn("Tokens", width="small"),
+            'created_at': st.column_config.TextColumn("Created"),
+            'content': st.column_config.TextColumn("Content", width="large"),
+            'source_file': st.column_config.TextColumn("Source Path"),
+            'id': st.column_config.TextColumn("ID", help="Chunk id in the index"),
+        },
+        hide_index=True,
+        use_container_width=True
+    )
 
     # Export option
     st.divider()
     st.subheader("Export Chunks")
 
     col1, col2 = st.columns(2)
+    table_signature = get_chunk_table_signature()
 
     with col1:
         # Export filtered chunks as CSV
         if st.button("📥 Export Filtered as CSV"):
-            csv = filtered_df[['id', 'content', 'lens', 'source_file', 'chunk_index', 'token_count', 'created_at_str']].to_csv(index=False)
+            csv = export_chunks(filtered_df, table_signature, where, sort_by, "csv")
             st.download_button(
                 label="Download CSV",
                 data=csv,
@@ -3567,7 +4476,7 @@ def page_chunks():
     with col2:
         # Export as JSON
         if st.button("📥 Export Filtered as JSON"):
-            json_data = filtered_df[['id', 'content', 'lens', 'source_file', 'chunk_index', 'token_count', 'created_at_str']].to_json(orient='records', indent=2)
+            json_data = export_chunks(filtered_df, table_signature, where, sort_by, "json")
             st.download_button(
                 label="Download JSON",
                 data=json_data,
@@ -3576,8 +4485,98 @@ def page_chunks():
             )
 
 
+def page_chunks():
+    st.title("🔍 View Chunks")
+    st.markdown("Inspect how documents were chunked and indexed")
+
+    # Explanation section
+    with st.expander("ℹ️ How Chunking Works", expanded=False):
+        st.markdown("""
+        ### Chunking Process
+
+        When you ingest documents, they are broken down into smaller "chunks" for better semantic search and retrieval.
+
+        **Process:**
+        1. **Document Parsing**: Files are converted to plain text using the `unstructured` library
+        2. **Tokenization**: Text is converted to tokens using tiktoken (cl100k_base encoding, Claude-compatible)
+        3. **Chunking**: Text is split into chunks of ~512 tokens each
+        4. **Overlap**: Each chunk overlaps with the next by 50 tokens to preserve context across boundaries
+        5. **Embedding**: Each chunk is embedded using Voyage AI (voyage-3-large model, 1024 dimensions)
+        6. **Indexing**: Embeddings are stored in LanceDB with metadata (lens, source file, token count, etc.)
+
+        **Why Chunk?**
+        - Enables precise semantic search over specific sections
+        - Fits within context windows for both embedding and LLM models
+        - Preserves context through overlap
+        - Allows lens-based authority weighting
+
+        **Parameters:**
+        - **Chunk Size**: 512 tokens (~350-400 words)
+        - **Overlap**: 50 tokens (~35-40 words)
+        - **Encoding**: cl100k_base (same as Claude)
+        """)
+
+    st.divider()
+
+    # Get chunks
+    chunks_df = get_all_chunks()
+
+    if chunks_df is None:
+        st.warning("⚠️ No chunks indexed yet. Ingest documents to see chunks here.")
+        return
+
+    st.success(f"✓ Found {len(chunks_df)} chunks in the index")
+    summary = chunk_summary(chunks_df)
+
+    # Summary statistics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Chunks", f"{len(chunks_df):,}")
+    with col2:
+        st.metric("Total Tokens", f"{summary['total_tokens']:,}")
+    with col3:
+        st.metric("Unique Sources", summary['unique_source_count'])
+    with col4:
+        st.metric("Avg Tokens/Chunk", summary['avg_tokens'])
+
+    _render_chunk_browser(chunks_df, summary)
+
+
 # ========== PAGE: CHUNKING AUDIT ==========
 
+@st.cache_resource
+def _chunking_log_state(log_path: str) -> dict:
+    """Parsed chunking log entries and how far the file has been read, shared across reruns"""
+    return {"lock": threading.Lock(), "logs": [], "offset": 0, "inode": None}
+
+
+def load_chunking_logs(log_path: Path) -> List[Dict]:
+    """
+    Entries of the append-only chunking log, parsing only lines added since
+    the previous call. The returned list is shared and must not be modified.
+    """
+    state = _chunking_log_state(str(log_path))
+    with state["lock"]:
+        stat = log_path.stat()
+
+        # Start over if the log was deleted, replaced or truncated
+        if stat.st_ino != state["inode"] or stat.st_size < state["offset"]:
+            state.update(logs=[], offset=0, inode=stat.st_ino)
+
+        if stat.st_size > state["offset"]:
+            with open(log_path, "rb") as f:
+                f.seek(state["offset"])
+                data = f.read()
+
+            # Only whole lines; a line still being written is picked up next time
+            end = data.rfind(b"\n") + 1
+            new_logs = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+            state["logs"] = state["logs"] + new_logs
+            state["offset"] += end
+
+        return state["logs"]
+
+
 def page_chunking_audit():
     st.title("🔍 Chunking Audit Log")
     st.markdown("Review chunking quality and verification results")
@@ -3598,22 +4597,24 @@ def page_chunking_audit():
         return
 
     # Load logs
-    import json
-    logs = []
     try:
-        with open(log_path) as f:
-            for line in f:
-                logs.append(json.loads(line))
+        logs = load_chunking_logs(log_path)
     except Exception as e:
         st.error(f"Error loading logs: {e}")
         return
 
-    # Summary metrics
+    # Summary metrics (one pass over the logs)
     col1, col2, col3, col4 = st.columns(4)
     total_docs = len(logs)
-    agentic_docs = len([l for l in logs if l['method'].startswith('agentic')])
-    fallback_docs = len([l for l in logs if 'fallback' in l['method'] or l['method'].startswith('structure')])
-    issues_docs = len([l for l in logs if not l['verification']['all_valid']])
+    agentic_docs = fallback_docs = issues_docs = 0
+    for l in logs:
+        method = l['method']
+        if method.startswith('agentic'):
+            agentic_docs += 1
+        if 'fallback' in method or method.startswith('structure'):
+            fallback_docs += 1
+        if not l['verification']['all_valid']:
+            issues_docs += 1
 
     col1.metric("Total Documents", total_docs)
     col2.metric("Agentic Chunking", agentic_docs)
@@ -3678,6 +4679,10 @@ def page_chunking_audit():
 
 # ========== PAGE: CONTEXT GRAPH ==========
 
+# Gap severity -> icon for result cards
+GAP_SEVERITY_ICONS = {"critical": "🔴", "significant": "🟠", "moderate": "🟡", "minor": "🟢"}
+
+
 def render_authority_result_card(item: dict, item_type: str):
     """Render a single result card based on type."""
 
@@ -3709,7 +4714,7 @@ def render_authority_result_card(item: dict, item_type: str):
                     source = source.split("/")[-1]
                 lens = data.get("lens", "unknown")
                 st.markdown(f"**{source}** ({lens})")
-                content = data.get("content", data.get("text", ""))[:200]
+                content = (data["content"] if "content" in data else data.get("text", ""))[:200]
                 st.text(content + ("..." if len(content) >= 200 else ""))
 
             elif item_type == "roadmap_item":
@@ -3718,7 +4723,7 @@ def render_authority_result_card(item: dict, item_type: str):
 
             elif item_type == "gap":
                 severity = data.get("severity", "unknown")
-                severity_icon = {"critical": "🔴", "significant": "🟠", "moderate": "🟡", "minor": "🟢"}.get(severity, "⚪")
+                severity_icon = GAP_SEVERITY_ICONS.get(severity, "⚪")
                 st.markdown(f"{severity_icon} **{data.get('description', '')[:100]}**")
 
             elif item_type == "assessment":
@@ -3792,22 +4797,98 @@ def render_graph_query_results(results: dict):
             for item in gaps[:10]:
                 render_authority_result_card(item, "gap")
 
-    # Level 6: Chunks
-    chunks = results.get("chunks", [])
-    if chunks:
-        superseded_count = len([c for c in chunks if c.get("superseded")])
-        with st.expander(f"⚪ **LEVEL 6: SOURCE CHUNKS** ({len(chunks)}, {superseded_count} superseded)", expanded=False):
-            st.caption("Raw source content. Superseded chunks have been overridden by decisions.")
-            for item in chunks[:15]:
-                render_authority_result_card(item, "chunk")
+    # Level 6: Chunks
+    chunks = results.get("chunks", [])
+    if chunks:
+        superseded_count = len([c for c in chunks if c.get("superseded")])
+        with st.expander(f"⚪ **LEVEL 6: SOURCE CHUNKS** ({len(chunks)}, {superseded_count} superseded)", expanded=False):
+            st.caption("Raw source content. Superseded chunks have been overridden by decisions.")
+            for item in chunks[:15]:
+                render_authority_result_card(item, "chunk")
+
+    # Level 7: Pending Questions
+    pending = results.get("pending_questions", [])
+    if pending:
+        with st.expander(f"⬜ **LEVEL 7: PENDING QUESTIONS** ({len(pending)}) — Lowest Authority", expanded=False):
+            st.caption("Open questions not yet resolved.")
+            for item in pending[:10]:
+                render_authority_result_card(item, "pending_question")
+
+
+@st.fragment
+def _render_connection_explorer(graph: ContextGraph):
+    """Chunk picker and connection details; reruns on its own when a chunk is selected"""
+    # Select a chunk to explore (first 100 for performance)
+    node_options = get_chunk_graph_node_options(100)
+
+    if not node_options:
+        st.info("No chunks available to explore.")
+        return
+
+    selected_display = st.selectbox("Select a chunk to explore", list(node_options.keys()))
+    selected = node_options[selected_display]
+
+    if selected:
+        node_data = graph.graph.nodes[selected]
+
+        # Show chunk info
+        st.write("**Chunk Information:**")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Lens", node_data.get('lens', 'N/A'))
+        col2.metric("Source", node_data.get('source_name', 'N/A'))
+        col3.metric("Token Count", node_data.get('token_count', 'N/A'))
+
+        st.write("**Content Preview:**")
+        st.text_area("", node_data.get('content_preview', 'N/A'), height=150, disabled=True)
+
+        # Show key terms and time references
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**Key Terms:**")
+            terms = node_data.get('key_terms', [])
+            if terms:
+                st.write(", ".join(terms))
+            else:
+                st.write("None detected")
+
+        with col2:
+            st.write("**Time References:**")
+            times = node_data.get('time_references', [])
+            if times:
+                st.write(", ".join(times))
+            else:
+                st.write("None detected")
+
+        # Show connections (neighbor -> edge attributes, read in one adjacency scan)
+        adjacency = graph.graph[selected]
+        st.write(f"**Connected to {len(adjacency)} other chunks:**")
 
-    # Level 7: Pending Questions
-    pending = results.get("pending_questions", [])
-    if pending:
-        with st.expander(f"⬜ **LEVEL 7: PENDING QUESTIONS** ({len(pending)}) — Lowest Authority", expanded=False):
-            st.caption("Open questions not yet resolved.")
-            for item in pending[:10]:
-                render_authority_result_card(item, "pending_question")
+        if adjacency:
+            # Group by edge type
+            by_type = defaultdict(list)
+            for neighbor, edge_data in adjacency.items():
+                by_type[edge_data.get('type', 'UNKNOWN')].append((neighbor, edge_data))
+
+            # Display by type, one scrollable table per type
+            nodes = graph.graph.nodes
+            for edge_type, connections in by_type.items():
+                with st.expander(f"{edge_type} ({len(connections)} connections)"):
+                    connections_df = pd.DataFrame([
+                        {
+                            "Source": nodes[neighbor].get('source_name', neighbor),
+                            "Lens": nodes[neighbor].get('lens', 'N/A'),
+                            "Weight": edge_data.get('weight'),
+                            "Shared terms": ', '.join(edge_data.get('shared_terms', ())),
+                            "Shared periods": ', '.join(edge_data.get('shared_periods', ())),
+                            "Preview": nodes[neighbor].get('content_preview', 'N/A')[:100],
+                        }
+                        for neighbor, edge_data in connections
+                    ])
+                    # Drop the shared-term/period columns when no edge of this type has them
+                    connections_df = connections_df.loc[:, (connections_df != '').any()]
+                    st.dataframe(connections_df, hide_index=True, use_container_width=True)
+        else:
+            st.info("This chunk has no connections in the graph.")
 
 
 def page_context_graph():
@@ -3827,7 +4908,7 @@ def page_context_graph():
     if query and st.button("🔍 Search", type="primary"):
         with st.spinner("Searching unified knowledge graph..."):
             try:
-                graph = UnifiedContextGraph.load()
+                graph = load_unified_graph()
                 if graph and graph.graph.number_of_nodes() > 0:
                     results = retrieve_with_authority(query, graph, top_k=20)
                     render_graph_query_results(results)
@@ -3842,8 +4923,8 @@ def page_context_graph():
 
     # Load graph
     try:
-        graph = ContextGraph().load()
-        stats = graph.get_stats()
+        graph = load_chunk_graph()
+        stats = get_chunk_graph_stats()
     except Exception as e:
         st.warning("⚠️ No context graph found. Ingest materials to build the graph.")
         st.info("The context graph is automatically built when you ingest documents.")
@@ -3886,90 +4967,7 @@ def page_context_graph():
         st.info("No nodes in the graph.")
         return
 
-    # Select a chunk to explore
-    chunk_ids = list(graph.graph.nodes())
-
-    # Get node info for display
-    node_options = {}
-    for chunk_id in chunk_ids[:100]:  # Limit to first 100 for performance
-        node_data = graph.graph.nodes[chunk_id]
-        source_name = node_data.get('source_name', 'Unknown')
-        lens = node_data.get('lens', 'unknown')
-        preview = node_data.get('content_preview', '')[:50]
-        display_name = f"{source_name} [{lens}] - {preview}..."
-        node_options[display_name] = chunk_id
-
-    if not node_options:
-        st.info("No chunks available to explore.")
-        return
-
-    selected_display = st.selectbox("Select a chunk to explore", list(node_options.keys()))
-    selected = node_options[selected_display]
-
-    if selected:
-        node_data = graph.graph.nodes[selected]
-
-        # Show chunk info
-        st.write("**Chunk Information:**")
-        col1, col2, col3 = st.columns(3)
-        col1.metric("Lens", node_data.get('lens', 'N/A'))
-        col2.metric("Source", node_data.get('source_name', 'N/A'))
-        col3.metric("Token Count", node_data.get('token_count', 'N/A'))
-
-        st.write("**Content Preview:**")
-        st.text_area("", node_data.get('content_preview', 'N/A'), height=150, disabled=True)
-
-        # Show key terms and time references
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write("**Key Terms:**")
-            terms = node_data.get('key_terms', [])
-            if terms:
-                st.write(", ".join(terms))
-            else:
-                st.write("None detected")
-
-        with col2:
-            st.write("**Time References:**")
-            times = node_data.get('time_references', [])
-            if times:
-                st.write(", ".join(times))
-            else:
-                st.write("None detected")
-
-        # Show connections
-        neighbors = list(graph.graph.neighbors(selected))
-        st.write(f"**Connected to {len(neighbors)} other chunks:**")
-
-        if neighbors:
-            # Group by edge type
-            by_type = {}
-            for neighbor in neighbors:
-                edge_data = graph.graph.edges[selected, neighbor]
-                edge_type = edge_data.get('type', 'UNKNOWN')
-                if edge_type not in by_type:
-                    by_type[edge_type] = []
-                by_type[edge_type].append((neighbor, edge_data))
-
-            # Display by type
-            for edge_type, connections in by_type.items():
-                with st.expander(f"{edge_type} ({len(connections)} connections)"):
-                    for neighbor, edge_data in connections[:5]:  # Show first 5
-                        neighbor_data = graph.graph.nodes[neighbor]
-                        st.markdown(f"**→ {neighbor_data.get('source_name', neighbor)}**")
-                        st.write(f"- **Lens:** {neighbor_data.get('lens', 'N/A')}")
-                        st.write(f"- **Weight:** {edge_data.get('weight', 'N/A')}")
-
-                        # Show shared terms/periods if available
-                        if 'shared_terms' in edge_data:
-                            st.write(f"- **Shared terms:** {', '.join(edge_data['shared_terms'])}")
-                        if 'shared_periods' in edge_data:
-                            st.write(f"- **Shared periods:** {', '.join(edge_data['shared_periods'])}")
-
-                        st.write(f"- **Preview:** {neighbor_data.get('content_preview', 'N/A')[:100]}...")
-                        st.markdown("---")
-        else:
-            st.info("This chunk has no connections in the graph.")
+    _render_connection_explorer(graph)
 
 
 # ========== PAGE: GENERATE ROADMAP ==========
@@ -4036,7 +5034,6 @@ def page_generate():
                 )
 
         except Exception as e:
-            import traceback
             error_details = traceback.format_exc()
             st.error(f"Error generating roadmap: {e}")
             with st.expander("🔍 Error Details"):
@@ -4054,6 +5051,17 @@ def page_generate():
 
 # ========== PAGE: FORMAT BY PERSONA ==========
 
+@st.cache_data(max_entries=8, show_spinner=False)
+def _read_roadmap_text(path: str, signature: tuple) -> str:
+    """Contents of a roadmap markdown file, cached per path and file signature"""
+    return Path(path).read_text()
+
+
+def read_roadmap_text(path: Path) -> str:
+    """Read a roadmap markdown file, reusing the cached text while it is unchanged"""
+    return _read_roadmap_text(str(path), _file_signature(path))
+
+
 def page_format():
     st.title("👥 Format by Persona")
     st.markdown("Transform master roadmap for specific audiences")
@@ -4107,7 +5115,7 @@ def page_format():
                     )
 
                 with tab2:
-                    master_text = master_path.read_text()
+                    master_text = read_roadmap_text(master_path)
                     st.markdown(master_text)
 
         except Exception as e:
@@ -4121,10 +5129,11 @@ def page_format():
         p_path = OUTPUT_DIR / f"{p}_roadmap.md"
         if p_path.exists():
             with st.expander(f"📄 {p.capitalize()} Roadmap"):
-                st.markdown(p_path.read_text())
+                p_text = read_roadmap_text(p_path)
+                st.markdown(p_text)
                 st.download_button(
                     label=f"📥 Download",
-                    data=p_path.read_text(),
+                    data=p_text,
                     file_name=f"{p}_roadmap.md",
                     mime="text/markdown",
                     key=f"download_{p}"
@@ -4133,28 +5142,12 @@ def page_format():
 
 # ========== PAGE: ASK QUESTIONS ==========
 
-def page_ask():
-    st.title("💬 Ask Your Roadmap")
-    st.markdown("Conversational Q&A powered by multi-source retrieval and Claude synthesis")
-
-    # Check if we have materials
-    stats = get_index_stats()
-    if not stats:
-        st.warning("⚠️ No materials indexed. Please ingest documents first.")
-        return
-
-    # Initialize session state for ask history
-    if 'ask_history' not in st.session_state:
-        st.session_state.ask_history = []
+ANSWER_CONFIDENCE_ICONS = {"high": "🟢", "medium": "🟡", "low": "🔴"}
 
-    # Clear history button
-    col1, col2 = st.columns([6, 1])
-    with col2:
-        if st.button("🗑️ Clear", key="clear_ask_history"):
-            st.session_state.ask_history = []
-            st.rerun()
 
-    # Display chat history
+@st.fragment
+def _render_ask_history():
+    """Chat transcript; its widgets rerun only this fragment unless they need the whole page"""
     for idx, msg in enumerate(st.session_state.ask_history):
         if msg['role'] == 'user':
             with st.chat_message("user"):
@@ -4169,7 +5162,7 @@ def page_ask():
 
                 with col1:
                     confidence = msg.get('confidence', 'medium')
-                    conf_emoji = {"high": "🟢", "medium": "🟡", "low": "🔴"}.get(confidence, "⚪")
+                    conf_emoji = ANSWER_CONFIDENCE_ICONS.get(confidence, "⚪")
                     st.caption(f"Confidence: {conf_emoji} {confidence.title()}")
 
                 with col2:
@@ -4181,32 +5174,32 @@ def page_ask():
                     if topics:
                         st.caption(f"Topics: {', '.join(topics)}")
 
+                # Section contents are only built while their toggle is on
+                # (a collapsed expander still sends its contents to the browser)
+
                 # Retrieval stats
                 stats = msg.get('retrieval_stats', {})
-                if stats:
-                    with st.expander("📊 Retrieval Statistics"):
-                        col1, col2, col3, col4 = st.columns(4)
-                        col1.metric("Chunks", stats.get('chunks', 0))
-                        col2.metric("Decisions", stats.get('decisions', 0))
-                        col3.metric("Assessments", stats.get('assessments', 0))
-                        col4.metric("Roadmap Items", stats.get('roadmap_items', 0))
+                if stats and st.toggle("📊 Retrieval Statistics", key=f"ask_stats_{idx}"):
+                    col1, col2, col3, col4 = st.columns(4)
+                    col1.metric("Chunks", stats.get('chunks', 0))
+                    col2.metric("Decisions", stats.get('decisions', 0))
+                    col3.metric("Assessments", stats.get('assessments', 0))
+                    col4.metric("Roadmap Items", stats.get('roadmap_items', 0))
 
                 # Related questions
                 related = msg.get('related_questions', [])
-                if related:
-                    with st.expander("🔗 Related Pending Questions"):
-                        for q in related:
-                            st.markdown(f"- {q}")
+                if related and st.toggle("🔗 Related Pending Questions", key=f"ask_related_{idx}"):
+                    for q in related:
+                        st.markdown(f"- {q}")
 
                 # Follow-ups
                 follow_ups = msg.get('follow_ups', [])
-                if follow_ups:
-                    with st.expander("💡 Suggested Follow-ups"):
-                        for fu in follow_ups:
-                            if st.button(fu, key=f"followup_{idx}_{hash(fu)}"):
-                                # Add as new question
-                                st.session_state.next_question = fu
-                                st.rerun()
+                if follow_ups and st.toggle("💡 Suggested Follow-ups", key=f"ask_follow_ups_{idx}"):
+                    for fu_idx, fu in enumerate(follow_ups):
+                        if st.button(fu, key=f"followup_{idx}_{fu_idx}"):
+                            # Add as new question
+                            st.session_state.next_question = fu
+                            st.rerun(scope="app")
 
             # === ADD: Save to Open Questions UI ===
             # Show save UI for each Q&A (outside chat_message for better layout)
@@ -4219,6 +5212,31 @@ def page_ask():
                     unique_id=idx
                 )
 
+
+def page_ask():
+    st.title("💬 Ask Your Roadmap")
+    st.markdown("Conversational Q&A powered by multi-source retrieval and Claude synthesis")
+
+    # Check if we have materials
+    stats = get_index_stats()
+    if not stats:
+        st.warning("⚠️ No materials indexed. Please ingest documents first.")
+        return
+
+    # Initialize session state for ask history
+    if 'ask_history' not in st.session_state:
+        st.session_state.ask_history = []
+
+    # Clear history button
+    col1, col2 = st.columns([6, 1])
+    with col2:
+        if st.button("🗑️ Clear", key="clear_ask_history"):
+            st.session_state.ask_history = []
+            st.rerun()
+
+    # Display chat history
+    _render_ask_history()
+
     # Question input
     question = st.chat_input("Ask a question about your roadmap...")
 
@@ -4236,8 +5254,12 @@ def page_ask():
 
         # Get answer using ask_roadmap
         try:
-            with st.spinner("🔍 Analyzing query and retrieving context..."):
-                result = ask_roadmap(question)
+            with st.chat_message("user"):
+                st.write(question)
+            with st.chat_message("assistant"):
+                answer_placeholder = st.empty()
+                with st.spinner("🔍 Analyzing query and retrieving context..."):
+                    result = ask_roadmap_cached(question, placeholder=answer_placeholder)
 
             # Add assistant message with full result for saving
             st.session_state.ask_history.append({
@@ -4262,12 +5284,329 @@ def page_ask():
 
 # ========== PAGE: OPEN QUESTIONS ==========
 
+def _store_signature(file_name: str) -> tuple:
+    """(mtime_ns, size) of a question store file, or () if it does not exist"""
+    return _file_signature(DATA_DIR / "questions" / file_name)
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_questions_cached(signature: tuple) -> List[Dict]:
+    return load_questions()
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_answers_cached(signature: tuple) -> List[Dict]:
+    return load_answers()
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_decisions_cached(signature: tuple) -> List[Dict]:
+    return load_decisions()
+
+
+def load_questions_cached() -> List[Dict]:
+    """
+    load_questions(), reparsed only when questions.json changes. Each call
+    returns a fresh copy, so callers may modify and save it.
+    """
+    return _load_questions_cached(_store_signature("questions.json"))
+
+
+def load_answers_cached() -> List[Dict]:
+    """load_answers(), reparsed only when answers.json changes (returns a copy)"""
+    return _load_answers_cached(_store_signature("answers.json"))
+
+
+def load_decisions_cached() -> List[Dict]:
+    """load_decisions(), reparsed only when decisions.json changes (returns a copy)"""
+    return _load_decisions_cached(_store_signature("decisions.json"))
+
+
+def _generation_context_signature() -> tuple:
+    """Signature of every store gather_generation_context() reads"""
+    return (
+        _store_signature("questions.json"),
+        _store_signature("decisions.json"),
+        _unified_graph_signature(),
+        get_chunk_table_signature(),
+        _file_signature(ALIGNMENT_ANALYSIS_FILE),
+        _file_signature(ANALYST_ASSESSMENTS_FILE),
+    )
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _generation_context_counts_cached(signature: tuple, _questions: List[Dict]) -> Dict[str, int]:
+    """Sizes of the generation context lists, recomputed only when a source store changes"""
+    context = gather_generation_context(_questions)
+    return {
+        key: len(context.get(key) or [])
+        for key in ("roadmap_items", "arch_assessments", "competitive_assessments",
+                    "active_decisions", "answered_questions", "pending_questions")
+    }
+
+
+def format_decision_log(decisions: List[Dict]) -> str:
+    """Decision Log export as Markdown"""
+    buf = io.StringIO()
+    w = buf.write
+    w("# Decision Log\n")
+    w(f"\nGenerated: {datetime.now().isoformat()}\n")
+    w(f"Total Decisions: {len(decisions)}\n\n")
+    w("---\n\n")
+
+    for dec in decisions:
+        status_emoji = DECISION_STATUS_ICONS.get(dec.get("status", "active"), "?")
+        created = dec.get("created_at", "Unknown")[:10]
+
+        w(f"## {status_emoji} {dec['id']} ({created})\n\n")
+        w(f"**Decision:** {dec['decision']}\n\n")
+
+        if dec.get("rationale"):
+            w(f"**Rationale:** {dec['rationale']}\n\n")
+
+        if dec.get("implications"):
+            w("**Implications:**\n")
+            for imp in dec["implications"]:
+                w(f"- {imp}\n")
+            w("\n")
+
+        w(f"**Owner:** {dec.get('owner', 'Unassigned')}\n")
+        w(f"**Status:** {dec.get('status', 'active')}\n")
+
+        question_id = dec.get("question_id")
+        if question_id:
+            w(f"**Question ID:** {question_id}\n")
+
+        w("\n---\n\n")
+
+    return buf.getvalue()
+
+
+def get_generation_context_counts(questions: List[Dict]) -> Dict[str, int]:
+    """Counts shown under "What will be analyzed"; questions must be the current questions.json contents"""
+    return _generation_context_counts_cached(_generation_context_signature(), questions)
+
+
+# Pending questions shown per audience page
+PENDING_QUESTIONS_PER_PAGE = 20
+
+QUESTION_PRIORITY_ORDER = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+QUESTION_PRIORITY_ICONS = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "⚪"}
+DECISION_STATUS_ICONS = {"active": "✅", "superseded": "🔄", "revisiting": "🔍"}
+
+# Pending question "Source" filter option -> label
+QUESTION_SOURCE_LABELS = {
+    "All": "All Sources",
+    "user_query": "💬 From Q&A",
+    "llm": "🤖 LLM Generated",
+    "derived": "🔍 Derived",
+    "legacy": "📝 Legacy"
+}
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _pending_question_index(signature: tuple, _questions: List[Dict]) -> Dict:
+    """
+    Positions of the pending questions in _questions, in display (priority)
+    order, overall and grouped by each filterable field. Cached per
+    questions.json signature.
+    """
+    pending = [i for i, q in enumerate(_questions) if q.get("status", "pending") == "pending"]
+    pending.sort(key=lambda i: QUESTION_PRIORITY_ORDER.get(_questions[i].get("priority", "low"), 4))
+
+    index = {"pending": pending, "audience": {}, "priority": {}, "category": {}, "source": {}}
+    for i in pending:
+        q = _questions[i]
+        generation = q.get("generation")
+        index["audience"].setdefault(q.get("audience", ""), []).append(i)
+        index["priority"].setdefault(q.get("priority", ""), []).append(i)
+        index["category"].setdefault(q.get("category", ""), []).append(i)
+        index["source"].setdefault(generation.get("type") if generation else "legacy", []).append(i)
+    index["answered_count"] = sum(1 for q in _questions if q.get("status", "") == "answered")
+    return index
+
+
+def filter_pending_questions(questions: List[Dict], filters: Dict[str, str]) -> tuple[List[Dict], Dict]:
+    """
+    Pending questions matching every non-"All" filter (field -> value), in
+    priority order, plus the cached index they were selected from.
+    """
+    index = _pending_question_index(_store_signature("questions.json"), questions)
+    groups = [index[field].get(value, []) for field, value in filters.items() if value != "All"]
+    if not groups:
+        positions = index["pending"]
+    else:
+        # Walk the smallest group (already in display order), checking the others
+        groups.sort(key=len)
+        others = [set(group) for group in groups[1:]]
+        positions = [i for i in groups[0] if all(i in other for other in others)]
+    return [questions[i] for i in positions], index
+
+
+def pending_question_table(pending: List[Dict]) -> pd.DataFrame:
+    """Table view rows for pending questions, with the card icons resolved column-wise"""
+    df = pd.DataFrame.from_records(pending).reindex(
+        columns=["priority", "audience", "category", "question", "created_at", "generation", "validation"]
+    ).astype(object)
+
+    priority = df["priority"].fillna("medium")
+    gen_type = df["generation"].str.get("type").fillna("legacy")
+    gen_source = df["generation"].str.get("source")
+    validated = df["validation"].str.get("validated").fillna(False).astype(bool)
+    accurate = df["validation"].str.get("is_accurate").fillna(False).astype(bool)
+
+    # Same priority / validation / source icons as the card titles
+    priority_icon = priority.map(QUESTION_PRIORITY_ICONS).fillna("⚪")
+    val_icon = np.where(validated, np.where(accurate, "👍", "👎"), "❓")
+    type_badge = np.select(
+        [(gen_type == "user_query") & (gen_source == "ask_roadmap"), gen_type == "llm", gen_type == "derived"],
+        ["💬", "🤖", "🔍"],
+        "📝"
+    )
+
+    return pd.DataFrame({
+        "Status": priority_icon + " " + val_icon + " " + type_badge,
+        "Priority": priority,
+        "Audience": df["audience"].fillna(""),
+        "Category": df["category"].fillna(""),
+        "Source": gen_type,
+        "Question": df["question"],
+        "Created": df["created_at"].fillna("").str.slice(0, 10),
+    })
+
+
+def render_pending_question_card(q: Dict, questions: List[Dict], expanded: bool = False):
+    """Expander with a pending question's details, source references, validation and actions"""
+    priority_emoji = QUESTION_PRIORITY_ICONS.get(q.get("priority", "medium"), "⚪")
+
+    # Validation status
+    validation = q.get("validation")
+    if validation and validation.get("validated"):
+        val_icon = "👍" if validation.get("is_accurate") else "👎"
+    else:
+        val_icon = "❓"
+
+    # Generation type badge
+    generation = q.get("generation", {})
+    gen_type = generation.get("type", "legacy")
+    gen_source = generation.get("source", "")
+
+    if gen_type == "user_query" and gen_source == "ask_roadmap":
+        type_badge = "💬"
+        has_synthesized_answer = True
+    elif gen_type == "llm":
+        type_badge = "🤖"
+        has_synthesized_answer = False
+    elif gen_type == "derived":
+        type_badge = "🔍"
+        has_synthesized_answer = False
+    else:
+        type_badge = "📝"
+        has_synthesized_answer = False
+
+    question_preview = q['question'][:70] + "..." if len(q['question']) > 70 else q['question']
+
+    with st.expander(f"{priority_emoji} {val_icon} {type_badge} {question_preview}", expanded=expanded):
+        # Header
+        st.write(f"**Question:** {q['question']}")
+
+        # Generation type info
+        if gen_type == "user_query" and gen_source == "ask_roadmap":
+            st.success("💬 From Q&A - Asked in Ask Your Roadmap")
+        elif gen_type == "llm":
+            st.info("🤖 Generated by LLM analysis")
+        elif gen_type == "derived":
+            st.warning(f"🔍 Derived from {generation.get('source', 'unknown')} pattern")
+        else:
+            st.caption("📝 Legacy question")
+
+        st.write(f"**Category:** {q.get('category', 'N/A')}")
+        st.write(f"**Priority:** {q.get('priority', 'medium')}")
+        st.write(f"**Context:** {q.get('context', 'None provided')}")
+
+        if q.get("related_roadmap_items"):
+            st.write(f"**Affects:** {', '.join(q['related_roadmap_items'])}")
+
+        # === NEW: Show synthesized answer for Q&A questions ===
+        if has_synthesized_answer and q.get("synthesized_answer"):
+            st.divider()
+            render_qa_synthesized_answer(q["synthesized_answer"])
+
+        # Show derivation evidence for derived questions
+        if gen_type == "derived":
+            derivation = q.get("derivation", {})
+            evidence = derivation.get("evidence", [])
+
+            # Only built while the toggle is on
+            if evidence and st.toggle(f"📊 Derivation Evidence ({len(evidence)} items)", key=f"evidence_{q['id']}"):
+                for ev in evidence:
+                    if "source_name" in ev:
+                        st.markdown(f"**{ev.get('source_name')}** ({ev.get('lens', 'unknown')})")
+                        st.caption(ev.get("content", "")[:200])
+                    else:
+                        st.json(ev)
+
+        st.write(f"**Created:** {q.get('created_at', 'Unknown')[:10]}")
+
+        st.divider()
+
+        # Source references
+        render_question_source_references(q)
+
+        st.divider()
+
+        # Validation
+        render_question_validation(q)
+
+        st.divider()
+
+        # Quick actions
+        _render_question_actions(q, questions, has_synthesized_answer)
+
+
+@st.fragment
+def _render_question_actions(q: Dict, questions: List[Dict], has_synthesized_answer: bool):
+    """
+    Status buttons for a pending question. A status change is saved and
+    shown here without rerunning the page; the question leaves the pending
+    list on the next full rerun.
+    """
+    if q.get("status", "pending") != "pending":
+        st.success(f"Question {q['status']}")
+        return
+
+    new_status = None
+    col1, col2 = st.columns(2)
+    if has_synthesized_answer:
+        # For Q&A questions, show Re-Ask and Mark Obsolete buttons
+        if col1.button("🔄 Re-Ask", key=f"reask_{q['id']}"):
+            st.session_state.current_page = "💬 Ask Your Roadmap"
+            # Store the question to pre-fill
+            if 'ask_history' not in st.session_state:
+                st.session_state.ask_history = []
+            st.rerun(scope="app")
+    else:
+        # For other questions, show Defer and Mark Obsolete buttons
+        if col1.button("Defer", key=f"def_{q['id']}"):
+            new_status = "deferred"
+    if col2.button("Mark Obsolete", key=f"obs_{q['id']}"):
+        new_status = "obsolete"
+
+    if new_status:
+        q["status"] = new_status
+        save_questions(questions)
+        st.success(f"Question {new_status}")
+
+
 def page_open_questions():
     st.title("📝 Open Questions")
     st.markdown("Track open questions, submit answers, and manage the decision log")
 
+    # Load questions once for the whole page
+    questions = load_questions_cached()
+
     # Validation stats
-    render_validation_stats()
+    render_validation_stats(questions)
 
     st.divider()
 
@@ -4276,22 +5615,21 @@ def page_open_questions():
 
     # Show what will be analyzed
     try:
-        context = gather_generation_context()
-
         with st.expander("What will be analyzed", expanded=False):
+            counts = get_generation_context_counts(questions)
             col1, col2 = st.columns(2)
 
             with col1:
                 st.markdown("**Roadmap & Assessments**")
-                st.caption(f"• {len(context.get('roadmap_items', []))} roadmap items")
-                st.caption(f"• {len(context.get('arch_assessments', []))} architecture assessments")
-                st.caption(f"• {len(context.get('competitive_assessments', []))} competitive assessments")
+                st.caption(f"• {counts['roadmap_items']} roadmap items")
+                st.caption(f"• {counts['arch_assessments']} architecture assessments")
+                st.caption(f"• {counts['competitive_assessments']} competitive assessments")
 
             with col2:
                 st.markdown("**Decisions & Questions**")
-                st.caption(f"• {len(context.get('active_decisions', []))} active decisions")
-                st.caption(f"• {len(context.get('answered_questions', []))} answered questions")
-                st.caption(f"• {len(context.get('pending_questions', []))} pending questions")
+                st.caption(f"• {counts['active_decisions']} active decisions")
+                st.caption(f"• {counts['answered_questions']} answered questions")
+                st.caption(f"• {counts['pending_questions']} pending questions")
 
         # Generate button
         col1, col2 = st.columns([2, 1])
@@ -4339,9 +5677,8 @@ def page_open_questions():
     st.divider()
 
     # Load data
-    questions = load_questions()
-    answers = load_answers()
-    decisions = load_decisions()
+    answers = load_answers_cached()
+    decisions = load_decisions_cached()
 
     # Create tabs
     tab1, tab2, tab3 = st.tabs(["📋 Pending Questions", "✅ Answer Question", "📜 Decision Log"])
@@ -4361,36 +5698,23 @@ def page_open_questions():
         with col4:
             type_filter = st.selectbox(
                 "Source",
-                ["All", "user_query", "llm", "derived", "legacy"],
-                format_func=lambda x: {
-                    "All": "All Sources",
-                    "user_query": "💬 From Q&A",
-                    "llm": "🤖 LLM Generated",
-                    "derived": "🔍 Derived",
-                    "legacy": "📝 Legacy"
-                }.get(x, x)
+                list(QUESTION_SOURCE_LABELS),
+                format_func=QUESTION_SOURCE_LABELS.get
             )
 
-        # Filter questions
-        pending = [q for q in questions if q.get("status", "pending") == "pending"]
-
-        if audience_filter != "All":
-            pending = [q for q in pending if q.get("audience", "") == audience_filter]
-        if priority_filter != "All":
-            pending = [q for q in pending if q.get("priority", "") == priority_filter]
-        if category_filter != "All":
-            pending = [q for q in pending if q.get("category", "") == category_filter]
-        if type_filter != "All":
-            if type_filter == "legacy":
-                pending = [q for q in pending if not q.get("generation")]
-            else:
-                pending = [q for q in pending if q.get("generation", {}).get("type") == type_filter]
+        # Filter questions (already in priority order)
+        pending, question_index = filter_pending_questions(questions, {
+            "audience": audience_filter,
+            "priority": priority_filter,
+            "category": category_filter,
+            "source": type_filter,
+        })
 
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
-        total_pending = len([q for q in questions if q.get("status", "pending") == "pending"])
+        total_pending = len(question_index["pending"])
         critical_count = len([q for q in pending if q.get("priority", "") == "critical"])
-        answered_count = len([q for q in questions if q.get("status", "") == "answered"])
+        answered_count = question_index["answered_count"]
         decisions_count = len(decisions)
 
         col1.metric("Total Pending", total_pending)
@@ -4402,6 +5726,20 @@ def page_open_questions():
 
         if not pending:
             st.info("No pending questions match your filters.")
+        elif st.radio("View", ["Detail", "Table"], horizontal=True, key="pending_view_mode") == "Table":
+            # One table for every question; widgets only for the selected row
+            selection = st.dataframe(
+                pending_question_table(pending),
+                on_select="rerun",
+                selection_mode="single-row",
+                hide_index=True,
+                use_container_width=True,
+                key="pending_table"
+            ).selection
+            if selection.rows:
+                render_pending_question_card(pending[selection.rows[0]], questions, expanded=True)
+            else:
+                st.caption("Select a row to see the question's details and actions.")
         else:
             # Display questions by audience
             for audience in ["engineering", "leadership", "product"]:
@@ -4411,122 +5749,21 @@ def page_open_questions():
 
                 st.markdown(f"### {audience.title()} ({len(audience_qs)})")
 
-                # Sort by priority
-                priority_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-                sorted_qs = sorted(audience_qs, key=lambda x: priority_order.get(x.get("priority", "low"), 4))
-
-                for q in sorted_qs:
-                    priority_emoji = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "⚪"}.get(q.get("priority", "medium"), "⚪")
-
-                    # Validation status
-                    validation = q.get("validation")
-                    if validation and validation.get("validated"):
-                        val_icon = "👍" if validation.get("is_accurate") else "👎"
-                    else:
-                        val_icon = "❓"
-
-                    # Generation type badge
-                    generation = q.get("generation", {})
-                    gen_type = generation.get("type", "legacy")
-                    gen_source = generation.get("source", "")
-
-                    if gen_type == "user_query" and gen_source == "ask_roadmap":
-                        type_badge = "💬"
-                        has_synthesized_answer = True
-                    elif gen_type == "llm":
-                        type_badge = "🤖"
-                        has_synthesized_answer = False
-                    elif gen_type == "derived":
-                        type_badge = "🔍"
-                        has_synthesized_answer = False
-                    else:
-                        type_badge = "📝"
-                        has_synthesized_answer = False
-
-                    question_preview = q['question'][:70] + "..." if len(q['question']) > 70 else q['question']
-
-                    with st.expander(f"{priority_emoji} {val_icon} {type_badge} {question_preview}"):
-                        # Header
-                        st.write(f"**Question:** {q['question']}")
-
-                        # Generation type info
-                        if gen_type == "user_query" and gen_source == "ask_roadmap":
-                            st.success("💬 From Q&A - Asked in Ask Your Roadmap")
-                        elif gen_type == "llm":
-                            st.info("🤖 Generated by LLM analysis")
-                        elif gen_type == "derived":
-                            st.warning(f"🔍 Derived from {generation.get('source', 'unknown')} pattern")
-                        else:
-                            st.caption("📝 Legacy question")
-
-                        st.write(f"**Category:** {q.get('category', 'N/A')}")
-                        st.write(f"**Priority:** {q.get('priority', 'medium')}")
-                        st.write(f"**Context:** {q.get('context', 'None provided')}")
-
-                        if q.get("related_roadmap_items"):
-                            st.write(f"**Affects:** {', '.join(q['related_roadmap_items'])}")
-
-                        # === NEW: Show synthesized answer for Q&A questions ===
-                        if has_synthesized_answer and q.get("synthesized_answer"):
-                            st.divider()
-                            render_qa_synthesized_answer(q["synthesized_answer"])
-
-                        # Show derivation evidence for derived questions
-                        if gen_type == "derived":
-                            derivation = q.get("derivation", {})
-                            evidence = derivation.get("evidence", [])
-
-                            if evidence:
-                                with st.expander(f"📊 Derivation Evidence ({len(evidence)} items)"):
-                                    for ev in evidence:
-                                        if "source_name" in ev:
-                                            st.markdown(f"**{ev.get('source_name')}** ({ev.get('lens', 'unknown')})")
-                                            st.caption(ev.get("content", "")[:200])
-                                        else:
-                                            st.json(ev)
+                # Already sorted by priority
+                sorted_qs = audience_qs
 
-                        st.write(f"**Created:** {q.get('created_at', 'Unknown')[:10]}")
-
-                        st.divider()
-
-                        # Source references
-                        render_question_source_references(q)
-
-                        st.divider()
-
-                        # Validation
-                        render_question_validation(q)
-
-                        st.divider()
+                # Only build widgets for one page of each audience's questions
+                total_pages = (len(sorted_qs) + PENDING_QUESTIONS_PER_PAGE - 1) // PENDING_QUESTIONS_PER_PAGE
+                page_start = 0
+                if total_pages > 1:
+                    page_num = st.number_input(
+                        f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1,
+                        key=f"pending_page_{audience}"
+                    )
+                    page_start = (page_num - 1) * PENDING_QUESTIONS_PER_PAGE
 
-                        # Quick actions
-                        if has_synthesized_answer:
-                            # For Q&A questions, show Re-Ask and Mark Obsolete buttons
-                            col1, col2 = st.columns(2)
-                            if col1.button("🔄 Re-Ask", key=f"reask_{q['id']}"):
-                                st.session_state.current_page = "💬 Ask Your Roadmap"
-                                # Store the question to pre-fill
-                                if 'ask_history' not in st.session_state:
-                                    st.session_state.ask_history = []
-                                st.rerun()
-                            if col2.button("Mark Obsolete", key=f"obs_{q['id']}"):
-                                q["status"] = "obsolete"
-                                save_questions(questions)
-                                st.success("Question marked obsolete")
-                                st.rerun()
-                        else:
-                            # For other questions, show Defer and Mark Obsolete buttons
-                            col1, col2 = st.columns(2)
-                            if col1.button("Defer", key=f"def_{q['id']}"):
-                                q["status"] = "deferred"
-                                save_questions(questions)
-                                st.success("Question deferred")
-                                st.rerun()
-                            if col2.button("Mark Obsolete", key=f"obs_{q['id']}"):
-                                q["status"] = "obsolete"
-                                save_questions(questions)
-                                st.success("Question marked obsolete")
-                                st.rerun()
+                for q in sorted_qs[page_start:page_start + PENDING_QUESTIONS_PER_PAGE]:
+                    render_pending_question_card(q, questions)
 
     # ========== TAB 2: ANSWER QUESTION ==========
     with tab2:
@@ -4544,19 +5781,18 @@ def page_open_questions():
         if not pending:
             st.info("No pending questions. Questions will be generated after roadmap synthesis.")
         else:
-            question_options = {f"{q['id']}: {q['question'][:60]}...": q['id'] for q in pending}
+            question_labels = [f"{q['id']}: {q['question'][:60]}..." for q in pending]
 
-            # Find the index of the pre-selected question
+            # Find the index of the pre-selected question (first match)
             default_index = 0
             if pre_selected_id:
-                for i, (label, q_id) in enumerate(question_options.items()):
-                    if q_id == pre_selected_id:
-                        default_index = i
-                        break
+                default_index = next((i for i, q in enumerate(pending) if q["id"] == pre_selected_id), 0)
 
+            # Options are positions in pending, so the selection needs no reverse lookup
             selected = st.selectbox(
                 "Select Question",
-                list(question_options.keys()),
+                range(len(pending)),
+                format_func=question_labels.__getitem__,
                 index=default_index
             )
 
@@ -4564,9 +5800,9 @@ def page_open_questions():
             if pre_selected_id and 'answering_question_id' in st.session_state:
                 del st.session_state.answering_question_id
 
-            if selected:
-                q_id = question_options[selected]
-                question = next(q for q in pending if q["id"] == q_id)
+            if selected is not None:
+                question = pending[selected]
+                q_id = question["id"]
 
                 st.markdown(f"**Question:** {question['question']}")
                 st.markdown(f"**Context:** {question.get('context', 'None')}")
@@ -4660,16 +5896,15 @@ def page_open_questions():
                         "notes": ""
                     }
                     answers.append(answer_record)
-                    save_answers(answers)
 
                     # Update question status
                     question["status"] = "answered"
                     question["answer"] = answer_text
                     question["answered_by"] = answered_by
                     question["answered_at"] = datetime.now().isoformat()
-                    save_questions(questions)
 
                     # Save decision if requested
+                    decision_record = None
                     if create_decision:
                         decision_record = {
                             "id": f"dec_{datetime.now().strftime('%Y%m%d%H%M%S')}",
@@ -4684,8 +5919,15 @@ def page_open_questions():
                             "created_at": datetime.now().isoformat()
                         }
                         decisions.append(decision_record)
-                        save_decisions(decisions)
 
+                    # Write all changed stores in one concurrent flush
+                    save_question_stores(
+                        questions=questions,
+                        answers=answers,
+                        decisions=decisions if decision_record else None,
+                    )
+
+                    if decision_record:
                         st.success(f"✅ Answer submitted and decision **{decision_record['id']}** created!")
 
                         # Prompt to sync graph
@@ -4723,9 +5965,13 @@ def page_open_questions():
         if not filtered_decisions:
             st.info("No decisions recorded yet. Answer questions to create decisions.")
         else:
+            # Question id -> question (reversed so the first question with an id wins)
+            questions_by_id = {q["id"]: q for q in reversed(questions)}
+            overrides_by_decision = get_decision_overrides_bulk([d["id"] for d in filtered_decisions])
+
             # Display decisions with overrides
             for dec in filtered_decisions:
-                status_icon = {"active": "✅", "superseded": "🔄", "revisiting": "🔍"}.get(dec.get("status", "active"), "?")
+                status_icon = DECISION_STATUS_ICONS.get(dec.get("status", "active"), "?")
                 created = dec.get("created_at", "Unknown")[:10]
                 decision_preview = dec['decision'][:60] + "..." if len(dec['decision']) > 60 else dec['decision']
 
@@ -4754,7 +6000,7 @@ def page_open_questions():
                     # Link to original question
                     question_id = dec.get("question_id")
                     if question_id:
-                        question = next((q for q in questions if q["id"] == question_id), None)
+                        question = questions_by_id.get(question_id)
                         if question:
                             st.caption(f"Resolves: {question['question'][:80]}...")
 
@@ -4765,14 +6011,15 @@ def page_open_questions():
                     st.divider()
 
                     # OVERRIDES SECTION - Show what this decision overrides
-                    overrides = get_decision_overrides(dec["id"])
+                    overrides = overrides_by_decision[dec["id"]]
 
                     if overrides:
                         with st.expander(f"⚡ Overrides {len(overrides)} source chunk(s)", expanded=False):
                             st.caption("This decision supersedes the following source content:")
 
                             for chunk in overrides:
-                                source_name = chunk.get("source_file", "Unknown").split("/")[-1] if chunk.get("source_file") else "Unknown"
+                                source_file = chunk.get("source_file")
+                                source_name = os.path.basename(source_file) if source_file else "Unknown"
                                 st.markdown(f"**{source_name}** ({chunk.get('lens', 'unknown')})")
                                 content = chunk.get("content", chunk.get("text", ""))
                                 st.text(content[:200] + ("..." if len(content) > 200 else ""))
@@ -4799,52 +6046,31 @@ def page_open_questions():
                                 save_decision_update(dec)
                                 st.rerun()
 
-            # Export button
+            # Export button; the Markdown is only generated when the download is clicked
             st.markdown("---")
-            if st.button("📥 Export Decision Log"):
-                md_lines = [
-                    "# Decision Log",
-                    f"\nGenerated: {datetime.now().isoformat()}",
-                    f"Total Decisions: {len(filtered_decisions)}\n",
-                    "---\n"
-                ]
-
-                for dec in filtered_decisions:
-                    status_emoji = {"active": "✅", "superseded": "🔄", "revisiting": "🔍"}.get(dec.get("status", "active"), "?")
-                    created = dec.get("created_at", "Unknown")[:10]
-
-                    md_lines.append(f"## {status_emoji} {dec['id']} ({created})\n")
-                    md_lines.append(f"**Decision:** {dec['decision']}\n")
-
-                    if dec.get("rationale"):
-                        md_lines.append(f"**Rationale:** {dec['rationale']}\n")
+            st.download_button(
+                "📥 Export Decision Log",
+                partial(format_decision_log, filtered_decisions),
+                file_name=f"decision_log_{datetime.now().strftime('%Y%m%d')}.md",
+                mime="text/markdown",
+                on_click="ignore"
+            )
 
-                    if dec.get("implications"):
-                        md_lines.append("**Implications:**")
-                        for imp in dec["implications"]:
-                            md_lines.append(f"- {imp}")
-                        md_lines.append("")
 
-                    md_lines.append(f"**Owner:** {dec.get('owner', 'Unassigned')}")
-                    md_lines.append(f"**Status:** {dec.get('status', 'active')}")
+# ========== PAGE: ARCHITECTURE ALIGNMENT ==========
 
-                    question_id = dec.get("question_id")
-                    if question_id:
-                        md_lines.append(f"**Question ID:** {question_id}")
+ALIGNMENT_ANALYSIS_FILE = OUTPUT_DIR / "architecture-alignment.json"
 
-                    md_lines.append("\n---\n")
 
-                md_content = "\n".join(md_lines)
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_alignment_analysis_cached(signature: tuple) -> Dict:
+    return load_alignment_analysis()
 
-                st.download_button(
-                    "Download Markdown",
-                    md_content,
-                    file_name=f"decision_log_{datetime.now().strftime('%Y%m%d')}.md",
-                    mime="text/markdown"
-                )
 
+def load_alignment_analysis_cached() -> Dict:
+    """load_alignment_analysis(), reparsed only when the analysis file changes (returns a copy)"""
+    return _load_alignment_analysis_cached(_file_signature(ALIGNMENT_ANALYSIS_FILE))
 
-# ========== PAGE: ARCHITECTURE ALIGNMENT ==========
 
 def page_architecture_alignment():
     st.title("🏗️ Architecture Alignment Analysis")
@@ -4865,7 +6091,7 @@ def page_architecture_alignment():
         st.subheader("Roadmap-Architecture Alignment")
 
         # Check for existing analysis
-        alignment_file = OUTPUT_DIR / "architecture-alignment.json"
+        alignment_file = ALIGNMENT_ANALYSIS_FILE
 
         col1, col2 = st.columns([3, 1])
         with col2:
@@ -4900,7 +6126,7 @@ def page_architecture_alignment():
                             st.rerun()
 
         if alignment_file.exists():
-            analysis = load_alignment_analysis()
+            analysis = load_alignment_analysis_cached()
 
             # Summary metrics
             assessments = analysis.get("assessments", [])
@@ -5008,7 +6234,6 @@ def page_architecture_alignment():
                     mime="text/markdown"
                 )
             with col2:
-                import json
                 st.download_button(
                     "📥 Export as JSON",
                     json.dumps(analysis, indent=2),
@@ -5064,7 +6289,6 @@ def page_architecture_alignment():
                 st.info("Documents will be loaded when you run the next analysis")
 
                 # Wait a moment before rerun
-                import time
                 time.sleep(1)
                 st.rerun()
 
@@ -5211,14 +6435,13 @@ def page_architecture_alignment():
 
         except Exception as e:
             st.error(f"❌ Error scanning documents: {e}")
-            import traceback
             st.code(traceback.format_exc())
 
     # ========== TAB 3: ENGINEERING QUESTIONS ==========
     with tab3:
         st.subheader("Engineering Questions from Architecture Analysis")
 
-        questions = load_questions()
+        questions = load_questions_cached()
         arch_questions = [q for q in questions if q.get("source") == "architecture_alignment"]
 
         if not arch_questions:
@@ -5229,7 +6452,7 @@ def page_architecture_alignment():
 
             st.write(f"**{len(pending)} pending** | {len(answered)} answered")
 
-            for q in sorted(pending, key=lambda x: {"critical": 0, "high": 1, "medium": 2, "low": 3}.get(x.get("priority", "low"), 4)):
+            for q in sorted(pending, key=lambda x: QUESTION_PRIORITY_ORDER.get(x.get("priority", "low"), 4)):
                 priority_icon = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}.get(q.get("priority", "medium"), "⚪")
 
                 with st.expander(f"{priority_icon} {q.get('question', 'N/A')[:80]}..."):
@@ -5249,6 +6472,26 @@ def page_architecture_alignment():
 
 # ========== PAGE: COMPETITIVE INTELLIGENCE ==========
 
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_competitor_developments_cached(signature: tuple) -> List[Dict]:
+    return load_competitor_developments()
+
+
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_analyst_assessments_cached(signature: tuple) -> List[Dict]:
+    return load_analyst_assessments()
+
+
+def load_competitor_developments_cached() -> List[Dict]:
+    """load_competitor_developments(), reparsed only when the file changes (returns a copy)"""
+    return _load_competitor_developments_cached(_file_signature(COMPETITOR_DEVELOPMENTS_FILE))
+
+
+def load_analyst_assessments_cached() -> List[Dict]:
+    """load_analyst_assessments(), reparsed only when the file changes (returns a copy)"""
+    return _load_analyst_assessments_cached(_file_signature(ANALYST_ASSESSMENTS_FILE))
+
+
 def page_competitive_intelligence():
     st.title("🎯 Competitive Intelligence")
 
@@ -5305,7 +6548,6 @@ def page_competitive_intelligence():
                         )
                         st.success(f"✓ Added development: {development['id']}")
                         st.info("Go to the 'Run Assessment' tab to analyze this development")
-                        import time
                         time.sleep(1)
                         st.rerun()
                     except Exception as e:
@@ -5314,11 +6556,12 @@ def page_competitive_intelligence():
         st.markdown("---")
         st.markdown("### Existing Developments")
 
-        developments = load_competitor_developments()
+        developments = load_competitor_developments_cached()
 
         if not developments:
             st.info("No competitor developments tracked yet. Add one above to get started.")
         else:
+            assessed_ids = {a['development_id'] for a in load_analyst_assessments_cached()}
             for dev in developments:
                 with st.expander(f"🔹 {dev['competitor']} — {dev['title']}", expanded=False):
                     col1, col2, col3 = st.columns(3)
@@ -5333,9 +6576,7 @@ def page_competitive_intelligence():
 
                     with col3:
                         # Check if assessed
-                        assessments = load_analyst_assessments()
-                        assessed = any(a['development_id'] == dev['id'] for a in assessments)
-                        if assessed:
+                        if dev['id'] in assessed_ids:
                             st.success("✓ Assessed")
                         else:
                             st.warning("⧗ Not yet assessed")
@@ -5349,7 +6590,7 @@ def page_competitive_intelligence():
 
         st.info("**Note:** Assessments are objective analyst research notes, not strategy recommendations.")
 
-        developments = load_competitor_developments()
+        developments = load_competitor_developments_cached()
 
         if not developments:
             st.warning("No competitor developments found. Add a development in the 'Manage Developments' tab first.")
@@ -5417,14 +6658,13 @@ def page_competitive_intelligence():
 
                                 except Exception as e:
                                     st.error(f"Assessment failed: {e}")
-                                    import traceback
                                     st.code(traceback.format_exc())
 
     # ========== TAB 3: VIEW ASSESSMENTS ==========
     with tab3:
         st.subheader("Analyst Assessments")
 
-        assessments = load_analyst_assessments()
+        assessments = load_analyst_assessments_cached()
 
         if not assessments:
             st.info("No assessments generated yet. Run an assessment in the 'Run Assessment' tab.")
@@ -5462,7 +6702,7 @@ def page_competitive_intelligence():
                     # Roadmap Gaps
                     st.markdown("### Roadmap Gaps")
                     for gap in analysis.get('roadmap_gaps', []):
-                        severity_color = {"critical": "🔴", "significant": "🟠", "moderate": "🟡", "minor": "🟢"}.get(gap['severity'], "⚪")
+                        severity_color = GAP_SEVERITY_ICONS.get(gap['severity'], "⚪")
                         st.write(f"{severity_color} **{gap['gap_description']}**")
                         st.write(f"- Severity: {gap['severity']}")
                         st.write(f"- Competitor has: {gap['competitor_capability']}")
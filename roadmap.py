@@ -6,9 +6,12 @@ Single-file CLI for synthesizing strategic documents into roadmaps
 
 import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 
 import typer
 from rich.console import Console
@@ -34,6 +37,8 @@ PROMPTS_DIR = Path("prompts")
 # Constants
 CHUNK_SIZE = 1024
 CHUNK_OVERLAP = 150
+EMBED_MODEL = "voyage-3-large"
+EMBED_BATCH_SIZE = 64  # Texts per Voyage request; 64 full chunks stay under the 120K-token request limit
 TOP_K = 20
 VALID_LENSES = [
     "your-voice",
@@ -1044,8 +1049,12 @@ class ContextGraph:
         # Find overlaps
         chunk_ids = list(chunk_terms.keys())
         for i, id1 in enumerate(chunk_ids):
+            terms1 = chunk_terms[id1]
             for id2 in chunk_ids[i+1:]:
-                overlap = chunk_terms[id1] & chunk_terms[id2]
+                # Most pairs share nothing; isdisjoint exits early without building a set
+                if terms1.isdisjoint(chunk_terms[id2]):
+                    continue
+                overlap = terms1 & chunk_terms[id2]
                 if len(overlap) >= 2:  # At least 2 shared terms
                     if not self.graph.has_edge(id1, id2):
                         self.graph.add_edge(
@@ -1059,8 +1068,9 @@ class ContextGraph:
         """Connect semantically similar chunks."""
         import numpy as np
 
-        # Convert to numpy for efficient computation
-        emb_matrix = np.array(embeddings)
+        # Convert to numpy for efficient computation (float32 halves the
+        # memory traffic of the similarity matmul versus float64)
+        emb_matrix = np.asarray(embeddings, dtype=np.float32)
 
         # Normalize for cosine similarity
         norms = np.linalg.norm(emb_matrix, axis=1, keepdims=True)
@@ -1101,9 +1111,12 @@ class ContextGraph:
 
         chunk_ids = list(chunk_times.keys())
         for i, id1 in enumerate(chunk_ids):
+            times1 = chunk_times[id1]
             for id2 in chunk_ids[i+1:]:
-                overlap = chunk_times[id1] & chunk_times[id2]
-                if overlap and not self.graph.has_edge(id1, id2):
+                if times1.isdisjoint(chunk_times[id2]):
+                    continue
+                overlap = times1 & chunk_times[id2]
+                if not self.graph.has_edge(id1, id2):
                     self.graph.add_edge(
                         id1, id2,
                         type="TEMPORAL_OVERLAP",
@@ -1149,15 +1162,34 @@ class ContextGraph:
 
 # ========== SECTION 5: EMBEDDINGS & INDEXING ==========
 
-def generate_embeddings(texts: List[str]) -> List[List[float]]:
-    """Generate embeddings using Voyage AI"""
-    validate_api_keys()
-    import ssl
+@lru_cache(maxsize=4)
+def _cached_voyage_client(client_class, api_key: str):
+    """Build a Voyage AI client once per (class, key) so its HTTP session is reused"""
     import urllib3
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    vo = voyageai.Client(api_key=VOYAGE_API_KEY)
-    result = vo.embed(texts=texts, model="voyage-3-large", input_type="document")
-    return result.embeddings
+    return client_class(api_key=api_key)
+
+
+def get_voyage_client():
+    """Get the shared Voyage AI client"""
+    return _cached_voyage_client(voyageai.Client, VOYAGE_API_KEY)
+
+
+def generate_embeddings(texts: List[str], batch_size: int = EMBED_BATCH_SIZE) -> List[List[float]]:
+    """Generate embeddings using Voyage AI, sending batch_size texts per request"""
+    validate_api_keys()
+    vo = get_voyage_client()
+    embeddings = []
+    for start in range(0, len(texts), batch_size):
+        result = vo.embed(texts=texts[start:start + batch_size], model=EMBED_MODEL, input_type="document")
+        embeddings.extend(result.embeddings)
+    return embeddings
+
+
+def embed_query(query: str) -> List[float]:
+    """Generate the search embedding for a single query"""
+    validate_api_keys()
+    return get_voyage_client().embed(texts=[query], model=EMBED_MODEL, input_type="query").embeddings[0]
 
 
 def init_db():
@@ -1166,20 +1198,56 @@ def init_db():
     return lancedb.connect(str(DATA_DIR))
 
 
+GRAPH_CHUNK_COLUMNS = ["id", "content", "lens", "source_file", "chunk_index", "token_count"]
+
+
+def load_chunks_with_embeddings(table):
+    """
+    Load chunk metadata and embeddings for graph building.
+
+    Returns (chunks, embeddings) where embeddings is a float32 matrix of
+    shape (n_chunks, dim) read straight from the Arrow vector column.
+    """
+    import numpy as np
+
+    data = table.search().select(GRAPH_CHUNK_COLUMNS + ["vector"]).limit(None).to_arrow()
+    chunks = data.select(GRAPH_CHUNK_COLUMNS).to_pylist()
+
+    if data.num_rows == 0:
+        return chunks, np.empty((0, 0), dtype=np.float32)
+
+    vectors = data["vector"].combine_chunks()
+    dim = vectors.type.list_size
+    embeddings = vectors.values.to_numpy(zero_copy_only=False).astype(np.float32, copy=False)
+    return chunks, embeddings.reshape(-1, dim)
+
+
 def index_chunks(chunks: List[Dict], source_file: str):
     """Store chunks in LanceDB"""
-    if not chunks:
+    index_chunk_batches([(chunks, source_file)])
+
+
+def index_chunk_batches(batches: List[Tuple[List[Dict], str]]):
+    """
+    Store chunks from several source files in LanceDB with one
+    generate_embeddings call (batched by EMBED_BATCH_SIZE) and a single
+    table write.
+
+    batches is a list of (chunks, source_file) pairs.
+    """
+    pairs = [(chunk, source_file) for chunks, source_file in batches for chunk in chunks]
+    if not pairs:
         return
 
     db = init_db()
 
     # Generate embeddings
-    texts = [c["content"] for c in chunks]
+    texts = [chunk["content"] for chunk, _ in pairs]
     embeddings = generate_embeddings(texts)
 
     # Prepare records
     records = []
-    for chunk, embedding in zip(chunks, embeddings):
+    for (chunk, source_file), embedding in zip(pairs, embeddings):
         records.append({
             "id": f"{source_file}_{chunk['chunk_index']}",
             "content": chunk["content"],
@@ -1202,8 +1270,12 @@ def index_chunks(chunks: List[Dict], source_file: str):
 
 # ========== SECTION 6: RETRIEVAL ==========
 
-def retrieve_chunks(query: str, top_k: int = TOP_K) -> List[Dict]:
-    """Semantic search over indexed chunks"""
+def retrieve_chunks(query: str, top_k: int = TOP_K, query_embedding: Optional[List[float]] = None) -> List[Dict]:
+    """
+    Semantic search over indexed chunks.
+
+    query_embedding, if given, is used instead of embedding query again.
+    """
     validate_api_keys()
     db = init_db()
 
@@ -1214,15 +1286,8 @@ def retrieve_chunks(query: str, top_k: int = TOP_K) -> List[Dict]:
         return []
 
     # Generate query embedding
-    import ssl
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    vo = voyageai.Client(api_key=VOYAGE_API_KEY)
-    query_embedding = vo.embed(
-        texts=[query],
-        model="voyage-3-large",
-        input_type="query"
-    ).embeddings[0]
+    if query_embedding is None:
+        query_embedding = embed_query(query)
 
     # Search
     results = table.search(query_embedding).limit(top_k).to_list()
@@ -1246,15 +1311,7 @@ def retrieve_balanced(query: str, chunks_per_lens: int = 8) -> List[Dict]:
         return []
 
     # Generate query embedding
-    import ssl
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    vo = voyageai.Client(api_key=VOYAGE_API_KEY)
-    query_embedding = vo.embed(
-        texts=[query],
-        model="voyage-3-large",
-        input_type="query"
-    ).embeddings[0]
+    query_embedding = embed_query(query)
 
     all_results = []
     for lens in VALID_LENSES:
@@ -1291,15 +1348,7 @@ def retrieve_with_graph_expansion(
         return []
 
     # Generate query embedding
-    import ssl
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    vo = voyageai.Client(api_key=VOYAGE_API_KEY)
-    query_embedding = vo.embed(
-        texts=[query],
-        model="voyage-3-large",
-        input_type="query"
-    ).embeddings[0]
+    query_embedding = embed_query(query)
 
     # Step 1: Initial vector search
     initial_results = table.search(query_embedding).limit(initial_limit).to_list()
@@ -1596,6 +1645,26 @@ def format_for_persona(persona: str, master_roadmap: Optional[str] = None) -> st
 
 # ========== SECTION 7.5: QUESTIONS & DECISIONS STORAGE ==========
 
+# Shared encoder for the question/answer/decision stores; encoding the whole
+# document in one call and writing it once is much faster than json.dump,
+# which builds a new encoder per call and writes the output piece by piece
+_STORE_ENCODER = json.JSONEncoder(indent=2)
+
+
+def _write_store(store_file: Path, data: Dict):
+    """Write a store document atomically (temp file in the same folder, then rename)."""
+    store_file.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per process and thread, so concurrent saves never share a temp file
+    temp_file = store_file.with_name(f"{store_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp_file, 'w') as f:
+            f.write(_STORE_ENCODER.encode(data))
+        os.replace(temp_file, store_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
 def load_questions() -> List[Dict]:
     """Load all questions from storage."""
     questions_file = DATA_DIR / "questions" / "questions.json"
@@ -1610,7 +1679,6 @@ def load_questions() -> List[Dict]:
 def save_questions(questions: List[Dict]):
     """Save questions to storage."""
     questions_file = DATA_DIR / "questions" / "questions.json"
-    questions_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Update metadata
     from collections import Counter
@@ -1627,8 +1695,7 @@ def save_questions(questions: List[Dict]):
         }
     }
 
-    with open(questions_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_store(questions_file, data)
 
 
 def load_answers() -> List[Dict]:
@@ -1645,7 +1712,6 @@ def load_answers() -> List[Dict]:
 def save_answers(answers: List[Dict]):
     """Save answers to storage."""
     answers_file = DATA_DIR / "questions" / "answers.json"
-    answers_file.parent.mkdir(parents=True, exist_ok=True)
 
     data = {
         "answers": answers,
@@ -1655,8 +1721,7 @@ def save_answers(answers: List[Dict]):
         }
     }
 
-    with open(answers_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_store(answers_file, data)
 
 
 def load_decisions() -> List[Dict]:
@@ -1673,7 +1738,6 @@ def load_decisions() -> List[Dict]:
 def save_decisions(decisions: List[Dict]):
     """Save decisions to storage."""
     decisions_file = DATA_DIR / "questions" / "decisions.json"
-    decisions_file.parent.mkdir(parents=True, exist_ok=True)
 
     # Update metadata
     from collections import Counter
@@ -1690,8 +1754,25 @@ def save_decisions(decisions: List[Dict]):
         }
     }
 
-    with open(decisions_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    _write_store(decisions_file, data)
+
+
+def save_question_stores(
+    questions: Optional[List[Dict]] = None,
+    answers: Optional[List[Dict]] = None,
+    decisions: Optional[List[Dict]] = None,
+):
+    """Save any of the question, answer and decision stores together, writing the files concurrently."""
+    saves = [
+        (save, records)
+        for save, records in ((save_questions, questions), (save_answers, answers), (save_decisions, decisions))
+        if records is not None
+    ]
+    with ThreadPoolExecutor(max_workers=len(saves) or 1) as executor:
+        futures = [executor.submit(save, records) for save, records in saves]
+    # Surface the first failure after every write has finished
+    for future in futures:
+        future.result()
 
 
 # ========== SECTION 7.6: ARCHITECTURE ALIGNMENT ==========
@@ -3530,20 +3611,7 @@ def ingest(
             table = db.open_table("roadmap_chunks")
 
             # Get all chunks and embeddings from store
-            all_data = table.to_pandas()
-            all_chunks = []
-            all_embeddings = []
-
-            for _, row in all_data.iterrows():
-                all_chunks.append({
-                    "id": row["id"],
-                    "content": row["content"],
-                    "lens": row["lens"],
-                    "source_file": row["source_file"],
-                    "chunk_index": row["chunk_index"],
-                    "token_count": row["token_count"],
-                })
-                all_embeddings.append(row["vector"])
+            all_chunks, all_embeddings = load_chunks_with_embeddings(table)
 
             # Build graph
             graph = ContextGraph()
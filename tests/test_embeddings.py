@@ -5,7 +5,10 @@ Unit tests for embedding and vector search functions in roadmap.py
 import pytest
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
-from roadmap import generate_embeddings, init_db, index_chunks, retrieve_chunks
+from roadmap import (
+    generate_embeddings, embed_query, init_db, index_chunks, index_chunk_batches, retrieve_chunks,
+    load_chunks_with_embeddings
+)
 
 
 class TestGenerateEmbeddings:
@@ -82,6 +85,32 @@ class TestGenerateEmbeddings:
 
         assert len(embeddings) == 1
 
+    @pytest.mark.unit
+    def test_client_reused_across_calls(self, mock_voyage_client, mock_env_vars):
+        """Test that repeated calls share one Voyage client."""
+        with patch("roadmap.voyageai.Client", return_value=mock_voyage_client) as client_class:
+            generate_embeddings(["First call."])
+            generate_embeddings(["Second call."])
+
+        client_class.assert_called_once()
+        assert mock_voyage_client.embed.call_count == 2
+
+    @pytest.mark.unit
+    def test_generate_in_batches(self, mock_env_vars):
+        """Test that texts are sent in batch_size requests, in order."""
+        texts = [f"Document {i}" for i in range(5)]
+
+        mock_client = Mock()
+        mock_client.embed.side_effect = lambda texts, **kwargs: Mock(embeddings=[[float(t.split()[1])] for t in texts])
+
+        with patch("roadmap.voyageai.Client", return_value=mock_client):
+            embeddings = generate_embeddings(texts, batch_size=2)
+
+        assert [call.kwargs["texts"] for call in mock_client.embed.call_args_list] == [
+            ["Document 0", "Document 1"], ["Document 2", "Document 3"], ["Document 4"]
+        ]
+        assert embeddings == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+
 
 class TestInitDb:
     """Tests for database initialization."""
@@ -111,6 +140,38 @@ class TestInitDb:
             mock_connect.assert_called_once()
 
 
+class TestLoadChunksWithEmbeddings:
+    """Tests for loading chunks and embeddings for graph building."""
+
+    @pytest.mark.unit
+    def test_returns_float32_matrix(self, temp_dir):
+        """Test that embeddings come back as a float32 matrix aligned with chunks."""
+        import lancedb
+
+        db = lancedb.connect(str(temp_dir / "db"))
+        records = [
+            {
+                "id": f"doc.md_{i}",
+                "content": f"Chunk {i}",
+                "vector": [float(i), 0.5, -1.0, 2.0],
+                "lens": "your-voice",
+                "source_file": "doc.md",
+                "chunk_index": i,
+                "token_count": 10,
+            }
+            for i in range(3)
+        ]
+        table = db.create_table("roadmap_chunks", data=records)
+
+        chunks, embeddings = load_chunks_with_embeddings(table)
+
+        assert [c["id"] for c in chunks] == ["doc.md_0", "doc.md_1", "doc.md_2"]
+        assert "vector" not in chunks[0]
+        assert embeddings.dtype == np.float32
+        assert embeddings.shape == (3, 4)
+        assert embeddings[2].tolist() == [2.0, 0.5, -1.0, 2.0]
+
+
 class TestIndexChunks:
     """Tests for chunk indexing."""
 
@@ -145,6 +206,25 @@ class TestIndexChunks:
                 # Verify add was called on table
                 mock_table.add.assert_called()
 
+    @pytest.mark.unit
+    def test_index_batches_single_embed_and_write(
+        self, mock_lancedb, sample_chunks, sample_embeddings, mock_env_vars
+    ):
+        """Test chunks from several files are embedded and added together."""
+        mock_table = Mock()
+        mock_lancedb.open_table.return_value = mock_table
+        batches = [(sample_chunks[:2], "a.md"), (sample_chunks[2:], "b.md")]
+
+        with patch("roadmap.init_db", return_value=mock_lancedb):
+            with patch("roadmap.generate_embeddings", return_value=sample_embeddings) as mock_embed:
+                index_chunk_batches(batches)
+
+        mock_embed.assert_called_once_with([c["content"] for c in sample_chunks])
+        mock_table.add.assert_called_once()
+        records = mock_table.add.call_args[0][0]
+        assert [r["source_file"] for r in records] == ["a.md", "a.md", "b.md"]
+        assert records[2]["id"] == f"b.md_{sample_chunks[2]['chunk_index']}"
+
     @pytest.mark.unit
     def test_index_empty_chunks(self, mock_lancedb, mock_env_vars):
         """Test indexing empty chunk list."""
@@ -294,3 +374,35 @@ class TestRetrieveChunks:
 
         # Chunks should have similarity or distance information
         assert all(isinstance(c, dict) for c in chunks)
+
+    @pytest.mark.unit
+    def test_retrieve_uses_given_query_embedding(self, mock_lancedb, mock_env_vars):
+        """Test that a precomputed query embedding is searched without embedding again."""
+        mock_table = Mock()
+        mock_table.search.return_value.limit.return_value.to_list.return_value = []
+        mock_lancedb.open_table.return_value = mock_table
+        mock_vo_client = Mock()
+        query_embedding = [0.2] * 1024
+
+        with patch("roadmap.init_db", return_value=mock_lancedb), patch("roadmap.validate_api_keys"):
+            with patch("roadmap.voyageai.Client", return_value=mock_vo_client):
+                retrieve_chunks("test query", top_k=5, query_embedding=query_embedding)
+
+        mock_table.search.assert_called_once_with(query_embedding)
+        mock_vo_client.embed.assert_not_called()
+
+
+class TestEmbedQuery:
+    """Tests for query embedding."""
+
+    @pytest.mark.unit
+    def test_embed_query_returns_vector(self, mock_env_vars, sample_embeddings):
+        """Test that a query is embedded as a search query."""
+        mock_client = Mock()
+        mock_client.embed.return_value.embeddings = [sample_embeddings[0]]
+
+        with patch("roadmap.voyageai.Client", return_value=mock_client), patch("roadmap.validate_api_keys"):
+            embedding = embed_query("What is the CPQ timeline?")
+
+        assert embedding == sample_embeddings[0]
+        assert mock_client.embed.call_args.kwargs["input_type"] == "query"
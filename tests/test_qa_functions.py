@@ -12,6 +12,7 @@ from roadmap import (
     save_questions,
     load_answers,
     save_answers,
+    save_question_stores,
     extract_engineering_questions_from_alignment,
     add_architecture_questions_to_system,
 )
@@ -232,6 +233,29 @@ class TestSaveAnswers:
         assert saved_data["metadata"]["total_answers"] == 0
 
 
+class TestSaveQuestionStores:
+    """Tests for save_question_stores function."""
+
+    @pytest.mark.unit
+    def test_saves_only_given_stores(self, temp_dir, monkeypatch):
+        """Test that only the stores passed in are written."""
+        monkeypatch.setattr("roadmap.DATA_DIR", temp_dir)
+
+        save_question_stores(
+            questions=[{"id": "q1", "question": "Test?", "status": "answered"}],
+            answers=[{"id": "ans1", "question_id": "q1", "answer": "Yes"}],
+        )
+
+        questions_dir = temp_dir / "questions"
+        saved_questions = json.loads((questions_dir / "questions.json").read_text())
+        saved_answers = json.loads((questions_dir / "answers.json").read_text())
+
+        assert saved_questions["metadata"]["total_answered"] == 1
+        assert saved_answers["answers"][0]["id"] == "ans1"
+        assert not (questions_dir / "decisions.json").exists()
+        assert not list(questions_dir.glob("*.tmp"))
+
+
 class TestExtractEngineeringQuestions:
     """Tests for extracting engineering questions from alignment analysis."""
 